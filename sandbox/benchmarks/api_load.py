@@ -0,0 +1,111 @@
+"""
+Local load test for the read API.
+
+Sends requests from concurrent clients against a running server (uvicorn api:app
+or the live routine), cycling through a set of paths, and reports throughput,
+latency percentiles, status codes and how many responses came from the cache.
+With --revalidate each client sends If-None-Match with the last ETag it saw,
+as an app polling for changes would.
+
+    python sandbox/benchmarks/api_load.py [--url http://127.0.0.1:8000]
+        [--requests 5000] [--concurrency 50] [--revalidate] [PATH ...]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+import httpx
+
+root = Path(__file__).resolve().parents[2]
+sys.path[:0] = [str(root / "src")]
+
+from common.resilience import percentile  # noqa: E402
+
+DEFAULT_PATHS = [
+    f"/games?date={date.today().isoformat()}",
+    "/players/660271/game-logs/batting",
+    "/players/660271/game-logs/pitching",
+    "/players/592450/seasons/2025",
+]
+
+
+async def client(
+    http: httpx.AsyncClient,
+    paths: list[str],
+    jobs: asyncio.Queue,
+    latencies: list[float],
+    statuses: Counter,
+    cache: Counter,
+    revalidate: bool,
+) -> None:
+    etags: dict[str, str] = {}
+
+    while True:
+        try:
+            i = jobs.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+        path = paths[i % len(paths)]
+        headers = {"If-None-Match": etags[path]} if revalidate and path in etags else {}
+
+        started = time.perf_counter()
+        response = await http.get(path, headers=headers)
+        latencies.append(time.perf_counter() - started)
+
+        statuses[response.status_code] += 1
+        cache[response.headers.get("x-cache", "none")] += 1
+        if "etag" in response.headers:
+            etags[path] = response.headers["etag"]
+
+
+async def run(args: argparse.Namespace) -> None:
+    paths = args.paths or DEFAULT_PATHS
+    jobs: asyncio.Queue = asyncio.Queue()
+    for i in range(args.requests):
+        jobs.put_nowait(i)
+
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    cache: Counter = Counter()
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.url, limits=limits, timeout=30.0
+    ) as http:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *[
+                client(http, paths, jobs, latencies, statuses, cache, args.revalidate)
+                for _ in range(args.concurrency)
+            ]
+        )
+        elapsed = time.perf_counter() - started
+
+    milliseconds = [latency * 1000 for latency in latencies]
+    print(
+        f"{len(latencies)} requests in {elapsed:.2f}s "
+        f"({len(latencies) / elapsed:.0f} req/s, {args.concurrency} clients)"
+    )
+    print(
+        f"latency p50 {percentile(milliseconds, 50):.1f} ms, "
+        f"p99 {percentile(milliseconds, 99):.1f} ms, "
+        f"max {max(milliseconds):.1f} ms"
+    )
+    print(f"status {dict(sorted(statuses.items()))}")
+    print(f"cache  {dict(cache)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--revalidate", action="store_true")
+    asyncio.run(run(parser.parse_args()))
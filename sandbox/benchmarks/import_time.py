@@ -0,0 +1,109 @@
+"""
+Cold-start budget for the ingest-mlb entry point.
+
+Imports main in fresh interpreters under python -X importtime, without
+DATABASE_URL, and exits non-zero if its cumulative import time goes over the
+budget or if any module that should only load inside a routine was imported.
+
+    python sandbox/benchmarks/import_time.py [--budget-ms 150] [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[2]
+entry_dir = root / "src" / "ingest-mlb"
+
+ENTRY_MODULE = "main"
+
+# Dependencies that routines load on demand; importing main must not pull them in
+DEFERRED_MODULES = [
+    "duckdb",
+    "flask",
+    "httpx",
+    "jsonpath_ng",
+    "numpy",
+    "pandas",
+    "pyarrow",
+    "pydantic",
+    "requests",
+    "sentry_sdk",
+    "sqlalchemy",
+]
+
+
+def measure() -> tuple[float, list[tuple[float, str]], list[str]]:
+    """Cumulative import time of the entry module, its slowest imports and leaks"""
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(root / "src"), str(entry_dir)]),
+    }
+    # The engine must not be built at import, so there is no database to point to
+    env.pop("DATABASE_URL", None)
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys, {ENTRY_MODULE}; "
+            f"print(*(m for m in {DEFERRED_MODULES!r} if m in sys.modules))",
+        ],
+        cwd=entry_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines read "import time: self [us] | cumulative | {indent}name", with a
+    # module's nested imports listed before it
+    nested: list[tuple[float, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        milliseconds = int(cumulative) / 1000
+
+        if name[1:].startswith(" "):
+            nested.append((milliseconds, name.strip()))
+        elif name.strip() == ENTRY_MODULE:
+            return (
+                milliseconds,
+                sorted(nested, reverse=True)[:10],
+                result.stdout.split(),
+            )
+        else:
+            nested = []
+
+    raise RuntimeError(f"{ENTRY_MODULE} missing from -X importtime output")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    total = statistics.median(run[0] for run in runs)
+    _, slowest, leaked = min(runs, key=lambda run: run[0])
+
+    print(f"import {ENTRY_MODULE}: {total:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for milliseconds, name in slowest:
+        print(f"    {milliseconds:8.1f} ms  {name}")
+
+    failures = []
+    if total > args.budget_ms:
+        failures.append(f"over budget by {total - args.budget_ms:.1f} ms")
+    if leaked:
+        failures.append(f"imported at startup: {', '.join(leaked)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,90 @@
+"""
+Benchmark CustomModel serialization against the original per-key walk.
+
+Checks that model_dump and dump_records produce exactly what the previous
+implementation did, then times each on a season-sized batch of game logs.
+
+    python sandbox/benchmarks/model_dump.py
+"""
+
+import sys
+import timeit
+from enum import Enum
+from pathlib import Path
+from uuid import UUID
+
+from pydantic import BaseModel
+
+root = Path(__file__).resolve().parents[2]
+sys.path[:0] = [str(root / "src"), str(root / "src" / "ingest-mlb")]
+
+from common.models import dump_records, dump_rows  # noqa: E402
+from models import BatterGameLog, PitcherGameLog  # noqa: E402
+
+ROWS = 50_000
+
+
+def legacy_model_dump(model: BaseModel) -> dict:
+    """CustomModel.model_dump before the fast path"""
+    data = BaseModel.model_dump(model)
+
+    for key, value in data.items():
+        if isinstance(value, list):
+            data[key] = ", ".join(
+                map(lambda x: x.value if isinstance(x, Enum) else str(x), value)
+            )
+        elif isinstance(value, Enum):
+            data[key] = value.value
+        elif isinstance(value, UUID):
+            data[key] = str(value)
+
+    return data
+
+
+def sample_logs(model: type, stats_key: str) -> list:
+    return [
+        model.model_validate(
+            {
+                "gamePk": 745000 + i // 20,
+                "gameDate": "2025-04-01",
+                "playerId": 600000 + i,
+                "teamId": 110,
+                "opponentTeamId": 111,
+                "isHome": bool(i % 2),
+                "position": {"code": "8", "name": "Outfielder", "type": "Outfielder"},
+                "stats": {
+                    stats_key: {
+                        "summary": "1-4 | K",
+                        "atBats": 4,
+                        "hits": i % 3,
+                        "inningsPitched": "6.0",
+                        "strikePercentage": ".640",
+                    }
+                },
+            }
+        )
+        for i in range(ROWS)
+    ]
+
+
+if __name__ == "__main__":
+    for model, stats_key in ((BatterGameLog, "batting"), (PitcherGameLog, "pitching")):
+        logs = sample_logs(model, stats_key)
+        columns = list(model.model_fields)
+
+        expected = [legacy_model_dump(log) for log in logs]
+        assert [log.model_dump() for log in logs] == expected
+        assert dump_records(logs) == expected
+        assert dump_rows(logs, columns) == [tuple(e.values()) for e in expected]
+
+        timings = {
+            "legacy model_dump": lambda: [legacy_model_dump(log) for log in logs],
+            "model_dump": lambda: [log.model_dump() for log in logs],
+            "dump_records": lambda: dump_records(logs),
+            "dump_rows": lambda: dump_rows(logs, columns),
+        }
+
+        print(f"{model.__name__} ({ROWS} rows, outputs identical)")
+        for name, func in timings.items():
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"    {name:<18} {seconds * 1000:8.1f} ms")
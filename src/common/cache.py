@@ -0,0 +1,149 @@
+"""
+In-process cache for rendered responses.
+
+Entries are evicted least-recently-used once the cache is full and expire after
+their TTL. Each entry carries tags naming the data it was built from, so a
+writer can drop exactly the entries its change affects. Concurrent misses for
+one key share a single load, so a burst of requests costs one query.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, Iterable
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    body: bytes
+    etag: str
+    tags: frozenset
+    expires_at: float
+
+
+def etag(body: bytes) -> str:
+    """Strong entity tag of a response body"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class ResponseCache:
+    """
+    Args:
+        maxsize: Entries kept before the least recently used are evicted
+        ttl: Default seconds an entry stays fresh, bounding staleness for
+             writes that are never announced through invalidate()
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._keys_by_tag: dict[Hashable, set[str]] = {}
+        self._loading: dict[str, asyncio.Future] = {}
+        # Bumped by every invalidation, so a load that overlapped one is served
+        # once but not stored
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        tags: Iterable[Hashable] = (),
+        ttl: float | None = None,
+    ) -> CacheEntry:
+        entry = CacheEntry(
+            body=body,
+            etag=etag(body),
+            tags=frozenset(tags),
+            expires_at=time.monotonic() + (self.ttl if ttl is None else ttl),
+        )
+
+        self._remove(key)
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+        return entry
+
+    def invalidate(self, tags: Iterable[Hashable]) -> int:
+        """Drop every entry carrying any of the tags and return how many"""
+        self._generation += 1
+        keys = set().union(*(self._keys_by_tag.get(tag, ()) for tag in tags))
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    async def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[bytes]],
+        tags: Iterable[Hashable] = (),
+        ttl: float | None = None,
+    ) -> tuple[CacheEntry, bool]:
+        """
+        Cached entry for key, loading and storing it on a miss.
+
+        Returns:
+            The entry and whether it was served without calling load
+        """
+        if (entry := self.get(key)) is not None:
+            self.hits += 1
+            return entry, True
+
+        task = self._loading.get(key)
+        if task is not None:
+            self.hits += 1
+            return await asyncio.shield(task), True
+
+        self.misses += 1
+        tags = frozenset(tags)
+
+        async def fill() -> CacheEntry:
+            generation = self._generation
+            body = await load()
+            if generation == self._generation:
+                return self.put(key, body, tags, ttl)
+            return CacheEntry(body, etag(body), tags, time.monotonic())
+
+        # The load runs as its own task, so a client that disconnects does not
+        # cancel it for the others waiting on the same key
+        task = asyncio.ensure_future(fill())
+        self._loading[key] = task
+        task.add_done_callback(lambda _: self._loading.pop(key, None))
+        return await asyncio.shield(task), False
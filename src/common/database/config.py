@@ -1,14 +1,21 @@
 import os
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
 from dotenv import load_dotenv
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from common.resilience import LatencyTracker
 
 env_path = Path(__file__).resolve().parents[3] / ".env"
 load_dotenv(dotenv_path=env_path)
@@ -21,13 +28,187 @@ def get_database_url() -> str:
     return database_url
 
 
-def create_async_db_engine(echo: bool = False) -> AsyncEngine:
+@dataclass(frozen=True)
+class EngineProfile:
+    """
+    How an engine connects and pools for one kind of workload.
+
+    Args:
+        echo: Log every SQL statement
+        pool_size: Connections kept open
+        max_overflow: Extra connections opened under load, closed when returned
+        pool_timeout: Seconds a checkout waits for a connection before failing
+        pool_recycle: Seconds after which a connection is replaced, -1 never
+        statement_cache_size: asyncpg prepared statements cached per connection
+        prepared_statement_cache_size: SQLAlchemy's own per-connection cache
+        unique_statement_names: Name prepared statements uniquely, so they
+                                never collide on a server connection another
+                                client prepared statements on
+        statement_timeout_ms: Server-side statement_timeout, 0 for none
+        server_settings: Further session settings sent on connect
+    """
+
+    echo: bool = False
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+    unique_statement_names: bool = False
+    statement_timeout_ms: int = 0
+    server_settings: dict[str, str] | None = field(default_factory=dict)
+
+    def connect_args(self, application_name: str) -> dict[str, Any]:
+        """asyncpg connect arguments for this profile"""
+        args: dict[str, Any] = {
+            "statement_cache_size": self.statement_cache_size,
+            "prepared_statement_cache_size": self.prepared_statement_cache_size,
+        }
+        if self.unique_statement_names:
+            args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
+        if self.server_settings is not None:
+            args["server_settings"] = {
+                "application_name": application_name,
+                "statement_timeout": str(self.statement_timeout_ms),
+                **self.server_settings,
+            }
+        return args
+
+
+PROFILES = {
+    # Local work: statements are logged and nothing is cut short
+    "dev": EngineProfile(echo=True, pool_size=5, max_overflow=5),
+    # Nightly ingestion and rebuilds: a wide pool, a large statement cache for
+    # the repeated upserts and room for long aggregate rebuilds
+    "batch": EngineProfile(
+        statement_cache_size=500,
+        prepared_statement_cache_size=500,
+        statement_timeout_ms=300_000,
+    ),
+    # Live polling and the read API: few connections, and a query that hangs
+    # fails fast instead of holding up the next poll
+    "live": EngineProfile(
+        pool_size=5,
+        max_overflow=5,
+        pool_timeout=5.0,
+        statement_cache_size=500,
+        prepared_statement_cache_size=500,
+        statement_timeout_ms=5_000,
+        server_settings={"idle_in_transaction_session_timeout": "30000"},
+    ),
+    # Supabase's transaction-mode pooler hands each transaction to any server
+    # connection, so prepared statements cannot be cached or reused, and
+    # startup settings are not kept; set statement_timeout on the role instead
+    "pooler": EngineProfile(
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=300,
+        statement_cache_size=0,
+        prepared_statement_cache_size=0,
+        unique_statement_names=True,
+        server_settings=None,
+    ),
+}
+
+DEFAULT_PROFILE = "batch"
+
+
+def get_profile(name: str | None = None) -> tuple[str, EngineProfile]:
+    """The DB_PROFILE environment variable's profile, else name's, else batch"""
+    name = os.getenv("DB_PROFILE") or name or DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise ValueError(
+            f"Unknown database profile {name}: expected one of {list(PROFILES)}"
+        )
+    return name, PROFILES[name]
+
+
+class PoolMetrics:
+    """Checkout wait times and utilisation of one engine's connection pool"""
+
+    def __init__(self, window: int = 1000) -> None:
+        self.waits = LatencyTracker(window=window, min_samples=1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.capacity = 0
+
+    def record_checkout(self, wait: float, in_use: int, capacity: int) -> None:
+        self.waits.record(wait)
+        self.checkouts += 1
+        self.in_use = in_use
+        self.peak_in_use = max(self.peak_in_use, in_use)
+        self.capacity = capacity
+
+    def snapshot(self) -> dict[str, float]:
+        """Counters and wait percentiles, e.g. for logs or a health endpoint"""
+        p50, p99 = self.waits.percentile(50), self.waits.percentile(99)
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "capacity": self.capacity,
+            "peak_utilisation": (
+                self.peak_in_use / self.capacity if self.capacity else 0.0
+            ),
+            "wait_p50_ms": (p50 or 0.0) * 1000,
+            "wait_p99_ms": (p99 or 0.0) * 1000,
+        }
+
+
+class MeteredPool(AsyncAdaptedQueuePool):
+    """Queue pool that reports every checkout to its class's PoolMetrics"""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.waits.record(time.perf_counter() - started)
+            self.metrics.timeouts += 1
+            raise
+
+        self.metrics.record_checkout(
+            time.perf_counter() - started,
+            self.checkedout(),
+            self.size() + max(self._max_overflow, 0),
+        )
+        return record
+
+
+def create_async_db_engine(
+    profile: str | None = None, echo: bool | None = None
+) -> AsyncEngine:
+    """
+    Engine configured by a named profile (see PROFILES and get_profile).
+
+    The pool's metrics are available as engine.pool.metrics.
+
+    Args:
+        profile: Profile used unless DB_PROFILE is set, batch by default
+        echo: Overrides the profile's echo
+    """
+    name, settings = get_profile(profile)
+
+    # A subclass per engine, so the metrics survive the pool being recreated
+    pool_class = type("MeteredPool", (MeteredPool,), {"metrics": PoolMetrics()})
+
     return create_async_engine(
         get_database_url(),
-        echo=echo,
+        echo=settings.echo if echo is None else echo,
+        poolclass=pool_class,
         pool_pre_ping=True,  # Verify connections before using
-        pool_size=10,  # Maximum number of connections in the pool
-        max_overflow=20,  # Maximum overflow connections
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        connect_args=settings.connect_args(f"phoenix-{name}"),
     )
 
 
@@ -39,6 +220,53 @@ def create_session_maker(engine) -> async_sessionmaker:
     )
 
 
+class LazySessionMaker:
+    """
+    Session factory whose engine is created when the first session is opened,
+    so defining one at module level needs neither DATABASE_URL nor a pool.
+
+    The profile may be changed until then, e.g. by a routine that knows its
+    workload; DB_PROFILE still takes precedence.
+    """
+
+    def __init__(self, profile: str | None = None, echo: bool | None = None) -> None:
+        self.profile = profile
+        self.echo = echo
+        self._session_maker: async_sessionmaker | None = None
+
+    @property
+    def session_maker(self) -> async_sessionmaker:
+        if self._session_maker is None:
+            self._session_maker = create_session_maker(
+                create_async_db_engine(self.profile, echo=self.echo)
+            )
+        return self._session_maker
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self.session_maker.kw["bind"]
+
+    @property
+    def metrics(self) -> PoolMetrics | None:
+        """Pool metrics, or None while no engine has been created"""
+        if self._session_maker is None:
+            return None
+        return self.engine.pool.metrics
+
+    def __call__(self, **kwargs) -> AsyncSession:
+        return self.session_maker(**kwargs)
+
+    async def dispose(self) -> None:
+        """
+        Close the pooled connections; the engine opens new ones when next used.
+
+        asyncpg connections belong to the event loop that opened them, so each
+        loop that used the engine must call this before it closes.
+        """
+        if self._session_maker is not None:
+            await self.engine.dispose()
+
+
 async def get_db(
     session_maker: async_sessionmaker,
 ) -> AsyncGenerator[AsyncSession, None]:
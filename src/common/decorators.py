@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 import logging
 import os
 import random
@@ -6,10 +8,6 @@ from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Protocol, Type, TypeVar, cast
 
-import httpx
-import requests
-import sentry_sdk
-
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -60,6 +58,8 @@ def routine(tag: str, verbose: bool = DEFAULT_VERBOSE) -> Callable[[F], F]:
                 if verbose:
                     raise exception
                 else:
+                    import sentry_sdk
+
                     sentry_sdk.capture_exception(exception)
 
             finally:
@@ -76,27 +76,35 @@ def retry(
     factor: float = 2.0,
     max_delay: float = 60.0,
     jitter: bool = True,
-    exceptions: tuple[Type[Exception], ...] = (
-        requests.exceptions.RequestException,
-        httpx.RequestError,
-        httpx.HTTPStatusError,
-        ConnectionError,
-        TimeoutError,
-    ),
+    exceptions: tuple[Type[Exception], ...] | None = None,
     respect_retry_after: bool = True,
     on_retry: Callable[[Exception, int], None] | None = None,
     calls_per_second: float | None = None,
     burst_size: int | None = None,
 ) -> Callable[[F], F]:
+    # Imported here so only modules that retry HTTP calls load the clients
+    import httpx
+    import requests
+
+    if exceptions is None:
+        exceptions = (
+            requests.exceptions.RequestException,
+            httpx.RequestError,
+            httpx.HTTPStatusError,
+            ConnectionError,
+            TimeoutError,
+        )
+
     if calls_per_second is not None and burst_size is None:
         burst_size = int(calls_per_second)
 
     last_called = [0.0] if calls_per_second else None
     available_tokens = [float(burst_size)] if burst_size else None
 
-    def decorator(func: F) -> F:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
+    def throttle() -> float:
+        """Take a call from the token bucket; seconds to sleep before the call"""
+        sleep_time = 0.0
+        if calls_per_second:
             current_time = time.time()
             time_passed = current_time - last_called[0]
 
@@ -109,123 +117,163 @@ def retry(
             if available_tokens[0] < 1:
                 sleep_time = (1 - available_tokens[0]) / calls_per_second
                 logging.debug(f"Rate limit reached, sleeping for {sleep_time:.3f}s")
-                time.sleep(sleep_time)
                 available_tokens[0] = 1
 
             available_tokens[0] -= 1
             last_called[0] = time.time()
 
-            last_exception = None
+        return sleep_time
 
-            for attempt in range(1, attempts + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
+    def backoff(e: Exception, attempt: int, name: str) -> float:
+        """Seconds to wait before the next attempt after e; raises if e is final"""
+        delay = base_delay
 
-                    if attempt == attempts:
-                        break
-
-                    delay = base_delay
-
-                    if isinstance(e, requests.exceptions.HTTPError):
-                        if e.response.status_code == 429:
-                            if (
-                                respect_retry_after
-                                and "Retry-After" in e.response.headers
-                            ):
-                                try:
-                                    delay = float(e.response.headers["Retry-After"])
-                                except (ValueError, TypeError):
-                                    delay = base_delay * (3 ** (attempt - 1))
-                            else:
-                                delay = base_delay * (3 ** (attempt - 1))
-                        elif e.response.status_code >= 500:
-                            delay = base_delay * (factor ** (attempt - 1))
-
-                        elif e.response.status_code == 403:
-                            raise
+        if isinstance(e, requests.exceptions.HTTPError):
+            if e.response.status_code == 429:
+                if respect_retry_after and "Retry-After" in e.response.headers:
+                    try:
+                        delay = float(e.response.headers["Retry-After"])
+                    except (ValueError, TypeError):
+                        delay = base_delay * (3 ** (attempt - 1))
+                else:
+                    delay = base_delay * (3 ** (attempt - 1))
+            elif e.response.status_code >= 500:
+                delay = base_delay * (factor ** (attempt - 1))
+
+            elif e.response.status_code == 403:
+                raise e
+
+            else:
+                delay = base_delay * attempt
+
+        elif isinstance(e, requests.exceptions.Timeout):
+            delay = base_delay * attempt
+
+        elif isinstance(e, (requests.exceptions.ConnectionError, httpx.HTTPStatusError, httpx.ConnectError)):
+            delay = base_delay * (factor ** (attempt - 1))
+
+        else:
+            response = getattr(e, "response", None)
+            if response is not None and hasattr(response, "status_code"):
+                exc_with_response = cast(ExceptionWithResponse, e)
+
+                if exc_with_response.response.status_code == 429:
+                    if respect_retry_after:
+                        retry_after = exc_with_response.response.headers.get(
+                            "Retry-After"
+                        )
+                        if retry_after:
+                            try:
+                                delay = float(retry_after)
+                            except (ValueError, TypeError):
+                                delay = base_delay * (factor**attempt)
 
                         else:
-                            delay = base_delay * attempt
+                            delay = base_delay * (factor**attempt)
 
-                    elif isinstance(e, requests.exceptions.Timeout):
-                        delay = base_delay * attempt
+                    else:
+                        delay = base_delay * (factor**attempt)
 
-                    elif isinstance(e, (requests.exceptions.ConnectionError, httpx.HTTPStatusError, httpx.ConnectError)):
-                        delay = base_delay * (factor ** (attempt - 1))
+                elif exc_with_response.response.status_code >= 500:
+                    delay = base_delay * (factor ** (attempt - 1))
 
-                    else:
-                        response = getattr(e, "response", None)
-                        if response is not None and hasattr(response, "status_code"):
-                            exc_with_response = cast(ExceptionWithResponse, e)
-
-                            if exc_with_response.response.status_code == 429:
-                                if respect_retry_after:
-                                    retry_after = (
-                                        exc_with_response.response.headers.get(
-                                            "Retry-After"
-                                        )
-                                    )
-                                    if retry_after:
-                                        try:
-                                            delay = float(retry_after)
-                                        except (ValueError, TypeError):
-                                            delay = base_delay * (factor**attempt)
-
-                                    else:
-                                        delay = base_delay * (factor**attempt)
-
-                                else:
-                                    delay = base_delay * (factor**attempt)
-
-                            elif exc_with_response.response.status_code >= 500:
-                                delay = base_delay * (factor ** (attempt - 1))
-
-                            else:
-                                delay = base_delay * (factor**attempt)
+                else:
+                    delay = base_delay * (factor**attempt)
 
-                        else:
-                            delay = base_delay * (factor ** (attempt - 1))
+            else:
+                delay = base_delay * (factor ** (attempt - 1))
 
-                    delay = min(delay, max_delay)
+        delay = min(delay, max_delay)
 
-                    if jitter:
-                        delay += random.uniform(0, base_delay)
+        if jitter:
+            delay += random.uniform(0, base_delay)
 
-                    error_msg = str(e)
-                    if hasattr(e, "response"):
-                        exc_with_response = cast(ExceptionWithResponse, e)
-                        if hasattr(exc_with_response.response, "status_code"):
-                            error_msg = f"HTTP {exc_with_response.response.status_code}: {error_msg}"
+        error_msg = str(e)
+        if hasattr(e, "response"):
+            exc_with_response = cast(ExceptionWithResponse, e)
+            if hasattr(exc_with_response.response, "status_code"):
+                error_msg = f"HTTP {exc_with_response.response.status_code}: {error_msg}"
 
-                    logging.warning(
-                        f"Attempt {attempt}/{attempts} failed for {func.__name__}: "
-                        f"{type(e).__name__}: {error_msg}. "
-                        f"Retrying in {delay:.1f}s..."
-                    )
+        logging.warning(
+            f"Attempt {attempt}/{attempts} failed for {name}: "
+            f"{type(e).__name__}: {error_msg}. "
+            f"Retrying in {delay:.1f}s..."
+        )
+
+        if on_retry:
+            on_retry(e, attempt)
+
+        return delay
+
+    def exhausted(last_exception: Exception | None, name: str) -> Exception:
+        if last_exception:
+            logging.error(
+                f"Retry decorator exhausted all {attempts} attempts for {name}"
+            )
+            return last_exception
+
+        return RuntimeError(
+            f"Retry decorator exhausted all attempts without capturing an exception in {name}"
+        )
 
-                    if on_retry:
-                        on_retry(e, attempt)
+    def non_retryable(e: Exception, name: str) -> None:
+        logging.error(
+            f"Non-retryable exception in {name}: "
+            f"{type(e).__name__}: {str(e)}"
+        )
 
-                    time.sleep(delay)
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if sleep_time := throttle():
+                    await asyncio.sleep(sleep_time)
+
+                last_exception = None
+
+                for attempt in range(1, attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        last_exception = e
+
+                        if attempt == attempts:
+                            break
+
+                        await asyncio.sleep(backoff(e, attempt, func.__name__))
+
+                    except Exception as e:
+                        non_retryable(e, func.__name__)
+                        raise
+
+                raise exhausted(last_exception, func.__name__)
+
+            return cast(F, async_wrapper)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if sleep_time := throttle():
+                time.sleep(sleep_time)
+
+            last_exception = None
+
+            for attempt in range(1, attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    last_exception = e
+
+                    if attempt == attempts:
+                        break
+
+                    time.sleep(backoff(e, attempt, func.__name__))
 
                 except Exception as e:
-                    logging.error(
-                        f"Non-retryable exception in {func.__name__}: "
-                        f"{type(e).__name__}: {str(e)}"
-                    )
+                    non_retryable(e, func.__name__)
                     raise
 
-            if last_exception:
-                logging.error(
-                    f"Retry decorator exhausted all {attempts} attempts for {func.__name__}"
-                )
-                raise last_exception
-
-            raise RuntimeError(
-                f"Retry decorator exhausted all attempts without capturing an exception in {func.__name__}"
-            )
+            raise exhausted(last_exception, func.__name__)
 
         return cast(F, wrapper)
 
@@ -1,5 +1,10 @@
+from datetime import date, datetime, time
+from decimal import Decimal
 from enum import Enum
-from typing import Any
+from functools import cache
+from operator import itemgetter
+from types import NoneType, UnionType
+from typing import Any, List, Sequence, Union, get_args, get_origin
 from uuid import UUID
 
 from pydantic import (
@@ -7,6 +12,53 @@ from pydantic import (
     ConfigDict,
 )
 
+# Values of these types are stored on the model exactly as model_dump returns them
+PASSTHROUGH_TYPES = (bool, int, float, str, NoneType, date, datetime, time, Decimal)
+
+
+def _convert(value: Any) -> Any:
+    if isinstance(value, list):
+        return ", ".join(
+            map(lambda x: x.value if isinstance(x, Enum) else str(x), value)
+        )
+    elif isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _is_passthrough(annotation: Any) -> bool:
+    if get_origin(annotation) in (Union, UnionType):
+        return all(_is_passthrough(arg) for arg in get_args(annotation))
+    return (
+        isinstance(annotation, type)
+        and issubclass(annotation, PASSTHROUGH_TYPES)
+        and not issubclass(annotation, Enum)
+    )
+
+
+def _is_nested(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_is_nested(arg) for arg in get_args(annotation))
+
+
+@cache
+def _dump_plan(model: type["CustomModel"]) -> tuple[bool, tuple[str, ...]]:
+    """
+    Whether a model can be dumped straight from its attributes, and which fields
+    still need list/Enum/UUID conversion when it can.
+    """
+    fields = model.model_fields
+    flat = not model.model_computed_fields and not any(
+        _is_nested(field.annotation) for field in fields.values()
+    )
+    converted = tuple(
+        name for name, field in fields.items() if not _is_passthrough(field.annotation)
+    )
+    return flat, converted
+
 
 class CustomModel(BaseModel):
     model_config = ConfigDict(
@@ -19,16 +71,66 @@ class CustomModel(BaseModel):
     )
 
     def model_dump(self, *args, **kwargs) -> dict[str, Any]:
+        flat, converted = _dump_plan(type(self))
+
+        # Plain dumps of flat models skip the serializer and the per-key walk
+        if flat and not args and not kwargs:
+            data = dict(self.__dict__)
+            for key in converted:
+                data[key] = _convert(data[key])
+            return data
+
         data = super().model_dump(*args, **kwargs)
 
         for key, value in data.items():
-            if isinstance(value, list):
-                data[key] = ", ".join(
-                    map(lambda x: x.value if isinstance(x, Enum) else str(x), value)
-                )
-            elif isinstance(value, Enum):
-                data[key] = value.value
-            elif isinstance(value, UUID):
-                data[key] = str(value)
+            data[key] = _convert(value)
 
         return data
+
+
+def dump_rows(
+    models: Sequence[CustomModel], columns: Sequence[str] | None = None
+) -> List[tuple[Any, ...]]:
+    """
+    Dump a homogeneous list of models to tuples in column order (all fields by
+    default), e.g. for COPY or executemany.
+    """
+    if not models:
+        return []
+
+    model = type(models[0])
+    flat, converted = _dump_plan(model)
+    columns = tuple(columns or model.model_fields)
+
+    if not flat:
+        return [
+            tuple(record[column] for column in columns)
+            for record in (m.model_dump() for m in models)
+        ]
+
+    getter = itemgetter(*columns)
+    rows = [getter(m.__dict__) for m in models]
+    if len(columns) == 1:
+        rows = [(row,) for row in rows]
+
+    positions = [i for i, column in enumerate(columns) if column in converted]
+    if not positions:
+        return rows
+
+    converted_rows = []
+    for row in rows:
+        row = list(row)
+        for i in positions:
+            row[i] = _convert(row[i])
+        converted_rows.append(tuple(row))
+    return converted_rows
+
+
+def dump_records(
+    models: Sequence[CustomModel], columns: Sequence[str] | None = None
+) -> List[dict[str, Any]]:
+    """Dump a homogeneous list of models to dicts keyed in column order"""
+    if columns is None:
+        return [model.model_dump() for model in models]
+
+    return [dict(zip(columns, row)) for row in dump_rows(models, columns)]
@@ -0,0 +1,250 @@
+"""
+Adaptive request rate limiting shared by every process on a host.
+
+The token bucket lives in a small SQLite database, so concurrent backfills,
+the nightly batch and live polling all draw from one budget instead of each
+assuming it has the API to itself. The bucket's rate adapts AIMD-style: it
+grows additively while requests succeed quickly and is cut multiplicatively
+on 429s, 5xxs and slow responses, with Retry-After pausing everyone.
+
+Lower-priority traffic may only take tokens above a reserve, so live polling
+always finds capacity that backfills cannot drain.
+"""
+
+import asyncio
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from pathlib import Path
+from typing import Iterator, Mapping
+
+
+class Priority(IntEnum):
+    LIVE = 0
+    BATCH = 1
+    BACKFILL = 2
+
+
+# Share of the burst each priority must leave in the bucket
+PRIORITY_RESERVES = {
+    Priority.LIVE: 0.0,
+    Priority.BATCH: 0.3,
+    Priority.BACKFILL: 0.6,
+}
+
+DEFAULT_DB_NAME = "phoenix-ratelimit.sqlite3"
+
+# Rate cuts are applied at most once per interval, so a burst of 429s caused by
+# one overshoot only halves the rate once
+DECREASE_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    rate REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    blocked_until REAL NOT NULL DEFAULT 0,
+    decreased_at REAL NOT NULL DEFAULT 0
+)
+"""
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Token bucket shared through SQLite by every limiter with the same name.
+
+    Args:
+        name: Bucket name; limiters with the same name and path share a budget
+        path: SQLite file holding the buckets, in the temp directory by default
+        initial_rate: Requests per second before any feedback
+        min_rate: Floor the rate is never cut below
+        max_rate: Ceiling the rate never grows past
+        burst: Bucket capacity
+        additive_increase: Requests per second gained per second of success
+        decrease_factor: Rate multiplier on a 429 or 503
+        slow_decrease_factor: Rate multiplier on other 5xxs and slow responses
+        latency_target: Seconds above which a response counts as slow
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: str | Path | None = None,
+        initial_rate: float = 10.0,
+        min_rate: float = 1.0,
+        max_rate: float = 25.0,
+        burst: float = 10.0,
+        additive_increase: float = 0.5,
+        decrease_factor: float = 0.5,
+        slow_decrease_factor: float = 0.8,
+        latency_target: float = 2.0,
+    ) -> None:
+        self.name = name
+        self.path = Path(path or Path(tempfile.gettempdir()) / DEFAULT_DB_NAME)
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.slow_decrease_factor = slow_decrease_factor
+        self.latency_target = latency_target
+        self._connection: sqlite3.Connection | None = None
+        # The connection is shared by the worker threads bucket updates run on
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, name: str, **kwargs) -> "RateLimiter":
+        """Limiter whose bucket file is RATE_LIMIT_DB, if set"""
+        return cls(name, os.getenv("RATE_LIMIT_DB"), **kwargs)
+
+    @contextmanager
+    def _bucket(self) -> Iterator[tuple[dict[str, float], float]]:
+        """
+        The bucket row, refilled to now, under an exclusive write lock.
+
+        Waiting for the lock blocks, so event loops reach it through
+        asyncio.to_thread.
+        """
+        with self._lock:
+            if self._connection is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._connection = sqlite3.connect(
+                    self.path,
+                    timeout=5.0,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                self._connection.row_factory = sqlite3.Row
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute(SCHEMA)
+
+            db = self._connection
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = db.execute(
+                    "SELECT * FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                if row is None:
+                    bucket = {
+                        "tokens": self.burst,
+                        "rate": self.initial_rate,
+                        "updated_at": now,
+                        "blocked_until": 0.0,
+                        "decreased_at": 0.0,
+                    }
+                else:
+                    bucket = dict(row)
+                    elapsed = max(0.0, now - bucket["updated_at"])
+                    bucket["tokens"] = min(
+                        self.burst, bucket["tokens"] + elapsed * bucket["rate"]
+                    )
+                    bucket["updated_at"] = now
+
+                yield bucket, now
+
+                db.execute(
+                    "INSERT OR REPLACE INTO buckets "
+                    "(name, tokens, rate, updated_at, blocked_until, decreased_at) "
+                    "VALUES (:name, :tokens, :rate, :updated_at, :blocked_until, :decreased_at)",
+                    {"name": self.name, **bucket},
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+    def _take(self, priority: Priority) -> float:
+        """Take a token if one is available to this priority, else seconds to wait"""
+        with self._bucket() as (bucket, now):
+            if bucket["blocked_until"] > now:
+                return bucket["blocked_until"] - now
+
+            reserve = PRIORITY_RESERVES[priority] * self.burst
+            if bucket["tokens"] - 1 >= reserve:
+                bucket["tokens"] -= 1
+                return 0.0
+
+            return (reserve + 1 - bucket["tokens"]) / bucket["rate"]
+
+    async def acquire(self, priority: Priority = Priority.BATCH) -> None:
+        """Wait until a request of this priority may be sent"""
+        while (wait := await asyncio.to_thread(self._take, priority)) > 0:
+            # Jitter keeps waiting processes from retrying in lockstep
+            await asyncio.sleep(wait * random.uniform(1.0, 1.2))
+
+    async def feedback(
+        self, status_code: int, latency: float, retry_after: float | None = None
+    ) -> None:
+        """
+        Adapt the shared rate to a response.
+
+        Args:
+            status_code: HTTP status of the response
+            latency: Seconds the request took
+            retry_after: Seconds the server asked clients to wait, if any
+        """
+        await asyncio.to_thread(self._adapt, status_code, latency, retry_after)
+
+    def _adapt(
+        self, status_code: int, latency: float, retry_after: float | None
+    ) -> None:
+        with self._bucket() as (bucket, now):
+            throttled = status_code in (429, 503)
+            degraded = status_code >= 500 or latency > self.latency_target
+
+            if retry_after:
+                bucket["blocked_until"] = max(
+                    bucket["blocked_until"], now + retry_after
+                )
+
+            if throttled or degraded:
+                if now - bucket["decreased_at"] >= DECREASE_INTERVAL:
+                    factor = (
+                        self.decrease_factor if throttled else self.slow_decrease_factor
+                    )
+                    bucket["rate"] = max(self.min_rate, bucket["rate"] * factor)
+                    bucket["decreased_at"] = now
+            else:
+                # +additive_increase per second while requests keep succeeding
+                bucket["rate"] = min(
+                    self.max_rate,
+                    bucket["rate"] + self.additive_increase / bucket["rate"],
+                )
+
+    async def feedback_from_headers(
+        self, status_code: int, latency: float, headers: Mapping[str, str]
+    ) -> None:
+        """feedback() with Retry-After read from response headers"""
+        await self.feedback(
+            status_code, latency, parse_retry_after(headers.get("Retry-After"))
+        )
+
+    def state(self) -> dict[str, float]:
+        """Current shared bucket, for logging and diagnostics"""
+        with self._bucket() as (bucket, _):
+            return dict(bucket)
@@ -0,0 +1,178 @@
+"""
+Tail latency and failure handling for upstream HTTP calls.
+
+LatencyTracker keeps a window of recent latencies per endpoint, hedged() sends
+a duplicate request once the first has been slower than a chosen percentile,
+and CircuitBreaker stops calling an endpoint that keeps failing until a trial
+request succeeds again.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from enum import Enum
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+def percentile(values: Iterable[float], q: float) -> float | None:
+    """Nearest-rank q-th percentile (0-100), or None without values"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 500, min_samples: int = 20) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """Recent q-th percentile, or None until enough requests were seen"""
+        if len(self.samples) < self.min_samples:
+            return None
+        return percentile(self.samples, q)
+
+
+async def hedged(
+    send: Callable[[], Awaitable[T]],
+    delay: float | None,
+    admit: Callable[[], Awaitable[None]] | None = None,
+) -> T:
+    """
+    Await send(), starting a second send() if the first is still pending after
+    delay seconds, and return whichever succeeds first.
+
+    The loser is cancelled. A failure only surfaces once both attempts failed;
+    without a delay this is just await send().
+
+    Args:
+        send: Starts one attempt
+        delay: Seconds to wait before hedging, or None to never hedge
+        admit: Awaited before the duplicate is sent, e.g. to take a rate
+               limit token, while the first attempt keeps running
+    """
+    if delay is None:
+        return await send()
+
+    async def duplicate() -> T:
+        if admit is not None:
+            await admit()
+        return await send()
+
+    first = asyncio.ensure_future(send())
+    pending = {first}
+    error: BaseException | None = None
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if not done:
+            pending.add(asyncio.ensure_future(duplicate()))
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        # Also reached when the caller is cancelled while the first attempt runs
+        for task in pending:
+            task.cancel()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit is open"""
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures. While open every call
+    fails fast; after reset_timeout one critical call is let through as a
+    trial, and its outcome closes or re-opens the circuit. Non-critical calls
+    are shed until the circuit is closed again.
+
+    A trial that reports neither outcome within trial_timeout, e.g. because it
+    was cancelled or failed with an error that is not the endpoint's fault, is
+    given up on and the next critical call becomes the trial.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        trial_timeout: float | None = None,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.trial_timeout = reset_timeout if trial_timeout is None else trial_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_pending = False
+        self._trial_started = 0.0
+
+    def check(self, critical: bool = True) -> None:
+        """Raise CircuitOpenError unless a call may go ahead now"""
+        if self.state is CircuitState.CLOSED:
+            return
+
+        now = time.monotonic()
+        if (
+            self.state is CircuitState.OPEN
+            and now - self.opened_at >= self.reset_timeout
+        ):
+            self.state = CircuitState.HALF_OPEN
+            self._trial_pending = False
+
+        if self._trial_pending and now - self._trial_started >= self.trial_timeout:
+            logging.warning(f"{self.name} circuit trial gave no outcome, retrying it")
+            self._trial_pending = False
+
+        if (
+            self.state is CircuitState.HALF_OPEN
+            and critical
+            and not self._trial_pending
+        ):
+            self._trial_pending = True
+            self._trial_started = now
+            return
+
+        raise CircuitOpenError(f"{self.name} circuit is {self.state.value}")
+
+    def record_success(self) -> None:
+        if self.state is not CircuitState.CLOSED:
+            logging.info(f"{self.name} circuit closed")
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._trial_pending = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state is CircuitState.HALF_OPEN or (
+            self.state is CircuitState.CLOSED
+            and self.failures >= self.failure_threshold
+        ):
+            logging.warning(
+                f"{self.name} circuit opened after {self.failures} failures"
+            )
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+            self._trial_pending = False
@@ -1,8 +1,10 @@
+import sys
 import warnings
 from argparse import Namespace
-from typing import Any, Callable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
-from flask import Response, jsonify
+if TYPE_CHECKING:
+    from flask import Response
 
 
 def run_flags(
@@ -11,7 +13,7 @@ def run_flags(
     flags: Namespace | None = None,
     suffixes: tuple[str, ...] = ("scatch",),
     suffix_mode: Literal["only"] | Literal["exclude"] = "exclude",
-) -> tuple[Response | None, int]:
+) -> tuple["Response | None", int]:
     warnings.filterwarnings("ignore")
 
     if flags is None or all(not getattr(flags, flag) for flag in routine_map):
@@ -26,6 +28,12 @@ def run_flags(
             if getattr(flags, flag):
                 routine(*args)
 
+    # Without flask loaded there is no request to answer, e.g. from the CLI
+    if "flask" not in sys.modules:
+        return None, 200
+
+    from flask import jsonify
+
     try:
         return jsonify({"Message": "OK"}), 200
     except RuntimeError:
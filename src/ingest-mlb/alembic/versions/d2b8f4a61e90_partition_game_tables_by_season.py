@@ -0,0 +1,150 @@
+"""partition game tables by season
+
+Revision ID: d2b8f4a61e90
+Revises: c71d4e08a5b3
+Create Date: 2026-10-19 15:02:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b8f4a61e90'
+down_revision: Union[str, Sequence[str], None] = 'c71d4e08a5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Partitioned tables and their primary keys, without season
+TABLES = {
+    'team_schedules': ['game_id'],
+    'game_information': ['game_id'],
+    'batter_game_logs': ['game_id', 'player_id'],
+    'pitcher_game_logs': ['game_id', 'player_id'],
+}
+
+# Indexes replaced by the BRIN index on game_date
+REPLACED_INDEXES = {
+    'team_schedules': ['ix_team_schedules_game_date', 'ix_team_schedules_game_id'],
+    'game_information': ['ix_game_information_game_date'],
+}
+
+GAME_LOG_TABLES = ['batter_game_logs', 'pitcher_game_logs']
+
+
+def _copy(source: str, target: str) -> None:
+    """Copy every column of target from the same-named columns of source"""
+    op.execute(f"""
+        DO $$
+        DECLARE columns text;
+        BEGIN
+            SELECT string_agg(quote_ident(column_name), ', ' ORDER BY ordinal_position)
+            INTO columns
+            FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = '{target}';
+
+            EXECUTE format('INSERT INTO {target} (%s) SELECT %s FROM {source}', columns, columns);
+        END $$;
+    """)
+
+
+def _create_partitions(table: str) -> None:
+    """One partition per season already present, plus this season and next"""
+    op.execute(f"""
+        DO $$
+        DECLARE s integer;
+        BEGIN
+            FOR s IN
+                SELECT DISTINCT season FROM {table}_unpartitioned
+                UNION SELECT extract(year FROM current_date)::integer
+                UNION SELECT extract(year FROM current_date)::integer + 1
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF {table} FOR VALUES IN (%s)',
+                    '{table}_' || s, s
+                );
+            END LOOP;
+        END $$;
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, key in TABLES.items():
+        for index in REPLACED_INDEXES.get(table, []):
+            op.drop_index(index, table_name=table)
+        op.drop_index(f'ix_{table}_team_id', table_name=table, if_exists=True)
+
+        op.rename_table(table, f'{table}_unpartitioned')
+        op.execute(f'ALTER TABLE {table}_unpartitioned RENAME CONSTRAINT {table}_pkey TO {table}_unpartitioned_pkey')
+
+        if table in GAME_LOG_TABLES:
+            # Game logs had no date; take it from the already migrated game tables
+            op.execute(f'ALTER TABLE {table}_unpartitioned ADD COLUMN game_date VARCHAR(10)')
+            op.execute(f"""
+                UPDATE {table}_unpartitioned AS l
+                SET game_date = coalesce(
+                    (SELECT g.game_date FROM game_information AS g WHERE g.game_id = l.game_id LIMIT 1),
+                    (SELECT s.game_date FROM team_schedules AS s WHERE s.game_id = l.game_id LIMIT 1)
+                )
+            """)
+            op.execute(f"""
+                DO $$
+                BEGIN
+                    IF EXISTS (SELECT 1 FROM {table}_unpartitioned WHERE game_date IS NULL) THEN
+                        RAISE EXCEPTION '{table} has games with no schedule or game_information row; ingest them before migrating';
+                    END IF;
+                END $$;
+            """)
+
+        op.execute(f'ALTER TABLE {table}_unpartitioned ADD COLUMN season INTEGER')
+        op.execute(f'UPDATE {table}_unpartitioned SET season = left(game_date, 4)::integer')
+
+        op.execute(f'CREATE TABLE {table} (LIKE {table}_unpartitioned) PARTITION BY LIST (season)')
+        if table == 'team_schedules':
+            op.execute('ALTER TABLE team_schedules DROP COLUMN id')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN game_date SET NOT NULL, ALTER COLUMN season SET NOT NULL')
+        op.create_primary_key(f'{table}_pkey', table, [*key, 'season'])
+
+        _create_partitions(table)
+        _copy(f'{table}_unpartitioned', table)
+
+        op.create_index(f'ix_{table}_game_date_brin', table, ['game_date'], unique=False, postgresql_using='brin')
+        if table in GAME_LOG_TABLES:
+            op.create_index(op.f(f'ix_{table}_team_id'), table, ['team_id'], unique=False)
+
+        op.drop_table(f'{table}_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, key in reversed(TABLES.items()):
+        op.drop_index(f'ix_{table}_game_date_brin', table_name=table)
+        op.drop_index(f'ix_{table}_team_id', table_name=table, if_exists=True)
+
+        op.rename_table(table, f'{table}_partitioned')
+        op.execute(f'ALTER TABLE {table}_partitioned RENAME CONSTRAINT {table}_pkey TO {table}_partitioned_pkey')
+
+        op.execute(f'CREATE TABLE {table} (LIKE {table}_partitioned)')
+        op.drop_column(table, 'season')
+        if table in GAME_LOG_TABLES:
+            op.drop_column(table, 'game_date')
+
+        _copy(f'{table}_partitioned', table)
+
+        if table == 'team_schedules':
+            op.execute('ALTER TABLE team_schedules ADD COLUMN id SERIAL')
+            op.create_primary_key('team_schedules_pkey', table, ['id'])
+            op.create_index(op.f('ix_team_schedules_game_date'), table, ['game_date'], unique=False)
+            op.create_index(op.f('ix_team_schedules_game_id'), table, ['game_id'], unique=True)
+        else:
+            op.create_primary_key(f'{table}_pkey', table, key)
+        if table == 'game_information':
+            op.create_index(op.f('ix_game_information_game_date'), table, ['game_date'], unique=False)
+        if table in GAME_LOG_TABLES:
+            op.create_index(op.f(f'ix_{table}_team_id'), table, ['team_id'], unique=False)
+
+        # Dropping the parent drops every season partition with it
+        op.drop_table(f'{table}_partitioned')
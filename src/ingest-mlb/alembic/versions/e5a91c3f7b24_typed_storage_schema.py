@@ -0,0 +1,247 @@
+"""typed storage schema
+
+Revision ID: e5a91c3f7b24
+Revises: d2b8f4a61e90
+Create Date: 2026-10-19 16:21:07.552190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a91c3f7b24'
+down_revision: Union[str, Sequence[str], None] = 'd2b8f4a61e90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Retyped columns and their new types; everything else is unchanged
+COLUMNS = {
+    'at_bats': {
+        'at_bat_index': 'SMALLINT',
+        'inning': 'SMALLINT',
+        'rbi': 'SMALLINT',
+        'balls': 'SMALLINT',
+        'strikes': 'SMALLINT',
+        'outs': 'SMALLINT',
+        'away_score': 'SMALLINT',
+        'home_score': 'SMALLINT',
+        'pitch_count': 'SMALLINT',
+        'start_time': 'TIMESTAMPTZ',
+        'end_time': 'TIMESTAMPTZ',
+    },
+    'batter_game_logs': {
+        'game_date': 'DATE',
+        'games_played': 'SMALLINT',
+        'at_bats': 'SMALLINT',
+        'runs': 'SMALLINT',
+        'hits': 'SMALLINT',
+        'doubles': 'SMALLINT',
+        'triples': 'SMALLINT',
+        'home_runs': 'SMALLINT',
+        'rbi': 'SMALLINT',
+        'base_on_balls': 'SMALLINT',
+        'intentional_walks': 'SMALLINT',
+        'strike_outs': 'SMALLINT',
+        'stolen_bases': 'SMALLINT',
+        'caught_stealing': 'SMALLINT',
+        'hit_by_pitch': 'SMALLINT',
+        'sac_bunts': 'SMALLINT',
+        'sac_flies': 'SMALLINT',
+        'plate_appearances': 'SMALLINT',
+        'total_bases': 'SMALLINT',
+        'left_on_base': 'SMALLINT',
+        'ground_into_double_play': 'SMALLINT',
+        'ground_into_triple_play': 'SMALLINT',
+        'catchers_interference': 'SMALLINT',
+        'pickoffs': 'SMALLINT',
+        'ground_outs': 'SMALLINT',
+        'fly_outs': 'SMALLINT',
+        'air_outs': 'SMALLINT',
+        'pop_outs': 'SMALLINT',
+        'line_outs': 'SMALLINT',
+        'stolen_base_percentage': 'NUMERIC(4, 3)',
+        'at_bats_per_home_run': 'NUMERIC(6, 2)',
+    },
+    'game_information': {
+        'game_date': 'DATE',
+        'game_datetime': 'TIMESTAMPTZ',
+        'home_wins': 'SMALLINT',
+        'home_losses': 'SMALLINT',
+        'home_win_pct': 'NUMERIC(4, 3)',
+        'away_wins': 'SMALLINT',
+        'away_losses': 'SMALLINT',
+        'away_win_pct': 'NUMERIC(4, 3)',
+        'home_score': 'SMALLINT',
+        'away_score': 'SMALLINT',
+        'temperature': 'SMALLINT',
+    },
+    'pitch_events': {
+        'at_bat_index': 'SMALLINT',
+        'event_index': 'SMALLINT',
+        'pitch_number': 'SMALLINT',
+        'balls': 'SMALLINT',
+        'strikes': 'SMALLINT',
+        'outs': 'SMALLINT',
+        'start_speed': 'REAL',
+        'end_speed': 'REAL',
+        'spin_rate': 'SMALLINT',
+        'zone': 'SMALLINT',
+        'launch_speed': 'REAL',
+        'launch_angle': 'REAL',
+        'total_distance': 'REAL',
+    },
+    'pitcher_game_logs': {
+        'game_date': 'DATE',
+        'games_played': 'SMALLINT',
+        'games_started': 'SMALLINT',
+        'games_finished': 'SMALLINT',
+        'complete_games': 'SMALLINT',
+        'shutouts': 'SMALLINT',
+        'wins': 'SMALLINT',
+        'losses': 'SMALLINT',
+        'saves': 'SMALLINT',
+        'save_opportunities': 'SMALLINT',
+        'holds': 'SMALLINT',
+        'blown_saves': 'SMALLINT',
+        'innings_pitched': 'NUMERIC(4, 1)',
+        'batters_faced': 'SMALLINT',
+        'outs': 'SMALLINT',
+        'pitches_thrown': 'SMALLINT',
+        'strikes': 'SMALLINT',
+        'balls': 'SMALLINT',
+        'strike_percentage': 'NUMERIC(4, 3)',
+        'hits': 'SMALLINT',
+        'runs': 'SMALLINT',
+        'earned_runs': 'SMALLINT',
+        'home_runs': 'SMALLINT',
+        'strike_outs': 'SMALLINT',
+        'base_on_balls': 'SMALLINT',
+        'intentional_walks': 'SMALLINT',
+        'hit_batsmen': 'SMALLINT',
+        'wild_pitches': 'SMALLINT',
+        'balks': 'SMALLINT',
+        'pickoffs': 'SMALLINT',
+        'inherited_runners': 'SMALLINT',
+        'inherited_runners_scored': 'SMALLINT',
+        'passed_ball': 'SMALLINT',
+        'ground_outs': 'SMALLINT',
+        'fly_outs': 'SMALLINT',
+        'air_outs': 'SMALLINT',
+        'pop_outs': 'SMALLINT',
+        'line_outs': 'SMALLINT',
+        'doubles': 'SMALLINT',
+        'triples': 'SMALLINT',
+        'rbi': 'SMALLINT',
+        'sac_bunts': 'SMALLINT',
+        'sac_flies': 'SMALLINT',
+        'catchers_interference': 'SMALLINT',
+        'stolen_bases': 'SMALLINT',
+        'caught_stealing': 'SMALLINT',
+        'stolen_base_percentage': 'NUMERIC(4, 3)',
+        'runs_scored_per_9': 'NUMERIC(6, 2)',
+        'home_runs_per_9': 'NUMERIC(6, 2)',
+    },
+    'player_season_batting_stats': {
+        'games_played': 'SMALLINT',
+        'plate_appearances': 'SMALLINT',
+        'at_bats': 'SMALLINT',
+        'runs': 'SMALLINT',
+        'hits': 'SMALLINT',
+        'doubles': 'SMALLINT',
+        'triples': 'SMALLINT',
+        'home_runs': 'SMALLINT',
+        'rbi': 'SMALLINT',
+        'base_on_balls': 'SMALLINT',
+        'strike_outs': 'SMALLINT',
+        'hit_by_pitch': 'SMALLINT',
+        'stolen_bases': 'SMALLINT',
+        'caught_stealing': 'SMALLINT',
+        'total_bases': 'SMALLINT',
+        'avg': 'NUMERIC(4, 3)',
+        'obp': 'NUMERIC(4, 3)',
+        'slg': 'NUMERIC(4, 3)',
+        'ops': 'NUMERIC(5, 3)',
+        'babip': 'NUMERIC(4, 3)',
+        'woba': 'REAL',
+        'wrc_plus': 'REAL',
+        'war': 'REAL',
+        'speed_score': 'REAL',
+    },
+    'player_season_pitching_stats': {
+        'games_played': 'SMALLINT',
+        'games_started': 'SMALLINT',
+        'wins': 'SMALLINT',
+        'losses': 'SMALLINT',
+        'saves': 'SMALLINT',
+        'innings_pitched': 'NUMERIC(5, 1)',
+        'outs': 'SMALLINT',
+        'batters_faced': 'SMALLINT',
+        'pitches_thrown': 'SMALLINT',
+        'hits': 'SMALLINT',
+        'earned_runs': 'SMALLINT',
+        'home_runs': 'SMALLINT',
+        'base_on_balls': 'SMALLINT',
+        'strike_outs': 'SMALLINT',
+        'era': 'NUMERIC(6, 2)',
+        'whip': 'NUMERIC(6, 2)',
+        'avg': 'NUMERIC(4, 3)',
+        'strikeouts_per_9': 'NUMERIC(6, 2)',
+        'walks_per_9': 'NUMERIC(6, 2)',
+        'hits_per_9': 'NUMERIC(6, 2)',
+        'fip': 'REAL',
+        'xfip': 'REAL',
+        'era_minus': 'REAL',
+        'war': 'REAL',
+    },
+    'team_schedules': {
+        'game_date': 'DATE',
+    },
+}
+
+# Placeholders the Stats API uses for undefined rates become NULL
+NUMBER_PATTERN = r'^\s*-?[0-9]*\.?[0-9]+\s*$'
+
+
+def _upgrade_using(column: str, type_: str) -> str:
+    if type_.startswith('NUMERIC'):
+        return f"CASE WHEN {column} ~ '{NUMBER_PATTERN}' THEN trim({column})::{type_} END"
+    if type_ in ('DATE', 'TIMESTAMPTZ'):
+        return f"nullif({column}, '')::{type_}"
+    return f'{column}::{type_}'
+
+
+def _downgrade(column: str, type_: str) -> tuple[str, str]:
+    """Original type of a column and how to convert it back"""
+    if type_ == 'SMALLINT':
+        return 'INTEGER', f'{column}::integer'
+    if type_ == 'REAL':
+        return 'DOUBLE PRECISION', f'{column}::double precision'
+    if type_ == 'DATE':
+        return 'VARCHAR(10)', f"to_char({column}, 'YYYY-MM-DD')"
+    if type_ == 'TIMESTAMPTZ':
+        return 'VARCHAR(30)', f"""to_char({column} AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS"Z"')"""
+    return 'VARCHAR(10)', f'{column}::varchar(10)'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One ALTER TABLE per table, so each table is rewritten only once
+    for table, columns in COLUMNS.items():
+        alterations = ',\n'.join(
+            f'ALTER COLUMN {column} TYPE {type_} USING {_upgrade_using(column, type_)}'
+            for column, type_ in columns.items()
+        )
+        op.execute(f'ALTER TABLE {table}\n{alterations}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in COLUMNS.items():
+        alterations = ',\n'.join(
+            'ALTER COLUMN {0} TYPE {1} USING {2}'.format(column, *_downgrade(column, type_))
+            for column, type_ in columns.items()
+        )
+        op.execute(f'ALTER TABLE {table}\n{alterations}')
@@ -0,0 +1,109 @@
+"""
+Local analytical queries over the Parquet export, for notebooks and training
+jobs that should not load the production database.
+
+query() runs SQL in an in-process DuckDB with one view per exported table, and
+read_table() loads selected columns of a date range straight into pandas.
+Both read only the columns asked for, and files are memory-mapped rather
+than copied into process buffers.
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any, List, Sequence
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+
+from export import PARQUET_TABLES, PARTITION_FILE, ParquetExport
+
+
+def _export(root: str | Path | None) -> ParquetExport:
+    export = ParquetExport(root) if root else ParquetExport.from_env()
+    if export is None:
+        raise ValueError("MLB_PARQUET_DIR environment variable is not set")
+    return export
+
+
+def connect(root: str | Path | None = None) -> duckdb.DuckDBPyConnection:
+    """In-memory DuckDB connection with a view over each exported table"""
+    export = _export(root)
+    connection = duckdb.connect()
+
+    for table in PARQUET_TABLES:
+        if not export.files(table):
+            continue
+        files = (export.root / table / "date=*" / PARTITION_FILE).as_posix()
+        # Per-file min/max statistics let game_date filters skip whole days
+        connection.execute(
+            f"CREATE VIEW {table} AS "
+            f"SELECT * FROM read_parquet('{files}', hive_partitioning = false)"
+        )
+
+    return connection
+
+
+def query(
+    sql: str,
+    parameters: Sequence[Any] | dict[str, Any] | None = None,
+    root: str | Path | None = None,
+) -> pd.DataFrame:
+    """
+    Run a query against the exported tables.
+
+    Args:
+        sql: DuckDB SQL referencing game_information, batter_game_logs or
+             pitcher_game_logs
+        parameters: Values for the query's ? or $name placeholders
+        root: Export directory; defaults to MLB_PARQUET_DIR
+
+    Returns:
+        The result as a DataFrame
+    """
+    with connect(root) as connection:
+        return connection.execute(sql, parameters).df()
+
+
+def read_table(
+    table: str,
+    columns: List[str] | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    root: str | Path | None = None,
+) -> pd.DataFrame:
+    """
+    Load columns of an exported table, skipping partitions outside a date range.
+
+    Args:
+        table: Exported table name (see export.PARQUET_TABLES)
+        columns: Columns to read, or None for all of them
+        start_date: First game date to include, or None for the earliest
+        end_date: Last game date to include, or None for the latest
+        root: Export directory; defaults to MLB_PARQUET_DIR
+
+    Returns:
+        The selected rows and columns as a DataFrame
+    """
+    export = _export(root)
+    dataset = ds.dataset(
+        export.root / table,
+        format="parquet",
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+        partitioning=ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive"),
+    )
+
+    # Partition keys are ISO dates, so string comparison orders them by date
+    partition = ds.field("date")
+    where = None
+    if start_date is not None:
+        where = partition >= start_date.isoformat()
+    if end_date is not None:
+        upper = partition <= end_date.isoformat()
+        where = upper if where is None else where & upper
+
+    if columns is None:
+        columns = [c.name for c in PARQUET_TABLES[table].__table__.columns]
+    return dataset.to_table(columns=columns, filter=where).to_pandas()
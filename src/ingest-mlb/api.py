@@ -0,0 +1,306 @@
+"""
+Read API over the ingested tables for apps.
+
+Responses are rendered once and kept in an in-process ResponseCache, so hot
+endpoints are answered from memory and the database only sees misses. Cached
+entries are tagged with the rows they were read from and dropped when
+database.events reports a committed change to them; their TTL bounds staleness
+for writes made by other processes. Every response carries an ETag, and a
+matching If-None-Match is answered with 304 without a body.
+
+Lists use keyset pagination: each page returns an opaque cursor for the next.
+
+    uvicorn api:app  (or alongside live polling, see main._poll_live)
+"""
+
+import base64
+import json
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, List
+
+from fastapi import APIRouter, FastAPI, HTTPException, Query, Request, Response
+from sqlalchemy import select, tuple_
+
+from common.cache import ResponseCache
+from common.database.config import create_async_db_engine, create_session_maker
+
+from database import events
+from database.dimensions import Dimensions
+from database.models import (
+    BatterGameLog,
+    GameInformation,
+    PitcherGameLog,
+    PlayerSeasonBattingStats,
+    PlayerSeasonPitchingStats,
+)
+
+# Column of each table that cache tags are keyed on; a committed row drops the
+# entries tagged with its table and that column's value
+INVALIDATION_KEYS = {
+    GameInformation.__tablename__: "game_date",
+    BatterGameLog.__tablename__: "player_id",
+    PitcherGameLog.__tablename__: "player_id",
+    PlayerSeasonBattingStats.__tablename__: "player_id",
+    PlayerSeasonPitchingStats.__tablename__: "player_id",
+}
+
+GAME_LOG_TABLES = {
+    "batting": BatterGameLog,
+    "pitching": PitcherGameLog,
+}
+
+# Seconds entries stay fresh when no ingestion event reaches this process;
+# games change every live poll, season lines once a night
+GAMES_TTL = 15.0
+GAME_LOGS_TTL = 60.0
+SEASON_TTL = 300.0
+
+router = APIRouter()
+
+
+def _tag(table: str, value: Any) -> tuple[str, str]:
+    return table, str(value)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _render(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), default=_default).encode()
+
+
+def _encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(_render(values)).decode()
+
+
+def _decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> List[Any]:
+    """Values of a cursor, each parsed by the matching type"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return [parse(value) for parse, value in zip(types, values)]
+    except (TypeError, ValueError):
+        raise HTTPException(400, "Malformed cursor")
+
+
+def _page(
+    rows: List[dict[str, Any]], limit: int, cursor: Callable[[dict], List[Any]]
+) -> dict[str, Any]:
+    """One page of rows, queried with limit + 1 to learn whether more follow"""
+    items = rows[:limit]
+    more = len(rows) > limit
+    return {
+        "items": items,
+        "next": _encode_cursor(cursor(items[-1])) if more else None,
+    }
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def _respond(
+    request: Request,
+    key: str,
+    load: Callable[[], Awaitable[Any]],
+    tags: List[Hashable],
+    ttl: float,
+) -> Response:
+    """Serve a cached rendering of load(), or 304 if the client has it already"""
+
+    async def render() -> bytes:
+        return _render(await load())
+
+    entry, hit = await request.app.state.cache.get_or_load(key, render, tags, ttl)
+    headers = {
+        "ETag": entry.etag,
+        # Clients may keep the body but must revalidate before reusing it
+        "Cache-Control": "no-cache",
+        "X-Cache": "hit" if hit else "miss",
+    }
+
+    if _not_modified(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+async def _fetch(request: Request, statement) -> List[dict[str, Any]]:
+    async with request.app.state.sessions() as session:
+        result = await session.execute(statement)
+        return [dict(row) for row in result.mappings()]
+
+
+@router.get("/games")
+async def games(
+    request: Request,
+    game_date: date | None = Query(None, alias="date"),
+    after: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+) -> Response:
+    """Games on a date, today by default, in game_id order"""
+    game_date = game_date or date.today()
+    table = GameInformation.__table__
+    cursor = _decode_cursor(after, int) if after is not None else None
+
+    async def load() -> dict[str, Any]:
+        statement = (
+            select(table)
+            .where(table.c.game_date == game_date)
+            .order_by(table.c.game_id)
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            statement = statement.where(table.c.game_id > cursor[0])
+
+        # Team and venue names and weather are stored once, as IDs
+        rows = await request.app.state.dimensions.resolve_games(
+            await _fetch(request, statement)
+        )
+        return _page(rows, limit, lambda row: [row["game_id"]])
+
+    return await _respond(
+        request,
+        f"games:{game_date}:{after}:{limit}",
+        load,
+        [_tag(table.name, game_date)],
+        GAMES_TTL,
+    )
+
+
+@router.get("/players/{player_id}/game-logs/{log_type}")
+async def game_logs(
+    request: Request,
+    player_id: int,
+    log_type: str,
+    before: str | None = None,
+    limit: int = Query(20, ge=1, le=200),
+) -> Response:
+    """A player's batting or pitching lines, most recent game first"""
+    if log_type not in GAME_LOG_TABLES:
+        raise HTTPException(404, f"Unknown log type {log_type}")
+    table = GAME_LOG_TABLES[log_type].__table__
+    cursor = (
+        _decode_cursor(before, date.fromisoformat, int) if before is not None else None
+    )
+
+    async def load() -> dict[str, Any]:
+        # Served by ix_{table}_player_id_game_date_game_id
+        statement = (
+            select(table)
+            .where(table.c.player_id == player_id)
+            .order_by(table.c.game_date.desc(), table.c.game_id.desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(table.c.game_date, table.c.game_id) < tuple(cursor)
+            )
+
+        rows = await _fetch(request, statement)
+        return _page(rows, limit, lambda row: [row["game_date"], row["game_id"]])
+
+    return await _respond(
+        request,
+        f"game_logs:{log_type}:{player_id}:{before}:{limit}",
+        load,
+        [_tag(table.name, player_id)],
+        GAME_LOGS_TTL,
+    )
+
+
+@router.get("/players/{player_id}/seasons/{season}")
+async def season_lines(request: Request, player_id: int, season: int) -> Response:
+    """A player's season batting and pitching lines, null where absent"""
+    tables = {
+        "batting": PlayerSeasonBattingStats.__table__,
+        "pitching": PlayerSeasonPitchingStats.__table__,
+    }
+
+    async def load() -> dict[str, Any]:
+        lines = {}
+        for group, table in tables.items():
+            rows = await _fetch(
+                request,
+                select(table).where(
+                    table.c.player_id == player_id, table.c.season == season
+                ),
+            )
+            lines[group] = rows[0] if rows else None
+        return lines
+
+    return await _respond(
+        request,
+        f"seasons:{player_id}:{season}",
+        load,
+        [_tag(table.name, player_id) for table in tables.values()],
+        SEASON_TTL,
+    )
+
+
+@router.get("/health")
+async def health(request: Request) -> dict[str, Any]:
+    """Cache and database pool counters"""
+    cache = request.app.state.cache
+    return {
+        "cache": {"entries": len(cache), "hits": cache.hits, "misses": cache.misses},
+        "pool": request.app.state.engine.pool.metrics.snapshot(),
+    }
+
+
+def _invalidator(cache: ResponseCache) -> events.Listener:
+    def on_change(table: str, rows: List[dict[str, Any]]) -> None:
+        column = INVALIDATION_KEYS.get(table)
+        if column is not None:
+            cache.invalidate({_tag(table, row[column]) for row in rows})
+
+    return on_change
+
+
+def create_app(cache: ResponseCache | None = None) -> FastAPI:
+    """
+    Read API app; the engine is created at startup and disposed at shutdown.
+
+    Args:
+        cache: Response cache to serve from, a 4096-entry one by default
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        engine = create_async_db_engine("live")
+        app.state.engine = engine
+        app.state.sessions = create_session_maker(engine)
+        app.state.dimensions = Dimensions(app.state.sessions)
+        unsubscribe = events.subscribe(_invalidator(app.state.cache))
+        try:
+            yield
+        finally:
+            unsubscribe()
+            await engine.dispose()
+
+    app = FastAPI(title="phoenix", lifespan=lifespan)
+    app.state.cache = cache if cache is not None else ResponseCache(maxsize=4096)
+    app.include_router(router)
+    return app
+
+
+async def serve_api(host: str = "0.0.0.0", port: int = 8000) -> None:
+    """Serve the read API in the running event loop until cancelled"""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(create_app(), host=host, port=port))
+    await server.serve()
+
+
+app = create_app()
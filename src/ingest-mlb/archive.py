@@ -0,0 +1,121 @@
+"""
+Compressed archive of raw Stats API responses.
+
+Responses are appended as NDJSON records to gzip segment files partitioned by
+endpoint type and game date:
+
+    {root}/{endpoint_type}/date={YYYY-MM-DD}/{pid}-{timestamp}.ndjson.gz
+
+Responses covering a date range, like schedules, are partitioned by their span
+instead, as date={YYYY-MM-DD}_{YYYY-MM-DD}, so a replay of any overlapping
+range finds them. Extraction and validation can then be replayed offline with
+mlb.reprocess.
+"""
+
+import atexit
+import gzip
+import json
+import os
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Iterator, List
+
+import httpx
+
+SEGMENT_MAX_RECORDS = 500
+
+
+class RawArchive:
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._segments: dict[Path, tuple[IO[str], int]] = {}
+
+    @classmethod
+    def from_env(cls) -> "RawArchive | None":
+        """Archive configured by MLB_ARCHIVE_DIR, if set"""
+        root = os.getenv("MLB_ARCHIVE_DIR")
+        return cls(root) if root else None
+
+    def append(
+        self,
+        endpoint_type: str,
+        response: httpx.Response,
+        start_date: str | None,
+        end_date: str | None = None,
+    ) -> None:
+        """Archive a response under the date, or the range of dates, it covers"""
+        span = start_date or date.today().isoformat()
+        if end_date and end_date != span:
+            span = f"{span}_{end_date}"
+
+        partition = self.root / endpoint_type / f"date={span}"
+        segment, records = self._segments.get(partition, (None, 0))
+
+        if segment is None or records >= SEGMENT_MAX_RECORDS:
+            if segment is not None:
+                segment.close()
+            partition.mkdir(parents=True, exist_ok=True)
+            segment = gzip.open(
+                partition / f"{os.getpid()}-{time.time_ns()}.ndjson.gz",
+                "wt",
+                encoding="utf-8",
+            )
+            records = 0
+
+        record = {
+            "url": str(response.url),
+            "status": response.status_code,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "body": response.text,
+        }
+        segment.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._segments[partition] = (segment, records + 1)
+
+    def close(self) -> None:
+        for segment, _ in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+    def segments(
+        self, endpoint_type: str, start_date: str, end_date: str
+    ) -> List[Path]:
+        """
+        Segment files of every partition overlapping a date range, oldest first.
+
+        Ranged partitions may hold records outside the range, which callers
+        filter out.
+        """
+        paths = []
+        for partition in (self.root / endpoint_type).glob("date=*"):
+            first, _, last = partition.name.removeprefix("date=").partition("_")
+            if first <= end_date and (last or first) >= start_date:
+                paths.extend(partition.glob("*.ndjson.gz"))
+        # Later fetches come last across partitions too, so they win on upsert
+        return sorted(paths, key=_segment_time)
+
+
+def _segment_time(path: Path) -> int:
+    return int(path.name.split(".")[0].split("-")[1])
+
+
+def read_segment(path: str | Path) -> Iterator[httpx.Response]:
+    """Rebuild archived responses so extractors can consume them unchanged"""
+    with gzip.open(path, "rt", encoding="utf-8") as segment:
+        try:
+            for line in segment:
+                record: dict[str, Any] = json.loads(line)
+                yield httpx.Response(
+                    record["status"],
+                    content=record["body"].encode("utf-8"),
+                    request=httpx.Request("GET", record["url"]),
+                )
+        except (EOFError, json.JSONDecodeError):
+            # Segment left open by a process that died; keep what was flushed
+            return
+
+
+archive = RawArchive.from_env()
+
+if archive is not None:
+    atexit.register(archive.close)
@@ -0,0 +1,193 @@
+"""
+Columnar batches of game logs backed by NumPy structured arrays.
+"""
+
+import sys
+from functools import cache
+from typing import Any, Callable, Iterable, List, Type
+
+import numpy as np
+from pydantic import BeforeValidator
+
+from common.models import CustomModel
+
+# Identifier columns need the full int32 range; per-game counting stats fit int16
+ID_DTYPE = np.int32
+COUNT_DTYPE = np.int16
+
+
+@cache
+def _schema(model: Type[CustomModel]) -> tuple[np.dtype, tuple[str, ...], tuple]:
+    """Structured dtype, raw source keys and defaults for a model's fields"""
+    fields, sources, defaults = [], [], []
+
+    for name, field in model.model_fields.items():
+        if field.annotation is bool:
+            dtype = np.bool_
+        elif field.annotation is int:
+            dtype = ID_DTYPE if name.endswith("_id") else COUNT_DTYPE
+        else:
+            dtype = np.object_
+
+        fields.append((name, dtype))
+        sources.append(field.alias or name)
+        defaults.append(None if field.is_required() else field.default)
+
+    return np.dtype(fields), tuple(sources), tuple(defaults)
+
+
+@cache
+def _converters(model: Type[CustomModel]) -> tuple[tuple[int, Callable], ...]:
+    """Field positions and functions of the model's field-level before-validators"""
+    return tuple(
+        (i, metadata.func)
+        for i, field in enumerate(model.model_fields.values())
+        for metadata in field.metadata
+        if isinstance(metadata, BeforeValidator)
+    )
+
+
+@cache
+def _typed_columns(model: Type[CustomModel]) -> tuple[tuple[int, str], ...]:
+    """Positions and names of the int and bool columns, which cannot hold None"""
+    dtype = _schema(model)[0]
+    return tuple(
+        (i, name)
+        for i, name in enumerate(dtype.names)
+        if dtype[name] != np.dtype(np.object_)
+    )
+
+
+@cache
+def _before_validators(model: Type[CustomModel]) -> tuple:
+    return tuple(
+        getattr(model, name)
+        for name, decorator in model.__pydantic_decorators__.model_validators.items()
+        if decorator.info.mode == "before"
+    )
+
+
+class GameLogBatch:
+    """
+    Game logs for one model stored column-wise.
+
+    Extracted boxscore records are flattened straight into a structured array
+    using the model's own before-validators, so no per-row Pydantic object is
+    built. Slicing returns views over the same buffer; models are only created
+    when to_models() is called.
+    """
+
+    def __init__(self, model: Type[CustomModel], data: np.ndarray) -> None:
+        self.model = model
+        self.data = data
+
+    @classmethod
+    def from_logs(
+        cls,
+        model: Type[CustomModel],
+        logs: Iterable[dict[str, Any]],
+        on_error: Callable[[dict[str, Any], Exception], None] | None = None,
+    ) -> "GameLogBatch":
+        """
+        Flatten extracted logs into a batch.
+
+        A log the validators or converters reject raises, unless on_error is
+        given, in which case it is called with the log and error and the log
+        is left out of the batch. Pydantic does not validate the rows, so a
+        missing or null value in an int or bool column is rejected here with a
+        ValueError naming the field, as the model would reject it.
+        """
+        dtype, sources, defaults = _schema(model)
+        validators = _before_validators(model)
+        converters = _converters(model)
+        typed = _typed_columns(model)
+
+        rows, raws = [], []
+        for raw in logs:
+            try:
+                log = raw
+                for validator in validators:
+                    log = validator(log)
+
+                values = [
+                    # Repeated labels (positions, notes) share one string object
+                    sys.intern(value) if isinstance(value, str) else value
+                    for value in (
+                        log.get(source, default)
+                        for source, default in zip(sources, defaults)
+                    )
+                ]
+                # Dates and formatted rates are parsed as the model would
+                for i, convert in converters:
+                    values[i] = convert(values[i])
+                for i, name in typed:
+                    if values[i] is None:
+                        raise ValueError(f"{model.__name__}.{name} must not be null")
+            except (ValueError, TypeError, KeyError, AttributeError) as error:
+                if on_error is None:
+                    raise
+                on_error(raw, error)
+                continue
+            rows.append(tuple(values))
+            raws.append(raw)
+
+        try:
+            return cls(model, np.array(rows, dtype=dtype))
+        except (ValueError, TypeError, OverflowError):
+            if on_error is None:
+                raise
+
+        # Only reached with a value the dtype rejects, so the rows are converted
+        # one at a time to find it
+        kept = []
+        for row, raw in zip(rows, raws):
+            try:
+                kept.append(np.array([row], dtype=dtype))
+            except (ValueError, TypeError, OverflowError) as error:
+                on_error(raw, error)
+        return cls(model, np.concatenate(kept)) if kept else cls.empty(model)
+
+    @classmethod
+    def empty(cls, model: Type[CustomModel]) -> "GameLogBatch":
+        return cls(model, np.empty(0, dtype=_schema(model)[0]))
+
+    @classmethod
+    def concatenate(
+        cls,
+        batches: List["GameLogBatch"],
+        model: Type[CustomModel] | None = None,
+    ) -> "GameLogBatch":
+        """
+        Join batches of one model into a single batch.
+
+        The model is taken from the batches; it only has to be given to get an
+        empty batch back when there may be none.
+        """
+        if not batches:
+            if model is None:
+                raise ValueError("No batches to concatenate and no model given")
+            return cls.empty(model)
+        return cls(batches[0].model, np.concatenate([b.data for b in batches]))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: slice | np.ndarray) -> "GameLogBatch":
+        # Basic slices are zero-copy views; boolean masks and fancy indexes copy
+        return GameLogBatch(self.model, self.data[index])
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self.data.dtype.names
+
+    def column(self, name: str) -> np.ndarray:
+        """View of a single column"""
+        return self.data[name]
+
+    def to_rows(self) -> List[dict[str, Any]]:
+        """Rows keyed by column name, with native Python values for the loader"""
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.data.tolist()]
+
+    def to_models(self) -> List[CustomModel]:
+        return [self.model.model_validate(row) for row in self.to_rows()]
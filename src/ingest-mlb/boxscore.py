@@ -0,0 +1,169 @@
+"""
+Game logs from the box scores in live game feeds.
+
+While games are in progress the same feeds are polled over and over, and most
+players' lines are unchanged between polls. LiveBoxScores remembers the lines
+it has applied, so each poll only flattens and validates the players whose
+stats or position moved, and games whose feed has not been updated at all are
+skipped before their players are looked at.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, List, Protocol, Type
+
+from batches import GameLogBatch
+from common.models import CustomModel
+
+OnError = Callable[[dict[str, Any], Exception], None]
+
+
+class LogType(Protocol):
+    """A game log kind, as mlb.GameLogType describes it"""
+
+    @property
+    def model(self) -> Type[CustomModel]: ...
+
+    @property
+    def stats_key(self) -> str: ...
+
+
+def boxscore_players(
+    game_data: dict[str, Any],
+) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """Each rostered player's boxscore entry with the log fields of their side"""
+    game_id = game_data.get("game_id")
+    game_date = game_data.get("datetime", {}).get("officialDate")
+    teams = game_data.get("boxscore", {}).get("teams", {})
+
+    for team_type, opponent_type in (("home", "away"), ("away", "home")):
+        if team_type not in teams or opponent_type not in teams:
+            continue
+
+        side = {
+            "gamePk": game_id,
+            "gameDate": game_date,
+            "teamId": teams[team_type]["team"]["id"],
+            "opponentTeamId": teams[opponent_type]["team"]["id"],
+            "isHome": team_type == "home",
+        }
+        for player in teams[team_type].get("players", {}).values():
+            yield player, side
+
+
+def game_log(player: dict[str, Any], side: dict[str, Any]) -> dict[str, Any]:
+    """Raw game log record of a player, as the game log models validate it"""
+    return {
+        **side,
+        "playerId": player["person"]["id"],
+        "position": player.get("position"),
+        "stats": player["stats"],
+    }
+
+
+def extract_game_logs(
+    game_data: dict[str, Any], stats_key: str
+) -> List[dict[str, Any]]:
+    """Game logs of every player with a line in the stats group"""
+    return [
+        game_log(player, side)
+        for player, side in boxscore_players(game_data)
+        # Every rostered player carries both stats groups; players who did not
+        # bat or pitch have them empty
+        if player.get("stats", {}).get(stats_key)
+    ]
+
+
+class LiveBoxScores:
+    """
+    Current batting and pitching lines of the games being polled.
+
+    Args:
+        log_types: Kinds of lines to keep, e.g. mlb.GameLogType
+    """
+
+    def __init__(self, log_types: Iterable[LogType]) -> None:
+        self.log_types = tuple(log_types)
+        # Feed timestamp each game was last applied at
+        self._timestamps: dict[int, str | None] = {}
+        # (game_id, stats_key, player_id) -> stats and position last applied
+        self._lines: dict[tuple[int, str, int], tuple[dict, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def forget(self, game_ids: Iterable[int]) -> None:
+        """Release the lines of games that are no longer polled"""
+        game_ids = set(game_ids)
+        for game_id in game_ids:
+            self._timestamps.pop(game_id, None)
+        self._lines = {
+            key: line for key, line in self._lines.items() if key[0] not in game_ids
+        }
+
+    def update(
+        self, games_data: List[dict[str, Any]], on_error: OnError | None = None
+    ) -> dict[LogType, GameLogBatch]:
+        """
+        Apply a poll's extracted games and return the lines that changed.
+
+        Args:
+            games_data: Games as mlb extracts them from live feeds
+            on_error: Called with each log that fails validation, which is
+                      then left out and tried again on the next poll; without
+                      it the first failure raises
+
+        Returns:
+            A batch per log type holding only new or changed lines
+        """
+        changed: dict[LogType, List] = {log_type: [] for log_type in self.log_types}
+
+        for game_data in games_data:
+            game_id = game_data.get("game_id")
+            timestamp = game_data.get("timestamp")
+            if timestamp is not None and self._timestamps.get(game_id) == timestamp:
+                continue
+            self._timestamps[game_id] = timestamp
+
+            for player, side in boxscore_players(game_data):
+                stats = player.get("stats", {})
+                position = player.get("position")
+
+                for log_type in self.log_types:
+                    line = stats.get(log_type.stats_key)
+                    if not line:
+                        continue
+
+                    key = (game_id, log_type.stats_key, player["person"]["id"])
+                    # Plain dict comparison, far cheaper than revalidating
+                    if self._lines.get(key) == (line, position):
+                        continue
+                    changed[log_type].append((key, (line, position), player, side))
+
+        return {
+            log_type: self._apply(log_type, entries, on_error)
+            for log_type, entries in changed.items()
+        }
+
+    def _apply(
+        self, log_type: LogType, entries: List, on_error: OnError | None
+    ) -> GameLogBatch:
+        failed: set[tuple[int, int]] = set()
+
+        def reject(log: dict[str, Any], error: Exception) -> None:
+            failed.add((log.get("gamePk"), log.get("playerId")))
+            on_error(log, error)
+
+        batch = GameLogBatch.from_logs(
+            log_type.model,
+            (game_log(player, side) for _, _, player, side in entries),
+            on_error=reject if on_error is not None else None,
+        )
+
+        for key, line, _, _ in entries:
+            game_id, _, player_id = key
+            if (game_id, player_id) in failed:
+                # The game is looked at again even if its feed does not change
+                self._timestamps.pop(game_id, None)
+            else:
+                self._lines[key] = line
+
+        return batch
@@ -0,0 +1,345 @@
+"""
+Season rollups maintained from the game log and game information tables.
+
+Refreshes recompute whole rows for the affected (player, season) or
+(team, season) keys from a single season partition, so re-ingesting a game
+never double counts and a full rebuild is the same statement without a key
+filter.
+"""
+
+from typing import Any, Callable, Iterable, List, NamedTuple, Type
+
+from sqlalchemy import (
+    Integer,
+    Numeric,
+    SmallInteger,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    or_,
+    select,
+    true,
+    union_all,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import (
+    BatterGameLog,
+    BatterRecentAggregate,
+    BatterSeasonAggregate,
+    GameInformation,
+    PitcherGameLog,
+    PitcherRecentAggregate,
+    PitcherSeasonAggregate,
+    TeamSeasonAggregate,
+)
+
+# Trailing windows kept in the recent aggregate tables
+RECENT_GAME_WINDOWS = (7, 15, 30)
+
+FINAL_STATUS = "Final"
+
+
+def _ratio(numerator: Any, denominator: Any, scale: int) -> Any:
+    return func.round(cast(numerator, Numeric) / func.nullif(denominator, 0), scale)
+
+
+def _batting_rates(t: dict[str, Any]) -> dict[str, Any]:
+    on_base = t["hits"] + t["base_on_balls"] + t["hit_by_pitch"]
+    chances = t["at_bats"] + t["base_on_balls"] + t["hit_by_pitch"] + t["sac_flies"]
+    return {
+        "avg": _ratio(t["hits"], t["at_bats"], 3),
+        "obp": _ratio(on_base, chances, 3),
+        "slg": _ratio(t["total_bases"], t["at_bats"], 3),
+        "ops": func.round(
+            _ratio(on_base, chances, 6) + _ratio(t["total_bases"], t["at_bats"], 6),
+            3,
+        ),
+    }
+
+
+def _pitching_rates(t: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "era": _ratio(27 * t["earned_runs"], t["outs"], 2),
+        "whip": _ratio(3 * (t["base_on_balls"] + t["hits"]), t["outs"], 2),
+    }
+
+
+class Rollup(NamedTuple):
+    season: Type
+    recent: Type
+    rates: Callable[[dict[str, Any]], dict[str, Any]]
+
+
+PLAYER_ROLLUPS = {
+    BatterGameLog: Rollup(BatterSeasonAggregate, BatterRecentAggregate, _batting_rates),
+    PitcherGameLog: Rollup(
+        PitcherSeasonAggregate, PitcherRecentAggregate, _pitching_rates
+    ),
+}
+
+AGGREGATE_TABLES = [
+    *(table for rollup in PLAYER_ROLLUPS.values() for table in rollup[:2]),
+    TeamSeasonAggregate,
+]
+
+
+def group_by_season(rows: Iterable[dict[str, Any]], *keys: str) -> dict[int, set]:
+    """Distinct values of the key columns in rows, per season"""
+    seasons: dict[int, set] = {}
+    for row in rows:
+        seasons.setdefault(row["season"], set()).update(row[key] for key in keys)
+    return seasons
+
+
+def _ids_filter(id_column: Any, ids: Iterable[int] | None) -> Any:
+    # A single array parameter keeps the statement size independent of the keys
+    if ids is None:
+        return true()
+    return id_column == any_(
+        bindparam("ids", sorted(ids), type_=ARRAY(Integer), unique=True)
+    )
+
+
+async def upsert_from_select(
+    session: AsyncSession, aggregate: Type, query: Any
+) -> dict[str, int]:
+    """Insert a query's rows into an aggregate, replacing rows with the same key"""
+    names = list(query.selected_columns.keys())
+    keys = [c.name for c in aggregate.__table__.primary_key]
+
+    stmt = pg_insert(aggregate).from_select(names, query)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=keys,
+        set_={name: stmt.excluded[name] for name in names if name not in keys},
+    )
+    result = await session.execute(stmt)
+    return {aggregate.__tablename__: result.rowcount}
+
+
+def _player_line(source: Any, aggregate: Type, rates: Callable) -> List[Any]:
+    """Summed columns, last game date and rates of an aggregate, over source"""
+    summed = [
+        c.name
+        for c in aggregate.__table__.columns
+        if not c.primary_key and c.name in source.c
+    ]
+    totals = {name: func.sum(source.c[name]) for name in summed}
+
+    return [
+        func.max(source.c.game_date).label("last_game_date"),
+        *(total.label(name) for name, total in totals.items()),
+        *(rate.label(name) for name, rate in rates(totals).items()),
+    ]
+
+
+async def refresh_player_aggregates(
+    session: AsyncSession,
+    log_table: Type,
+    season: int,
+    player_ids: Iterable[int] | None = None,
+) -> dict[str, int]:
+    """
+    Recompute season-to-date and last-N-games lines from a game log table.
+
+    Args:
+        session: Session whose transaction the refresh joins
+        log_table: BatterGameLog or PitcherGameLog
+        season: Season to refresh
+        player_ids: Players to refresh, or None for everyone with a log
+
+    Returns:
+        Rows written per aggregate table
+    """
+    season_table, recent_table, rates = PLAYER_ROLLUPS[log_table]
+    logs = log_table.__table__
+    where = and_(logs.c.season == season, _ids_filter(logs.c.player_id, player_ids))
+
+    season_query = (
+        select(
+            logs.c.player_id, logs.c.season, *_player_line(logs, season_table, rates)
+        )
+        .where(where)
+        .group_by(logs.c.player_id, logs.c.season)
+    )
+
+    ranked = (
+        select(
+            logs,
+            func.row_number()
+            .over(
+                partition_by=logs.c.player_id,
+                order_by=(logs.c.game_date.desc(), logs.c.game_id.desc()),
+            )
+            .label("game_number"),
+        )
+        .where(where)
+        .subquery()
+    )
+    windows = values(column("last_n", SmallInteger), name="windows").data(
+        [(n,) for n in RECENT_GAME_WINDOWS]
+    )
+    recent_query = (
+        select(
+            ranked.c.player_id,
+            ranked.c.season,
+            windows.c.last_n,
+            *_player_line(ranked, recent_table, rates),
+        )
+        .select_from(ranked.join(windows, ranked.c.game_number <= windows.c.last_n))
+        .group_by(ranked.c.player_id, ranked.c.season, windows.c.last_n)
+    )
+
+    return {
+        **await upsert_from_select(session, season_table, season_query),
+        **await upsert_from_select(session, recent_table, recent_query),
+    }
+
+
+async def refresh_team_aggregates(
+    session: AsyncSession, season: int, team_ids: Iterable[int] | None = None
+) -> dict[str, int]:
+    """
+    Recompute team records from final games and team totals from game logs.
+
+    Args:
+        session: Session whose transaction the refresh joins
+        season: Season to refresh
+        team_ids: Teams to refresh, or None for every team with a final game
+
+    Returns:
+        Rows written per aggregate table
+    """
+    team_ids = None if team_ids is None else list(team_ids)
+    games = GameInformation.__table__
+    batting = BatterGameLog.__table__
+    pitching = PitcherGameLog.__table__
+
+    final = and_(
+        games.c.season == season,
+        games.c.game_status == FINAL_STATUS,
+        or_(
+            _ids_filter(games.c.home_team_id, team_ids),
+            _ids_filter(games.c.away_team_id, team_ids),
+        ),
+    )
+    sides = union_all(
+        *(
+            select(
+                games.c[f"{side}_team_id"].label("team_id"),
+                games.c[f"{side}_score"].label("runs_scored"),
+                games.c[f"{other}_score"].label("runs_allowed"),
+            ).where(final)
+            for side, other in (("home", "away"), ("away", "home"))
+        )
+    ).subquery()
+    record = (
+        select(
+            sides.c.team_id,
+            func.count().label("games_played"),
+            func.sum(
+                case((sides.c.runs_scored > sides.c.runs_allowed, 1), else_=0)
+            ).label("wins"),
+            func.sum(
+                case((sides.c.runs_scored < sides.c.runs_allowed, 1), else_=0)
+            ).label("losses"),
+            func.sum(sides.c.runs_scored).label("runs_scored"),
+            func.sum(sides.c.runs_allowed).label("runs_allowed"),
+        )
+        .where(_ids_filter(sides.c.team_id, team_ids))
+        .group_by(sides.c.team_id)
+        .subquery()
+    )
+
+    def team_totals(logs: Any, columns: dict[str, str]) -> Any:
+        return (
+            select(
+                logs.c.team_id,
+                *(
+                    func.sum(logs.c[source]).label(name)
+                    for name, source in columns.items()
+                ),
+            )
+            .where(logs.c.season == season, _ids_filter(logs.c.team_id, team_ids))
+            .group_by(logs.c.team_id)
+            .subquery()
+        )
+
+    offense = team_totals(
+        batting,
+        {
+            "hits": "hits",
+            "home_runs": "home_runs",
+            "base_on_balls": "base_on_balls",
+            "strike_outs": "strike_outs",
+        },
+    )
+    staff = team_totals(
+        pitching,
+        {
+            "pitching_outs": "outs",
+            "hits_allowed": "hits",
+            "earned_runs": "earned_runs",
+            "walks_allowed": "base_on_balls",
+            "pitching_strike_outs": "strike_outs",
+        },
+    )
+
+    query = select(
+        record.c.team_id,
+        cast(season, Integer).label("season"),
+        *(
+            record.c[name]
+            for name in (
+                "games_played",
+                "wins",
+                "losses",
+                "runs_scored",
+                "runs_allowed",
+            )
+        ),
+        *(
+            func.coalesce(totals.c[name], 0).label(name)
+            for totals in (offense, staff)
+            for name in totals.c.keys()
+            if name != "team_id"
+        ),
+    ).select_from(
+        record.outerjoin(offense, offense.c.team_id == record.c.team_id).outerjoin(
+            staff, staff.c.team_id == record.c.team_id
+        )
+    )
+
+    return await upsert_from_select(session, TeamSeasonAggregate, query)
+
+
+async def rebuild_aggregates(
+    session: AsyncSession, seasons: Iterable[int]
+) -> List[tuple[str, int]]:
+    """Drop and recompute every aggregate row of the given seasons"""
+    counts = {table.__tablename__: 0 for table in AGGREGATE_TABLES}
+
+    for season in seasons:
+        for table in AGGREGATE_TABLES:
+            await session.execute(delete(table).where(table.season == season))
+
+        written = [
+            *[
+                await refresh_player_aggregates(session, log_table, season)
+                for log_table in PLAYER_ROLLUPS
+            ],
+            await refresh_team_aggregates(session, season),
+        ]
+        for table_counts in written:
+            for table, count in table_counts.items():
+                counts[table] += count
+
+    return list(counts.items())
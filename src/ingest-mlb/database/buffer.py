@@ -0,0 +1,265 @@
+"""
+Write-behind buffering for continuous ingestion.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from typing import Any, Awaitable, Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.models import CustomModel
+
+from database.config import AsyncSessionLocal
+
+# Writes a flush's rows in the session's open transaction
+Write = Callable[[AsyncSession, List[dict[str, Any]]], Awaitable[None]]
+
+# Longest wait between attempts to write rows a failed flush kept
+MAX_RETRY_DELAY = 30.0
+
+
+class WriteBehindBuffer:
+    """
+    Coalescing write-behind buffer for a single table.
+
+    Producers put validated models or rows and return immediately; rows are
+    coalesced by primary key (last write wins) and written in one transaction
+    once the buffer reaches max_rows or max_bytes, or max_latency seconds after
+    the oldest pending write. When the database falls behind and max_pending
+    rows are waiting, put() blocks until a flush completes. A failed flush
+    keeps its rows and is retried with backoff, so producers only notice a
+    database outage once it fills the buffer.
+
+    Rows are upserted into the table as they are unless write is given; the
+    buffers in database.ingestion pass the ingest functions' writers, so names
+    are interned and rollups refreshed as in a direct ingest.
+
+    Usage:
+        async with database.ingestion.game_information_buffer() as buffer:
+            await buffer.put(game)
+    """
+
+    def __init__(
+        self,
+        table: Any,
+        index_elements: List[str],
+        max_rows: int = 1000,
+        max_bytes: int = 4_000_000,
+        max_latency: float = 1.0,
+        max_pending: int | None = None,
+        write: Write | None = None,
+    ) -> None:
+        self.table = table
+        self.index_elements = index_elements
+        self.write = write or self._upsert
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_latency = max_latency
+        self.max_pending = max_pending or max_rows * 4
+
+        self._pending: dict[tuple, dict[str, Any]] = {}
+        self._sizes: dict[tuple, int] = {}
+        self._pending_bytes = 0
+        self._oldest: float | None = None
+
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Condition()
+        self._closed = False
+        # Error of the last background flush, until a flush succeeds again
+        self._error: BaseException | None = None
+        self._retry_delay = 0.0
+        self._retry_at: float | None = None
+        self._flusher: asyncio.Task | None = None
+        self._flushing = False
+
+        self.rows_written = 0
+        self.flushes = 0
+
+    async def __aenter__(self) -> "WriteBehindBuffer":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._flusher is None:
+            self._flushing = True
+            self._flusher = asyncio.create_task(self._run())
+
+    async def put(self, model: CustomModel | dict[str, Any]) -> None:
+        """Queue a model or row for writing, waiting if too many are pending"""
+        self._raise_if_closed()
+
+        async with self._drained:
+            await self._drained.wait_for(
+                lambda: len(self._pending) < self.max_pending or self._stopped()
+            )
+        self._raise_if_closed()
+        if len(self._pending) >= self.max_pending:
+            # The flusher is gone, so nothing would ever make room
+            raise RuntimeError(
+                f"Buffer for {self.table.__tablename__} stopped flushing"
+            )
+
+        row = model if isinstance(model, dict) else model.model_dump()
+        key = tuple(row[column] for column in self.index_elements)
+        size = sum(sys.getsizeof(value) for value in row.values())
+
+        self._pending_bytes += size - self._sizes.get(key, 0)
+        self._pending[key] = row
+        self._sizes[key] = size
+
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+            self._wakeup.set()
+
+        if len(self._pending) >= self.max_rows or self._pending_bytes >= self.max_bytes:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write all pending rows now"""
+        if not self._pending:
+            return
+
+        rows, sizes = self._pending, self._sizes
+        self._pending, self._sizes = {}, {}
+        self._pending_bytes = 0
+        self._oldest = None
+
+        # Swapping out the pending rows frees room for blocked producers
+        async with self._drained:
+            self._drained.notify_all()
+
+        try:
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    await self.write(session, list(rows.values()))
+        except Exception:
+            # Keep the rows for the next attempt without clobbering newer writes
+            for key, row in rows.items():
+                if key not in self._pending:
+                    self._pending[key] = row
+                    self._sizes[key] = sizes[key]
+                    self._pending_bytes += sizes[key]
+            self._oldest = self._oldest or time.monotonic()
+            raise
+
+        self.rows_written += len(rows)
+        self.flushes += 1
+
+    async def close(self) -> None:
+        """
+        Stop the background flusher and write anything still pending.
+
+        Rows a failed background flush kept are tried once more; if that fails
+        too, the error is raised after logging how many rows were dropped.
+        """
+        self._closed = True
+        self._wakeup.set()
+        # Producers waiting for room would never get it
+        async with self._drained:
+            self._drained.notify_all()
+
+        if self._flusher is not None:
+            await self._flusher
+            self._flusher = None
+
+        try:
+            await self.flush()
+        except Exception:
+            logging.error(
+                f"Dropped {len(self._pending)} unwritten rows "
+                f"of {self.table.__tablename__}"
+            )
+            raise
+
+        if self._error is not None:
+            logging.warning(
+                f"Buffer for {self.table.__tablename__} recovered on close "
+                f"from: {self._error!r}"
+            )
+
+        logging.debug(
+            f"Closed buffer for {self.table.__tablename__}: "
+            f"{self.rows_written} rows in {self.flushes} flushes"
+        )
+
+    async def _upsert(self, session: AsyncSession, rows: List[dict[str, Any]]) -> None:
+        # Imported here, as database.ingestion builds its buffers from this module
+        from database.ingestion import _upsert
+
+        await _upsert(session, self.table, rows, self.index_elements)
+
+    async def _run(self) -> None:
+        try:
+            while not self._closed:
+                timeout = None
+                if self._oldest is not None:
+                    timeout = max(
+                        0.0, self._oldest + self.max_latency - time.monotonic()
+                    )
+
+                if self._retry_at is not None:
+                    timeout = max(0.0, self._retry_at - time.monotonic())
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+                if self._closed:
+                    break
+
+                now = time.monotonic()
+                if self._retry_at is not None and now < self._retry_at:
+                    # Full buffers wake the flusher, but must not cut a backoff short
+                    continue
+
+                due = (
+                    self._oldest is not None and now - self._oldest >= self.max_latency
+                )
+                if (
+                    due
+                    or len(self._pending) >= self.max_rows
+                    or self._pending_bytes >= self.max_bytes
+                ):
+                    await self._flush_or_back_off()
+
+        finally:
+            self._flushing = False
+            async with self._drained:
+                self._drained.notify_all()
+
+    async def _flush_or_back_off(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exception:
+            # flush() kept the rows, so they go out with the next attempt
+            self._error = exception
+            self._retry_delay = min(
+                max(self._retry_delay * 2, self.max_latency), MAX_RETRY_DELAY
+            )
+            self._retry_at = time.monotonic() + self._retry_delay
+            logging.warning(
+                f"Flush of {len(self._pending)} rows of {self.table.__tablename__} "
+                f"failed, retrying in {self._retry_delay:.1f}s: {exception!r}"
+            )
+            return
+
+        if self._error is not None:
+            logging.info(f"Buffer for {self.table.__tablename__} is flushing again")
+        self._error = None
+        self._retry_delay = 0.0
+        self._retry_at = None
+
+    def _stopped(self) -> bool:
+        return self._closed or not self._flushing
+
+    def _raise_if_closed(self) -> None:
+        if self._closed:
+            raise RuntimeError(f"Buffer for {self.table.__tablename__} is closed")
@@ -2,10 +2,8 @@
 MLB-specific database configuration and session management.
 """
 
-from common.database.config import create_async_db_engine, create_session_maker
+from common.database.config import LazySessionMaker
 
-# Create async engine (set echo=True for SQL query logging during development)
-engine = create_async_db_engine(echo=True)
-
-# Create async session factory
-AsyncSessionLocal = create_session_maker(engine)
+# Async session factory; the engine is created on first use with the batch
+# profile unless DB_PROFILE names another (dev logs every statement)
+AsyncSessionLocal = LazySessionMaker()
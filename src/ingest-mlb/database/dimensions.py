@@ -0,0 +1,269 @@
+"""
+In-memory copy of the dimension tables.
+
+Game, schedule and game log rows carry team, venue, position and label IDs
+only. On the way in, Dimensions records the names an extractor found and swaps
+repeated strings for label IDs, reaching the database only for values it has
+not seen; on the way out it resolves IDs back to names without a join.
+
+Dimension rows are written in their own short transactions, so an ID handed
+out here exists whatever becomes of the transaction that uses it.
+"""
+
+import time
+from typing import Any, Callable, Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.config import AsyncSessionLocal
+from database.models import Label, Position, Team, Venue
+
+# Repeated strings of a game row and the label ID columns that replace them
+GAME_LABELS = {
+    "wind": "wind_id",
+    "weather_condition": "weather_condition_id",
+}
+
+# Least seconds between reloads forced by IDs missing from the copy
+RELOAD_INTERVAL = 5.0
+
+# Name columns extractors produce that the tables no longer store
+GAME_NAMES = ("venue_name", "home_team_name", "away_team_name")
+SCHEDULE_NAMES = ("home_team_name", "away_team_name")
+GAME_LOG_NAMES = ("position_name", "position_type")
+
+
+def _without(row: dict[str, Any], columns: Iterable[str]) -> dict[str, Any]:
+    return {key: value for key, value in row.items() if key not in columns}
+
+
+class Dimensions:
+    """
+    Args:
+        sessions: Session factory, the ingest one by default
+        max_age: Seconds before the copy is reloaded to pick up rows that
+                 other processes wrote
+    """
+
+    def __init__(
+        self, sessions: Callable[[], AsyncSession] | None = None, max_age: float = 300.0
+    ) -> None:
+        self.sessions = sessions if sessions is not None else AsyncSessionLocal
+        self.max_age = max_age
+        self.loaded_at: float | None = None
+        self.teams: dict[tuple[int, int], str] = {}
+        self.venues: dict[tuple[int, int], str] = {}
+        self.positions: dict[str, tuple[str | None, str | None]] = {}
+        self.labels: dict[int, str] = {}
+        self._label_ids: dict[tuple[str, str], int] = {}
+
+    async def load(self) -> None:
+        """Replace the copy with the current dimension tables"""
+        async with self.sessions() as session:
+            teams = await session.execute(select(Team.season, Team.team_id, Team.name))
+            venues = await session.execute(
+                select(Venue.season, Venue.venue_id, Venue.name)
+            )
+            positions = await session.execute(
+                select(Position.position_code, Position.name, Position.type)
+            )
+            labels = await session.execute(
+                select(Label.label_id, Label.kind, Label.value)
+            )
+
+            self.teams = {(season, id_): name for season, id_, name in teams}
+            self.venues = {(season, id_): name for season, id_, name in venues}
+            self.positions = {code: (name, type_) for code, name, type_ in positions}
+            self.labels, self._label_ids = {}, {}
+            for label_id, kind, value in labels:
+                self.labels[label_id] = value
+                self._label_ids[(kind, value)] = label_id
+
+        self.loaded_at = time.monotonic()
+
+    async def ensure_loaded(self) -> None:
+        if self.loaded_at is None or time.monotonic() - self.loaded_at > self.max_age:
+            await self.load()
+
+    def forget(self) -> None:
+        """Reload on next use, e.g. after the reference routine rewrote names"""
+        self.loaded_at = None
+
+    async def _insert_missing(self, table: Any, rows: List[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        async with self.sessions() as session:
+            async with session.begin():
+                # Full records from the reference routine take precedence
+                await session.execute(
+                    pg_insert(table).values(rows).on_conflict_do_nothing()
+                )
+
+    async def _observe_teams(self, rows: Iterable[tuple[int, int, str]]) -> None:
+        new = {
+            (season, team_id): name
+            for season, team_id, name in rows
+            if team_id is not None
+            and name is not None
+            and (season, team_id) not in self.teams
+        }
+        await self._insert_missing(
+            Team,
+            [
+                {"season": season, "team_id": team_id, "name": name}
+                for (season, team_id), name in new.items()
+            ],
+        )
+        self.teams.update(new)
+
+    async def _observe_venues(self, rows: Iterable[tuple[int, int, str]]) -> None:
+        new = {
+            (season, venue_id): name
+            for season, venue_id, name in rows
+            if venue_id is not None
+            and name is not None
+            and (season, venue_id) not in self.venues
+        }
+        await self._insert_missing(
+            Venue,
+            [
+                {"season": season, "venue_id": venue_id, "name": name}
+                for (season, venue_id), name in new.items()
+            ],
+        )
+        self.venues.update(new)
+
+    async def _observe_positions(self, rows: Iterable[dict[str, Any]]) -> None:
+        new = {
+            row["position_code"]: (row.get("position_name"), row.get("position_type"))
+            for row in rows
+            if row.get("position_code") is not None
+            and row["position_code"] not in self.positions
+        }
+        await self._insert_missing(
+            Position,
+            [
+                {"position_code": code, "name": name, "type": type_}
+                for code, (name, type_) in new.items()
+            ],
+        )
+        self.positions.update(new)
+
+    async def intern(self, kind: str, values: Iterable[str | None]) -> dict[str, int]:
+        """Label IDs of the values, creating labels for ones never seen"""
+        wanted = {value for value in values if value is not None}
+        missing = [value for value in wanted if (kind, value) not in self._label_ids]
+
+        if missing:
+            async with self.sessions() as session:
+                async with session.begin():
+                    await session.execute(
+                        pg_insert(Label)
+                        .values([{"kind": kind, "value": value} for value in missing])
+                        .on_conflict_do_nothing(index_elements=["kind", "value"])
+                    )
+                    # Labels another process created first are read back too
+                    result = await session.execute(
+                        select(Label.label_id, Label.value).where(
+                            Label.kind == kind, Label.value.in_(missing)
+                        )
+                    )
+                    created = result.all()
+
+            for label_id, value in created:
+                self.labels[label_id] = value
+                self._label_ids[(kind, value)] = label_id
+
+        return {value: self._label_ids[(kind, value)] for value in wanted}
+
+    async def intern_schedules(
+        self, rows: List[dict[str, Any]]
+    ) -> List[dict[str, Any]]:
+        """Schedule rows with team names recorded and left out"""
+        await self.ensure_loaded()
+        await self._observe_teams(
+            (row["season"], row[f"{side}_team_id"], row.get(f"{side}_team_name"))
+            for row in rows
+            for side in ("home", "away")
+        )
+        return [_without(row, SCHEDULE_NAMES) for row in rows]
+
+    async def intern_games(self, rows: List[dict[str, Any]]) -> List[dict[str, Any]]:
+        """Game rows with names recorded and left out, and strings as label IDs"""
+        await self.ensure_loaded()
+        await self._observe_teams(
+            (row["season"], row[f"{side}_team_id"], row.get(f"{side}_team_name"))
+            for row in rows
+            for side in ("home", "away")
+        )
+        await self._observe_venues(
+            (row["season"], row["venue_id"], row.get("venue_name")) for row in rows
+        )
+        ids = {
+            column: await self.intern(column, (row.get(column) for row in rows))
+            for column in GAME_LABELS
+        }
+
+        return [
+            {
+                **_without(row, (*GAME_NAMES, *GAME_LABELS)),
+                **{
+                    id_column: ids[column].get(row.get(column))
+                    for column, id_column in GAME_LABELS.items()
+                },
+            }
+            for row in rows
+        ]
+
+    async def intern_game_logs(
+        self, rows: List[dict[str, Any]]
+    ) -> List[dict[str, Any]]:
+        """Game log rows with position names recorded and left out"""
+        await self.ensure_loaded()
+        await self._observe_positions(rows)
+        return [_without(row, GAME_LOG_NAMES) for row in rows]
+
+    def _known(self, row: dict[str, Any]) -> bool:
+        season = row["season"]
+        return (
+            all(
+                row[f"{side}_team_id"] is None
+                or (season, row[f"{side}_team_id"]) in self.teams
+                for side in ("home", "away")
+            )
+            and (row["venue_id"] is None or (season, row["venue_id"]) in self.venues)
+            and all(
+                row[id_column] is None or row[id_column] in self.labels
+                for id_column in GAME_LABELS.values()
+            )
+        )
+
+    async def resolve_games(self, rows: List[dict[str, Any]]) -> List[dict[str, Any]]:
+        """Stored game rows with names filled back in"""
+        await self.ensure_loaded()
+        # Rows can reference labels another process created since the last load
+        if time.monotonic() - self.loaded_at > RELOAD_INTERVAL and not all(
+            self._known(row) for row in rows
+        ):
+            await self.load()
+        return [self.resolve_game(row) for row in rows]
+
+    def resolve_game(self, row: dict[str, Any]) -> dict[str, Any]:
+        """A stored game row with its names and labels filled back in"""
+        season = row["season"]
+        return {
+            **_without(row, GAME_LABELS.values()),
+            "venue_name": self.venues.get((season, row["venue_id"])),
+            "home_team_name": self.teams.get((season, row["home_team_id"])),
+            "away_team_name": self.teams.get((season, row["away_team_id"])),
+            **{
+                column: self.labels.get(row[id_column])
+                for column, id_column in GAME_LABELS.items()
+            },
+        }
+
+
+# Shared by every ingest routine in the process
+dimensions = Dimensions()
@@ -0,0 +1,48 @@
+"""
+In-process change notifications for the ingest path.
+
+Ingestion records the rows it writes on the session; once the transaction
+commits, every subscribed listener is called with the table name and rows.
+Rolled back transactions are never published.
+"""
+
+import logging
+from typing import Any, Callable, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+Listener = Callable[[str, List[dict[str, Any]]], None]
+
+_PENDING_KEY = "pending_changes"
+
+_listeners: List[Listener] = []
+
+
+def subscribe(listener: Listener) -> Callable[[], None]:
+    """Register a listener for committed changes and return its unsubscribe"""
+    _listeners.append(listener)
+    return lambda: _listeners.remove(listener)
+
+
+def record(session: AsyncSession, table: str, rows: List[dict[str, Any]]) -> None:
+    """Stage rows written in this session for publishing on commit"""
+    if _listeners and rows:
+        session.info.setdefault(_PENDING_KEY, []).append((table, rows))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish(session: Session) -> None:
+    for table, rows in session.info.pop(_PENDING_KEY, []):
+        for listener in list(_listeners):
+            try:
+                listener(table, rows)
+            except Exception:
+                # A misbehaving subscriber must never fail ingestion
+                logging.exception(f"Change listener failed for {table}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
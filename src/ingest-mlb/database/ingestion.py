@@ -1,9 +1,54 @@
-from typing import List
+import json
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, AsyncIterable, Iterable, List
 
+from sqlalchemy import delete, select, tuple_, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.models import dump_records
+
+from database import events
+from database.aggregates import (
+    group_by_season,
+    refresh_player_aggregates,
+    refresh_team_aggregates,
+)
+from database.buffer import WriteBehindBuffer
 from database.config import AsyncSessionLocal
-from database.models import TeamSchedule
+from database.dimensions import dimensions
+from database.matchups import refresh_matchups
+from database.models import (
+    AtBat,
+    BatterGameLog,
+    BeatTheStreakScore,
+    DeadLetter,
+    GameInformation,
+    PitchEvent,
+    PitcherGameLog,
+    Player,
+    PlayerSeasonBattingStats,
+    PlayerSeasonPitchingStats,
+    Team,
+    TeamSchedule,
+    Venue,
+)
+from database.partitions import ensure_season_partitions, is_partitioned
+
+# PostgreSQL caps a single statement at 32767 bind parameters
+MAX_BIND_PARAMETERS = 32767
+
+# Game log tables keyed by the Pydantic model a batch was built from
+GAME_LOG_TABLES = {
+    "BatterGameLog": BatterGameLog,
+    "PitcherGameLog": PitcherGameLog,
+}
+
+GAME_KEYS = ["season", "game_id"]
+GAME_LOG_KEYS = ["season", "game_id", "player_id"]
+AT_BAT_KEYS = ["game_id", "at_bat_index"]
+PITCH_KEYS = ["game_id", "at_bat_index", "event_index"]
 
 
 async def ingest_schedules(schedules: List) -> int:
@@ -19,34 +64,433 @@ async def ingest_schedules(schedules: List) -> int:
     Returns:
         Number of schedules processed
     """
+    # Convert Pydantic models to dicts for bulk insert
+    # The schedules are already validated Pydantic models from mlb.py
+    schedule_dicts = await dimensions.intern_schedules(
+        dump_records(list({s.game_id: s for s in schedules}.values()))
+    )
+
     async with AsyncSessionLocal() as session:
         async with session.begin():
-            # Convert Pydantic models to dicts for bulk insert
-            # The schedules are already validated Pydantic models from mlb.py
-            schedule_dicts = [
-                {
-                    "game_date": s.game_date,
-                    "game_id": s.game_id,
-                    "home_team_id": s.home_team_id,
-                    "home_team_name": s.home_team_name,
-                    "away_team_id": s.away_team_id,
-                    "away_team_name": s.away_team_name,
-                }
-                for s in schedules
-            ]
 
-            # Upsert: Insert or update on conflict (duplicate game_id)
+            await ensure_season_partitions(
+                session,
+                TeamSchedule.__tablename__,
+                (s["season"] for s in schedule_dicts),
+            )
+
+            # Upsert: Insert or update on conflict (duplicate season, game_id)
             stmt = pg_insert(TeamSchedule).values(schedule_dicts)
             stmt = stmt.on_conflict_do_update(
-                index_elements=["game_id"],
+                index_elements=["season", "game_id"],
                 set_={
                     "game_date": stmt.excluded.game_date,
-                    "home_team_name": stmt.excluded.home_team_name,
-                    "away_team_name": stmt.excluded.away_team_name,
+                    "venue_id": stmt.excluded.venue_id,
+                    # Starters are announced, and changed, after the first fetch
+                    "home_probable_pitcher_id": stmt.excluded.home_probable_pitcher_id,
+                    "away_probable_pitcher_id": stmt.excluded.away_probable_pitcher_id,
                 },
             )
 
             await session.execute(stmt)
+            events.record(session, TeamSchedule.__tablename__, schedule_dicts)
             await session.commit()
 
     return len(schedules)
+
+
+async def _upsert(
+    session: AsyncSession,
+    table: Any,
+    rows: List[dict[str, Any]],
+    index_elements: List[str],
+) -> None:
+    """
+    Upsert rows, overwriting every non-key column on conflict.
+
+    Rows are split across statements so each stays under the bind parameter limit.
+    """
+    if not rows:
+        return
+
+    # A statement may not touch the same row twice, so the last version wins
+    rows = list({tuple(row[c] for c in index_elements): row for row in rows}.values())
+
+    if is_partitioned(table):
+        await ensure_season_partitions(
+            session, table.__tablename__, (row["season"] for row in rows)
+        )
+
+    chunk_size = max(1, MAX_BIND_PARAMETERS // len(rows[0]))
+
+    for start in range(0, len(rows), chunk_size):
+        stmt = pg_insert(table).values(rows[start : start + chunk_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={
+                column: stmt.excluded[column]
+                for column in rows[0]
+                if column not in index_elements
+            },
+        )
+        await session.execute(stmt)
+
+    events.record(session, table.__tablename__, rows)
+
+
+async def _write_game_information(
+    session: AsyncSession, rows: List[dict[str, Any]]
+) -> None:
+    rows = await dimensions.intern_games(rows)
+    await _upsert(session, GameInformation, rows, GAME_KEYS)
+
+    # Finished games change both teams' records
+    seasons = group_by_season(rows, "home_team_id", "away_team_id")
+    for season, team_ids in seasons.items():
+        await refresh_team_aggregates(session, season, team_ids - {None})
+
+
+async def _write_game_logs(
+    table: Any, session: AsyncSession, rows: List[dict[str, Any]]
+) -> None:
+    rows = await dimensions.intern_game_logs(rows)
+    await _upsert(session, table, rows, GAME_LOG_KEYS)
+
+    # Roll up only the players and teams these rows touched
+    for season, player_ids in group_by_season(rows, "player_id").items():
+        await refresh_player_aggregates(session, table, season, player_ids)
+    for season, team_ids in group_by_season(rows, "team_id").items():
+        await refresh_team_aggregates(session, season, team_ids)
+
+
+async def _write_plays(session: AsyncSession, rows: List[dict[str, Any]]) -> None:
+    # Each at-bat row carries its pitch rows until they are split off here
+    at_bats = [{k: v for k, v in row.items() if k != "pitches"} for row in rows]
+    await _upsert(session, AtBat, at_bats, AT_BAT_KEYS)
+    await _upsert(
+        session,
+        PitchEvent,
+        [pitch for row in rows for pitch in row["pitches"]],
+        PITCH_KEYS,
+    )
+
+    # Only the pairs that met in these at-bats have new history
+    await refresh_matchups(
+        session, {(row["batter_id"], row["pitcher_id"]) for row in at_bats}
+    )
+
+
+def game_information_buffer(**kwargs) -> WriteBehindBuffer:
+    """Buffer that writes game rows as ingest_game_information does"""
+    return WriteBehindBuffer(
+        GameInformation, GAME_KEYS, write=_write_game_information, **kwargs
+    )
+
+
+def game_log_buffer(model_name: str, **kwargs) -> WriteBehindBuffer:
+    """Buffer that writes one kind of game log rows as ingest_game_logs does"""
+    table = GAME_LOG_TABLES[model_name]
+    return WriteBehindBuffer(
+        table, GAME_LOG_KEYS, write=partial(_write_game_logs, table), **kwargs
+    )
+
+
+def play_buffer(**kwargs) -> WriteBehindBuffer:
+    """Buffer that writes at-bats with their pitches as ingest_plays does"""
+    return WriteBehindBuffer(AtBat, AT_BAT_KEYS, write=_write_plays, **kwargs)
+
+
+async def ingest_game_information(
+    games: List, buffer: WriteBehindBuffer | None = None
+) -> int:
+    """
+    Ingest MLB game information into the database.
+
+    Args:
+        games: List of validated Pydantic GameInformation objects
+               (already validated by mlb.process_game_information)
+        buffer: game_information_buffer() to write behind, e.g. while polling;
+                without one the games are written before this returns
+
+    Returns:
+        Number of games processed
+    """
+    if buffer is not None:
+        for game in games:
+            await buffer.put(game)
+        return len(games)
+
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await _write_game_information(session, dump_records(games))
+
+    return len(games)
+
+
+async def ingest_game_logs(batch, buffer: WriteBehindBuffer | None = None) -> int:
+    """
+    Ingest a columnar batch of batter or pitcher game logs.
+
+    Args:
+        batch: GameLogBatch (as returned by mlb.process_game_log_batch); the
+               target table follows from the batch's model
+        buffer: game_log_buffer() of the batch's model to write behind;
+                without one the batch is written before this returns
+
+    Returns:
+        Number of game logs processed
+    """
+    if buffer is not None:
+        for row in batch.to_rows():
+            await buffer.put(row)
+        return len(batch)
+
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await _write_game_logs(
+                GAME_LOG_TABLES[batch.model.__name__], session, batch.to_rows()
+            )
+
+    return len(batch)
+
+
+async def ingest_plays(
+    plays: AsyncIterable,
+    batch_size: int = 500,
+    buffer: WriteBehindBuffer | None = None,
+) -> int:
+    """
+    Ingest MLB at-bats and pitch events from a play stream.
+
+    Plays are consumed as they are produced and written behind by a buffer
+    every batch_size at-bats, so the stream keeps being read while a batch is
+    written and memory stays bounded no matter how many games it covers.
+
+    Args:
+        plays: Async iterable of (AtBat, List[PitchEvent]) Pydantic models
+               (as yielded by mlb.stream_plays)
+        batch_size: Number of at-bats per upsert transaction
+        buffer: play_buffer() shared across calls, e.g. by live polling, and
+                closed by the caller; by default one is opened for the stream
+                and every play is written before this returns
+
+    Returns:
+        Number of at-bats processed
+    """
+    if buffer is None:
+        async with play_buffer(max_rows=batch_size) as buffer:
+            return await ingest_plays(plays, buffer=buffer)
+
+    count = 0
+    async for at_bat, pitch_events in plays:
+        await buffer.put({**at_bat.model_dump(), "pitches": dump_records(pitch_events)})
+        count += 1
+
+    return count
+
+
+async def ingest_player_season_stats(batting: List, pitching: List) -> int:
+    """
+    Ingest player season batting and pitching lines.
+
+    Args:
+        batting: List of validated Pydantic PlayerSeasonBattingStats objects
+        pitching: List of validated Pydantic PlayerSeasonPitchingStats objects
+                  (both as returned by mlb.process_player_season_stats)
+
+    Returns:
+        Number of season lines processed
+    """
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await _upsert(
+                session,
+                PlayerSeasonBattingStats,
+                dump_records(batting),
+                ["player_id", "season"],
+            )
+            await _upsert(
+                session,
+                PlayerSeasonPitchingStats,
+                dump_records(pitching),
+                ["player_id", "season"],
+            )
+
+    return len(batting) + len(pitching)
+
+
+def _table_rows(table: Any, records: List, **values: Any) -> List[dict[str, Any]]:
+    """Dumped records limited to the table's columns, with fixed values added"""
+    columns = set(table.__table__.columns.keys())
+    return [
+        {**{key: value for key, value in row.items() if key in columns}, **values}
+        for row in dump_records(records)
+    ]
+
+
+async def ingest_reference(
+    season: int, teams: List, venues: List, players: List
+) -> int:
+    """
+    Upsert a season's teams, venues and players into the dimension tables.
+
+    Names first recorded from game feeds are overwritten with the full records.
+
+    Args:
+        season: Season the teams and venues are listed for
+        teams: List of validated Pydantic Team objects
+        venues: List of validated Pydantic Venue objects
+        players: List of validated Pydantic Player objects
+                 (as returned by mlb.process_teams, process_venues and
+                 process_players)
+
+    Returns:
+        Number of records processed
+    """
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await _upsert(
+                session,
+                Team,
+                _table_rows(Team, teams, season=season),
+                ["season", "team_id"],
+            )
+            await _upsert(
+                session,
+                Venue,
+                _table_rows(Venue, venues, season=season),
+                ["season", "venue_id"],
+            )
+            await _upsert(session, Player, _table_rows(Player, players), ["player_id"])
+
+    dimensions.forget()
+    return len(teams) + len(venues) + len(players)
+
+
+async def ingest_scores(rows: List[dict[str, Any]]) -> int:
+    """
+    Replace the stored Beat the Streak scores of every game in rows.
+
+    Args:
+        rows: Score rows (as returned by scoring.score_rows)
+
+    Returns:
+        Number of scores written
+    """
+    game_ids = list({row["game_id"] for row in rows})
+
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            # Batters dropped from a lineup must not keep an earlier score
+            await session.execute(
+                delete(BeatTheStreakScore).where(
+                    BeatTheStreakScore.game_id.in_(game_ids)
+                )
+            )
+            await _upsert(session, BeatTheStreakScore, rows, ["game_id", "player_id"])
+
+    return len(rows)
+
+
+async def record_dead_letters(items: List) -> int:
+    """
+    Store items that failed during a run so they can be retried.
+
+    An item that failed before has its error and payload replaced, its attempt
+    count raised and, if it had been resolved, is pending again.
+
+    Args:
+        items: List of deadletter.FailedItem (as collected by deadletter.collect)
+
+    Returns:
+        Number of distinct items stored
+    """
+    now = datetime.now(timezone.utc)
+
+    # The same game can fail several times in one run, e.g. once per bad play
+    rows = list(
+        {
+            (item.kind, item.key): {
+                "kind": item.kind,
+                "item_key": item.key,
+                "stage": item.stage,
+                "error": item.error,
+                # Validators may have left dates etc. in a payload
+                "payload": json.loads(json.dumps(item.payload, default=str)),
+                "params": json.loads(json.dumps(item.params, default=str)),
+                "attempts": 1,
+                "first_failed_at": now,
+                "last_failed_at": now,
+                "resolved_at": None,
+            }
+            for item in items
+        }.values()
+    )
+    if not rows:
+        return 0
+
+    chunk_size = MAX_BIND_PARAMETERS // len(rows[0])
+
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            for start in range(0, len(rows), chunk_size):
+                stmt = pg_insert(DeadLetter).values(rows[start : start + chunk_size])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["kind", "item_key"],
+                    set_={
+                        "stage": stmt.excluded.stage,
+                        "error": stmt.excluded.error,
+                        "payload": stmt.excluded.payload,
+                        "params": stmt.excluded.params,
+                        "attempts": DeadLetter.attempts + 1,
+                        "last_failed_at": stmt.excluded.last_failed_at,
+                        "resolved_at": None,
+                    },
+                )
+                await session.execute(stmt)
+
+    return len(rows)
+
+
+async def pending_dead_letters() -> List[dict[str, Any]]:
+    """
+    Failed items that have not been retried successfully yet.
+
+    Returns:
+        kind, item_key and params of each pending item, oldest failure first
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(DeadLetter.kind, DeadLetter.item_key, DeadLetter.params)
+            .where(DeadLetter.resolved_at.is_(None))
+            .order_by(DeadLetter.first_failed_at)
+        )
+        return [dict(row) for row in result.mappings()]
+
+
+async def resolve_dead_letters(keys: Iterable[tuple[str, str]]) -> int:
+    """
+    Mark items as resolved after a retry processed them without failing.
+
+    Args:
+        keys: (kind, item_key) pairs
+
+    Returns:
+        Number of items resolved
+    """
+    keys = list(keys)
+    if not keys:
+        return 0
+
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            result = await session.execute(
+                update(DeadLetter)
+                .where(
+                    tuple_(DeadLetter.kind, DeadLetter.item_key).in_(keys),
+                    DeadLetter.resolved_at.is_(None),
+                )
+                .values(resolved_at=datetime.now(timezone.utc))
+            )
+
+    return result.rowcount
@@ -0,0 +1,185 @@
+"""
+Batter-vs-pitcher matchup index maintained from the at_bats table.
+
+Like the season rollups, a refresh recomputes the whole row of every affected
+(batter, pitcher) pair from its at-bats, so replaying plays is idempotent and a
+full rebuild is the same statement without a pair filter. Slates are read back
+with one query over all of their pairs.
+"""
+
+from typing import Any, Iterable, List
+
+from sqlalchemy import (
+    Integer,
+    SmallInteger,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.aggregates import upsert_from_select
+from database.models import AtBat, BatterPitcherMatchup
+
+# Most recent plate appearances of a pair counted in the recent_* columns
+RECENT_PLATE_APPEARANCES = 20
+
+HIT_EVENTS = ("single", "double", "triple", "home_run")
+EXTRA_BASE_HIT_EVENTS = ("double", "triple", "home_run")
+WALK_EVENTS = ("walk", "intent_walk")
+STRIKE_OUT_EVENTS = ("strikeout", "strikeout_double_play", "strikeout_triple_play")
+# Plate appearances that are not official at-bats
+NON_AT_BAT_EVENTS = (
+    *WALK_EVENTS,
+    "hit_by_pitch",
+    "sac_fly",
+    "sac_fly_double_play",
+    "sac_bunt",
+    "sac_bunt_double_play",
+    "catcher_interf",
+)
+# Inning-ending outs on the bases; the batter's plate appearance did not end,
+# and the next inning starts it over
+NON_PLATE_APPEARANCE_EVENTS = (
+    "caught_stealing_2b",
+    "caught_stealing_3b",
+    "caught_stealing_home",
+    "pickoff_1b",
+    "pickoff_2b",
+    "pickoff_3b",
+    "pickoff_caught_stealing_2b",
+    "pickoff_caught_stealing_3b",
+    "pickoff_caught_stealing_home",
+    "other_out",
+)
+
+
+def _pairs(pairs: Iterable[tuple[int, int]]) -> Any:
+    """Pairs as a two-column relation bound as two array parameters"""
+    batter_ids, pitcher_ids = zip(*pairs)
+    return select(
+        *(
+            func.unnest(
+                bindparam(name, list(ids), type_=ARRAY(Integer), unique=True)
+            ).label(name)
+            for name, ids in (("batter_id", batter_ids), ("pitcher_id", pitcher_ids))
+        )
+    ).subquery("pairs")
+
+
+def _count(condition: Any = None) -> Any:
+    count = func.count() if condition is None else func.count().filter(condition)
+    return cast(count, SmallInteger)
+
+
+async def refresh_matchups(
+    session: AsyncSession, pairs: Iterable[tuple[int, int]] | None = None
+) -> dict[str, int]:
+    """
+    Recompute the matchup rows of batter/pitcher pairs from their at-bats.
+
+    Args:
+        session: Session whose transaction the refresh joins
+        pairs: (batter_id, pitcher_id) pairs to refresh, or None for every pair
+
+    Returns:
+        Rows written to the matchup table
+    """
+    at_bats = AtBat.__table__
+    source = select(
+        at_bats.c.batter_id,
+        at_bats.c.pitcher_id,
+        at_bats.c.event_type,
+        at_bats.c.start_time,
+    ).where(
+        at_bats.c.is_complete,
+        at_bats.c.event_type.is_not(None),
+        at_bats.c.event_type.not_in(NON_PLATE_APPEARANCE_EVENTS),
+    )
+
+    if pairs is not None:
+        pairs = sorted(set(pairs))
+        if not pairs:
+            return {BatterPitcherMatchup.__tablename__: 0}
+        keys = _pairs(pairs)
+        source = source.join(
+            keys,
+            and_(
+                at_bats.c.batter_id == keys.c.batter_id,
+                at_bats.c.pitcher_id == keys.c.pitcher_id,
+            ),
+        )
+
+    ranked = source.add_columns(
+        func.row_number()
+        .over(
+            partition_by=(at_bats.c.batter_id, at_bats.c.pitcher_id),
+            order_by=(
+                at_bats.c.start_time.desc().nulls_last(),
+                at_bats.c.game_id.desc(),
+                at_bats.c.at_bat_index.desc(),
+            ),
+        )
+        .label("recency")
+    ).subquery()
+
+    event = ranked.c.event_type
+    recent = ranked.c.recency <= RECENT_PLATE_APPEARANCES
+    query = select(
+        ranked.c.batter_id,
+        ranked.c.pitcher_id,
+        func.max(ranked.c.start_time).label("last_faced"),
+        _count().label("plate_appearances"),
+        _count(event.not_in(NON_AT_BAT_EVENTS)).label("at_bats"),
+        _count(event.in_(HIT_EVENTS)).label("hits"),
+        _count(event.in_(EXTRA_BASE_HIT_EVENTS)).label("extra_base_hits"),
+        _count(event == "home_run").label("home_runs"),
+        _count(event.in_(WALK_EVENTS)).label("base_on_balls"),
+        _count(event.in_(STRIKE_OUT_EVENTS)).label("strike_outs"),
+        _count(recent).label("recent_plate_appearances"),
+        _count(and_(recent, event.in_(HIT_EVENTS))).label("recent_hits"),
+    ).group_by(ranked.c.batter_id, ranked.c.pitcher_id)
+
+    return await upsert_from_select(session, BatterPitcherMatchup, query)
+
+
+async def rebuild_matchups(session: AsyncSession) -> List[tuple[str, int]]:
+    """Drop and recompute the whole matchup index"""
+    await session.execute(delete(BatterPitcherMatchup))
+    return list((await refresh_matchups(session)).items())
+
+
+async def load_matchups(
+    session: AsyncSession, pairs: Iterable[tuple[int, int]]
+) -> List[dict[str, Any]]:
+    """
+    Matchup rows for every pair of a slate in a single query.
+
+    Args:
+        session: Session to read with
+        pairs: (batter_id, pitcher_id) pairs to look up
+
+    Returns:
+        One row per pair that has faced each other; pairs without history are
+        left out
+    """
+    pairs = sorted(set(pairs))
+    if not pairs:
+        return []
+
+    keys = _pairs(pairs)
+    matchups = BatterPitcherMatchup.__table__
+    result = await session.execute(
+        select(matchups).join(
+            keys,
+            and_(
+                matchups.c.batter_id == keys.c.batter_id,
+                matchups.c.pitcher_id == keys.c.pitcher_id,
+            ),
+        )
+    )
+    return [dict(row) for row in result.mappings()]
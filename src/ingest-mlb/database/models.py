@@ -2,21 +2,573 @@
 SQLAlchemy models for MLB data ingestion.
 """
 
-from sqlalchemy import Integer, String
-from sqlalchemy.orm import Mapped, mapped_column
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import (
+    REAL,
+    Boolean,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 
 from common.database.base import Base
 
 
-class TeamSchedule(Base):
+class SeasonPartitioned:
+    """
+    Game-level table list-partitioned by season.
+
+    Partitions are named {table}_{season} and created on demand by
+    database.partitions; game_date gets a BRIN index, which stays tiny because
+    rows arrive in date order.
+    """
+
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Column lists of further B-tree indexes a table needs
+    extra_indexes: tuple[tuple[str, ...], ...] = ()
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple:
+        return (
+            Index(
+                f"ix_{cls.__tablename__}_game_date_brin",
+                "game_date",
+                postgresql_using="brin",
+            ),
+            *(
+                Index(f"ix_{cls.__tablename__}_{'_'.join(columns)}", *columns)
+                for columns in cls.extra_indexes
+            ),
+            {"postgresql_partition_by": "LIST (season)"},
+        )
+
+
+class TeamSchedule(SeasonPartitioned, Base):
     """MLB team schedule and game information."""
 
     __tablename__ = "team_schedules"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    game_date: Mapped[str] = mapped_column(String(10), index=True)
-    game_id: Mapped[int] = mapped_column(Integer, unique=True, index=True)
+    game_date: Mapped[date] = mapped_column(Date)
+    game_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     home_team_id: Mapped[int] = mapped_column(Integer)
-    home_team_name: Mapped[str] = mapped_column(String(100))
     away_team_id: Mapped[int] = mapped_column(Integer)
-    away_team_name: Mapped[str] = mapped_column(String(100))
+    venue_id: Mapped[int | None] = mapped_column(Integer)
+    home_probable_pitcher_id: Mapped[int | None] = mapped_column(Integer)
+    away_probable_pitcher_id: Mapped[int | None] = mapped_column(Integer)
+
+
+class AtBat(Base):
+    """Plate appearance outcome from a game's play-by-play feed."""
+
+    __tablename__ = "at_bats"
+    # Matchup refreshes read every at-bat of a batter/pitcher pair
+    __table_args__ = (
+        Index("ix_at_bats_batter_id_pitcher_id", "batter_id", "pitcher_id"),
+    )
+
+    game_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    at_bat_index: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    inning: Mapped[int | None] = mapped_column(SmallInteger)
+    half_inning: Mapped[str | None] = mapped_column(String(10))
+    batter_id: Mapped[int] = mapped_column(Integer, index=True)
+    pitcher_id: Mapped[int] = mapped_column(Integer, index=True)
+    bat_side_code: Mapped[str | None] = mapped_column(String(1))
+    pitch_hand_code: Mapped[str | None] = mapped_column(String(1))
+    event: Mapped[str | None] = mapped_column(String(50))
+    event_type: Mapped[str | None] = mapped_column(String(50))
+    description: Mapped[str | None] = mapped_column(String(500))
+    rbi: Mapped[int] = mapped_column(SmallInteger)
+    is_out: Mapped[bool | None] = mapped_column(Boolean)
+    balls: Mapped[int] = mapped_column(SmallInteger)
+    strikes: Mapped[int] = mapped_column(SmallInteger)
+    outs: Mapped[int] = mapped_column(SmallInteger)
+    away_score: Mapped[int | None] = mapped_column(SmallInteger)
+    home_score: Mapped[int | None] = mapped_column(SmallInteger)
+    pitch_count: Mapped[int] = mapped_column(SmallInteger)
+    start_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    end_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    is_complete: Mapped[bool] = mapped_column(Boolean)
+
+
+class PitchEvent(Base):
+    """Individual pitch within an at-bat."""
+
+    __tablename__ = "pitch_events"
+
+    game_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    at_bat_index: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    event_index: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    pitch_number: Mapped[int | None] = mapped_column(SmallInteger)
+    play_id: Mapped[str | None] = mapped_column(String(36))
+    call_code: Mapped[str | None] = mapped_column(String(5))
+    call_description: Mapped[str | None] = mapped_column(String(100))
+    pitch_type_code: Mapped[str | None] = mapped_column(String(5))
+    pitch_type_description: Mapped[str | None] = mapped_column(String(50))
+    is_in_play: Mapped[bool | None] = mapped_column(Boolean)
+    is_strike: Mapped[bool | None] = mapped_column(Boolean)
+    is_ball: Mapped[bool | None] = mapped_column(Boolean)
+    balls: Mapped[int] = mapped_column(SmallInteger)
+    strikes: Mapped[int] = mapped_column(SmallInteger)
+    outs: Mapped[int] = mapped_column(SmallInteger)
+    start_speed: Mapped[float | None] = mapped_column(REAL)
+    end_speed: Mapped[float | None] = mapped_column(REAL)
+    spin_rate: Mapped[int | None] = mapped_column(SmallInteger)
+    zone: Mapped[int | None] = mapped_column(SmallInteger)
+    launch_speed: Mapped[float | None] = mapped_column(REAL)
+    launch_angle: Mapped[float | None] = mapped_column(REAL)
+    total_distance: Mapped[float | None] = mapped_column(REAL)
+
+
+class PlayerSeasonBattingStats(Base):
+    """Season batting line with sabermetrics for a player."""
+
+    __tablename__ = "player_season_batting_stats"
+
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    team_id: Mapped[int | None] = mapped_column(Integer)
+    games_played: Mapped[int] = mapped_column(SmallInteger)
+    plate_appearances: Mapped[int] = mapped_column(SmallInteger)
+    at_bats: Mapped[int] = mapped_column(SmallInteger)
+    runs: Mapped[int] = mapped_column(SmallInteger)
+    hits: Mapped[int] = mapped_column(SmallInteger)
+    doubles: Mapped[int] = mapped_column(SmallInteger)
+    triples: Mapped[int] = mapped_column(SmallInteger)
+    home_runs: Mapped[int] = mapped_column(SmallInteger)
+    rbi: Mapped[int] = mapped_column(SmallInteger)
+    base_on_balls: Mapped[int] = mapped_column(SmallInteger)
+    strike_outs: Mapped[int] = mapped_column(SmallInteger)
+    hit_by_pitch: Mapped[int] = mapped_column(SmallInteger)
+    stolen_bases: Mapped[int] = mapped_column(SmallInteger)
+    caught_stealing: Mapped[int] = mapped_column(SmallInteger)
+    total_bases: Mapped[int] = mapped_column(SmallInteger)
+    avg: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    obp: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    slg: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    ops: Mapped[Decimal | None] = mapped_column(Numeric(5, 3))
+    babip: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    woba: Mapped[float | None] = mapped_column(REAL)
+    wrc_plus: Mapped[float | None] = mapped_column(REAL)
+    war: Mapped[float | None] = mapped_column(REAL)
+    speed_score: Mapped[float | None] = mapped_column(REAL)
+
+
+class PlayerSeasonPitchingStats(Base):
+    """Season pitching line with sabermetrics for a player."""
+
+    __tablename__ = "player_season_pitching_stats"
+
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    team_id: Mapped[int | None] = mapped_column(Integer)
+    games_played: Mapped[int] = mapped_column(SmallInteger)
+    games_started: Mapped[int] = mapped_column(SmallInteger)
+    wins: Mapped[int] = mapped_column(SmallInteger)
+    losses: Mapped[int] = mapped_column(SmallInteger)
+    saves: Mapped[int] = mapped_column(SmallInteger)
+    innings_pitched: Mapped[Decimal | None] = mapped_column(Numeric(5, 1))
+    outs: Mapped[int] = mapped_column(SmallInteger)
+    batters_faced: Mapped[int] = mapped_column(SmallInteger)
+    pitches_thrown: Mapped[int] = mapped_column(SmallInteger)
+    hits: Mapped[int] = mapped_column(SmallInteger)
+    earned_runs: Mapped[int] = mapped_column(SmallInteger)
+    home_runs: Mapped[int] = mapped_column(SmallInteger)
+    base_on_balls: Mapped[int] = mapped_column(SmallInteger)
+    strike_outs: Mapped[int] = mapped_column(SmallInteger)
+    era: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+    whip: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+    avg: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    strikeouts_per_9: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+    walks_per_9: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+    hits_per_9: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+    fip: Mapped[float | None] = mapped_column(REAL)
+    xfip: Mapped[float | None] = mapped_column(REAL)
+    era_minus: Mapped[float | None] = mapped_column(REAL)
+    war: Mapped[float | None] = mapped_column(REAL)
+
+
+class GameInformation(SeasonPartitioned, Base):
+    """
+    Game state, teams, venue, score and weather from the live feed.
+
+    Team and venue names live in the teams and venues tables, wind and weather
+    strings in labels; rows carry only their IDs.
+    """
+
+    __tablename__ = "game_information"
+
+    game_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    game_date: Mapped[date] = mapped_column(Date)
+    game_datetime: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    game_status: Mapped[str | None] = mapped_column(String(20))
+    detailed_state: Mapped[str | None] = mapped_column(String(50))
+    day_night: Mapped[str | None] = mapped_column(String(10))
+    venue_id: Mapped[int | None] = mapped_column(Integer)
+    home_team_id: Mapped[int | None] = mapped_column(Integer)
+    away_team_id: Mapped[int | None] = mapped_column(Integer)
+    home_wins: Mapped[int | None] = mapped_column(SmallInteger)
+    home_losses: Mapped[int | None] = mapped_column(SmallInteger)
+    home_win_pct: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    away_wins: Mapped[int | None] = mapped_column(SmallInteger)
+    away_losses: Mapped[int | None] = mapped_column(SmallInteger)
+    away_win_pct: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    home_score: Mapped[int | None] = mapped_column(SmallInteger)
+    away_score: Mapped[int | None] = mapped_column(SmallInteger)
+    wind_id: Mapped[int | None] = mapped_column(SmallInteger)
+    temperature: Mapped[int | None] = mapped_column(SmallInteger)
+    weather_condition_id: Mapped[int | None] = mapped_column(SmallInteger)
+
+
+class BatterGameLog(SeasonPartitioned, Base):
+    """Single-game batting line for a player."""
+
+    __tablename__ = "batter_game_logs"
+    # A player's most recent games first, for the read API
+    extra_indexes = (("player_id", "game_date", "game_id"),)
+
+    game_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    game_date: Mapped[date] = mapped_column(Date)
+    team_id: Mapped[int] = mapped_column(Integer, index=True)
+    opponent_team_id: Mapped[int] = mapped_column(Integer)
+    is_home: Mapped[bool] = mapped_column(Boolean)
+    position_code: Mapped[str | None] = mapped_column(String(10))
+    batting_summary: Mapped[str | None] = mapped_column(String(100))
+    games_played: Mapped[int] = mapped_column(SmallInteger)
+    at_bats: Mapped[int] = mapped_column(SmallInteger)
+    runs: Mapped[int] = mapped_column(SmallInteger)
+    hits: Mapped[int] = mapped_column(SmallInteger)
+    doubles: Mapped[int] = mapped_column(SmallInteger)
+    triples: Mapped[int] = mapped_column(SmallInteger)
+    home_runs: Mapped[int] = mapped_column(SmallInteger)
+    rbi: Mapped[int] = mapped_column(SmallInteger)
+    base_on_balls: Mapped[int] = mapped_column(SmallInteger)
+    intentional_walks: Mapped[int] = mapped_column(SmallInteger)
+    strike_outs: Mapped[int] = mapped_column(SmallInteger)
+    stolen_bases: Mapped[int] = mapped_column(SmallInteger)
+    caught_stealing: Mapped[int] = mapped_column(SmallInteger)
+    hit_by_pitch: Mapped[int] = mapped_column(SmallInteger)
+    sac_bunts: Mapped[int] = mapped_column(SmallInteger)
+    sac_flies: Mapped[int] = mapped_column(SmallInteger)
+    plate_appearances: Mapped[int] = mapped_column(SmallInteger)
+    total_bases: Mapped[int] = mapped_column(SmallInteger)
+    left_on_base: Mapped[int] = mapped_column(SmallInteger)
+    ground_into_double_play: Mapped[int] = mapped_column(SmallInteger)
+    ground_into_triple_play: Mapped[int] = mapped_column(SmallInteger)
+    catchers_interference: Mapped[int] = mapped_column(SmallInteger)
+    pickoffs: Mapped[int] = mapped_column(SmallInteger)
+    ground_outs: Mapped[int] = mapped_column(SmallInteger)
+    fly_outs: Mapped[int] = mapped_column(SmallInteger)
+    air_outs: Mapped[int] = mapped_column(SmallInteger)
+    pop_outs: Mapped[int] = mapped_column(SmallInteger)
+    line_outs: Mapped[int] = mapped_column(SmallInteger)
+    stolen_base_percentage: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    at_bats_per_home_run: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+
+
+class PitcherGameLog(SeasonPartitioned, Base):
+    """Single-game pitching line for a player."""
+
+    __tablename__ = "pitcher_game_logs"
+    # A player's most recent games first, for the read API
+    extra_indexes = (("player_id", "game_date", "game_id"),)
+
+    game_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    game_date: Mapped[date] = mapped_column(Date)
+    team_id: Mapped[int] = mapped_column(Integer, index=True)
+    opponent_team_id: Mapped[int] = mapped_column(Integer)
+    is_home: Mapped[bool] = mapped_column(Boolean)
+    position_code: Mapped[str | None] = mapped_column(String(10))
+    pitching_summary: Mapped[str | None] = mapped_column(String(100))
+    pitching_note: Mapped[str | None] = mapped_column(String(100))
+    games_played: Mapped[int] = mapped_column(SmallInteger)
+    games_started: Mapped[int] = mapped_column(SmallInteger)
+    games_finished: Mapped[int] = mapped_column(SmallInteger)
+    complete_games: Mapped[int] = mapped_column(SmallInteger)
+    shutouts: Mapped[int] = mapped_column(SmallInteger)
+    wins: Mapped[int] = mapped_column(SmallInteger)
+    losses: Mapped[int] = mapped_column(SmallInteger)
+    saves: Mapped[int] = mapped_column(SmallInteger)
+    save_opportunities: Mapped[int] = mapped_column(SmallInteger)
+    holds: Mapped[int] = mapped_column(SmallInteger)
+    blown_saves: Mapped[int] = mapped_column(SmallInteger)
+    innings_pitched: Mapped[Decimal | None] = mapped_column(Numeric(4, 1))
+    batters_faced: Mapped[int] = mapped_column(SmallInteger)
+    outs: Mapped[int] = mapped_column(SmallInteger)
+    pitches_thrown: Mapped[int] = mapped_column(SmallInteger)
+    strikes: Mapped[int] = mapped_column(SmallInteger)
+    balls: Mapped[int] = mapped_column(SmallInteger)
+    strike_percentage: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    hits: Mapped[int] = mapped_column(SmallInteger)
+    runs: Mapped[int] = mapped_column(SmallInteger)
+    earned_runs: Mapped[int] = mapped_column(SmallInteger)
+    home_runs: Mapped[int] = mapped_column(SmallInteger)
+    strike_outs: Mapped[int] = mapped_column(SmallInteger)
+    base_on_balls: Mapped[int] = mapped_column(SmallInteger)
+    intentional_walks: Mapped[int] = mapped_column(SmallInteger)
+    hit_batsmen: Mapped[int] = mapped_column(SmallInteger)
+    wild_pitches: Mapped[int] = mapped_column(SmallInteger)
+    balks: Mapped[int] = mapped_column(SmallInteger)
+    pickoffs: Mapped[int] = mapped_column(SmallInteger)
+    inherited_runners: Mapped[int] = mapped_column(SmallInteger)
+    inherited_runners_scored: Mapped[int] = mapped_column(SmallInteger)
+    passed_ball: Mapped[int] = mapped_column(SmallInteger)
+    ground_outs: Mapped[int] = mapped_column(SmallInteger)
+    fly_outs: Mapped[int] = mapped_column(SmallInteger)
+    air_outs: Mapped[int] = mapped_column(SmallInteger)
+    pop_outs: Mapped[int] = mapped_column(SmallInteger)
+    line_outs: Mapped[int] = mapped_column(SmallInteger)
+    doubles: Mapped[int] = mapped_column(SmallInteger)
+    triples: Mapped[int] = mapped_column(SmallInteger)
+    rbi: Mapped[int] = mapped_column(SmallInteger)
+    sac_bunts: Mapped[int] = mapped_column(SmallInteger)
+    sac_flies: Mapped[int] = mapped_column(SmallInteger)
+    catchers_interference: Mapped[int] = mapped_column(SmallInteger)
+    stolen_bases: Mapped[int] = mapped_column(SmallInteger)
+    caught_stealing: Mapped[int] = mapped_column(SmallInteger)
+    stolen_base_percentage: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    runs_scored_per_9: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+    home_runs_per_9: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+
+
+class BattingTotals:
+    """Counting stats summed over a player's batter game logs, with rates."""
+
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_game_date: Mapped[date] = mapped_column(Date)
+    games_played: Mapped[int] = mapped_column(Integer)
+    plate_appearances: Mapped[int] = mapped_column(Integer)
+    at_bats: Mapped[int] = mapped_column(Integer)
+    runs: Mapped[int] = mapped_column(Integer)
+    hits: Mapped[int] = mapped_column(Integer)
+    doubles: Mapped[int] = mapped_column(Integer)
+    triples: Mapped[int] = mapped_column(Integer)
+    home_runs: Mapped[int] = mapped_column(Integer)
+    rbi: Mapped[int] = mapped_column(Integer)
+    base_on_balls: Mapped[int] = mapped_column(Integer)
+    strike_outs: Mapped[int] = mapped_column(Integer)
+    hit_by_pitch: Mapped[int] = mapped_column(Integer)
+    sac_flies: Mapped[int] = mapped_column(Integer)
+    stolen_bases: Mapped[int] = mapped_column(Integer)
+    caught_stealing: Mapped[int] = mapped_column(Integer)
+    total_bases: Mapped[int] = mapped_column(Integer)
+    avg: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    obp: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    slg: Mapped[Decimal | None] = mapped_column(Numeric(4, 3))
+    ops: Mapped[Decimal | None] = mapped_column(Numeric(5, 3))
+
+
+class PitchingTotals:
+    """Counting stats summed over a player's pitcher game logs, with rates."""
+
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_game_date: Mapped[date] = mapped_column(Date)
+    games_played: Mapped[int] = mapped_column(Integer)
+    games_started: Mapped[int] = mapped_column(Integer)
+    wins: Mapped[int] = mapped_column(Integer)
+    losses: Mapped[int] = mapped_column(Integer)
+    saves: Mapped[int] = mapped_column(Integer)
+    holds: Mapped[int] = mapped_column(Integer)
+    outs: Mapped[int] = mapped_column(Integer)
+    batters_faced: Mapped[int] = mapped_column(Integer)
+    pitches_thrown: Mapped[int] = mapped_column(Integer)
+    hits: Mapped[int] = mapped_column(Integer)
+    earned_runs: Mapped[int] = mapped_column(Integer)
+    home_runs: Mapped[int] = mapped_column(Integer)
+    base_on_balls: Mapped[int] = mapped_column(Integer)
+    strike_outs: Mapped[int] = mapped_column(Integer)
+    hit_batsmen: Mapped[int] = mapped_column(Integer)
+    era: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+    whip: Mapped[Decimal | None] = mapped_column(Numeric(6, 2))
+
+
+class BatterSeasonAggregate(BattingTotals, Base):
+    """Season-to-date batting line rolled up from game logs."""
+
+    __tablename__ = "batter_season_aggregates"
+
+
+class PitcherSeasonAggregate(PitchingTotals, Base):
+    """Season-to-date pitching line rolled up from game logs."""
+
+    __tablename__ = "pitcher_season_aggregates"
+
+
+class BatterRecentAggregate(BattingTotals, Base):
+    """Batting line over a player's last N games of a season."""
+
+    __tablename__ = "batter_recent_aggregates"
+
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_n: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+
+
+class PitcherRecentAggregate(PitchingTotals, Base):
+    """Pitching line over a player's last N games of a season."""
+
+    __tablename__ = "pitcher_recent_aggregates"
+
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_n: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+
+
+class TeamSeasonAggregate(Base):
+    """Season-to-date team record, offense and pitching."""
+
+    __tablename__ = "team_season_aggregates"
+
+    team_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    games_played: Mapped[int] = mapped_column(Integer)
+    wins: Mapped[int] = mapped_column(Integer)
+    losses: Mapped[int] = mapped_column(Integer)
+    runs_scored: Mapped[int] = mapped_column(Integer)
+    runs_allowed: Mapped[int] = mapped_column(Integer)
+    hits: Mapped[int] = mapped_column(Integer)
+    home_runs: Mapped[int] = mapped_column(Integer)
+    base_on_balls: Mapped[int] = mapped_column(Integer)
+    strike_outs: Mapped[int] = mapped_column(Integer)
+    pitching_outs: Mapped[int] = mapped_column(Integer)
+    hits_allowed: Mapped[int] = mapped_column(Integer)
+    earned_runs: Mapped[int] = mapped_column(Integer)
+    walks_allowed: Mapped[int] = mapped_column(Integer)
+    pitching_strike_outs: Mapped[int] = mapped_column(Integer)
+
+
+class BeatTheStreakScore(Base):
+    """Model hit probability for a batter in a scheduled game."""
+
+    __tablename__ = "bts_scores"
+
+    game_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer)
+    game_date: Mapped[date] = mapped_column(Date, index=True)
+    team_id: Mapped[int] = mapped_column(Integer)
+    opposing_pitcher_id: Mapped[int | None] = mapped_column(Integer)
+    hit_probability: Mapped[float] = mapped_column(REAL)
+    model_version: Mapped[str] = mapped_column(String(50))
+    scored_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class BatterPitcherMatchup(Base):
+    """Plate appearance outcomes of a batter against a pitcher, career and recent."""
+
+    __tablename__ = "batter_pitcher_matchups"
+
+    batter_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    pitcher_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_faced: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    plate_appearances: Mapped[int] = mapped_column(SmallInteger)
+    at_bats: Mapped[int] = mapped_column(SmallInteger)
+    hits: Mapped[int] = mapped_column(SmallInteger)
+    extra_base_hits: Mapped[int] = mapped_column(SmallInteger)
+    home_runs: Mapped[int] = mapped_column(SmallInteger)
+    base_on_balls: Mapped[int] = mapped_column(SmallInteger)
+    strike_outs: Mapped[int] = mapped_column(SmallInteger)
+    recent_plate_appearances: Mapped[int] = mapped_column(SmallInteger)
+    recent_hits: Mapped[int] = mapped_column(SmallInteger)
+
+
+class DeadLetter(Base):
+    """A game or record that failed to fetch or validate, kept until retried."""
+
+    __tablename__ = "dead_letters"
+
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    item_key: Mapped[str] = mapped_column(String(50), primary_key=True)
+    stage: Mapped[str] = mapped_column(String(20))
+    error: Mapped[str] = mapped_column(Text)
+    payload: Mapped[Any | None] = mapped_column(JSONB)
+    params: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    attempts: Mapped[int] = mapped_column(SmallInteger)
+    first_failed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    last_failed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    resolved_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), index=True
+    )
+
+
+class Team(Base):
+    """Club as listed for a season; names and divisions change between seasons."""
+
+    __tablename__ = "teams"
+
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    team_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    abbreviation: Mapped[str | None] = mapped_column(String(10))
+    team_name: Mapped[str | None] = mapped_column(String(50))
+    location_name: Mapped[str | None] = mapped_column(String(50))
+    league_id: Mapped[int | None] = mapped_column(Integer)
+    division_id: Mapped[int | None] = mapped_column(Integer)
+    venue_id: Mapped[int | None] = mapped_column(Integer)
+
+
+class Venue(Base):
+    """Ballpark as named for a season; naming rights change between seasons."""
+
+    __tablename__ = "venues"
+
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    venue_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+
+
+class Player(Base):
+    """Biographical details of a player, as of the latest season fetched."""
+
+    __tablename__ = "players"
+
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    full_name: Mapped[str] = mapped_column(String(100))
+    first_name: Mapped[str] = mapped_column(String(50))
+    last_name: Mapped[str] = mapped_column(String(50))
+    birth_date: Mapped[date | None] = mapped_column(Date)
+    birth_city: Mapped[str | None] = mapped_column(String(100))
+    birth_country: Mapped[str | None] = mapped_column(String(100))
+    height: Mapped[float | None] = mapped_column(REAL)
+    weight: Mapped[int | None] = mapped_column(SmallInteger)
+    active: Mapped[bool] = mapped_column(Boolean)
+    bat_side_code: Mapped[str | None] = mapped_column(String(1))
+    pitch_hand_code: Mapped[str | None] = mapped_column(String(1))
+
+
+class Position(Base):
+    """Fielding position named by the code game logs carry."""
+
+    __tablename__ = "positions"
+
+    position_code: Mapped[str] = mapped_column(String(10), primary_key=True)
+    name: Mapped[str | None] = mapped_column(String(100))
+    type: Mapped[str | None] = mapped_column(String(20))
+
+
+class Label(Base):
+    """A repeated string, e.g. a wind or weather description, stored once."""
+
+    __tablename__ = "labels"
+    __table_args__ = (UniqueConstraint("kind", "value"),)
+
+    label_id: Mapped[int] = mapped_column(
+        SmallInteger, primary_key=True, autoincrement=True
+    )
+    kind: Mapped[str] = mapped_column(String(30))
+    value: Mapped[str] = mapped_column(String(100))
@@ -0,0 +1,119 @@
+"""
+Season partition management for game-level tables.
+"""
+
+from datetime import date
+from typing import Iterable, List
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from database.models import (
+    BatterGameLog,
+    GameInformation,
+    PitcherGameLog,
+    TeamSchedule,
+)
+
+PARTITIONED_TABLES = [
+    model.__tablename__
+    for model in (TeamSchedule, GameInformation, BatterGameLog, PitcherGameLog)
+]
+
+# Partitions already known to exist, so the catalog is checked once per process
+_known_partitions: set[str] = set()
+
+# session.info key of the partitions a session's open transaction created or saw
+PENDING_PARTITIONS = "pending_partitions"
+
+
+def partition_name(table: str, season: int) -> str:
+    return f"{table}_{int(season)}"
+
+
+def is_partitioned(table) -> bool:
+    return bool(table.__table__.dialect_options["postgresql"]["partition_by"])
+
+
+def _pending_partitions(session: AsyncSession) -> set[str]:
+    """
+    Partitions to remember once the session's transaction commits.
+
+    A partition created in a transaction that is rolled back does not exist, so
+    it is only added to _known_partitions after the commit.
+    """
+    return session.info.setdefault(PENDING_PARTITIONS, set())
+
+
+@event.listens_for(Session, "after_commit")
+def _remember(session: Session) -> None:
+    _known_partitions.update(session.info.pop(PENDING_PARTITIONS, ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget(session: Session) -> None:
+    session.info.pop(PENDING_PARTITIONS, None)
+
+
+async def ensure_season_partitions(
+    session: AsyncSession, table: str, seasons: Iterable[int]
+) -> None:
+    """Create any missing season partitions of a table"""
+    pending = _pending_partitions(session)
+
+    for season in sorted(set(seasons)):
+        partition = partition_name(table, season)
+        if partition in _known_partitions or partition in pending:
+            continue
+
+        exists = await session.scalar(
+            text("SELECT to_regclass(:name)"), {"name": partition}
+        )
+        if exists is None:
+            await session.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {partition} "
+                    f"PARTITION OF {table} FOR VALUES IN ({int(season)})"
+                )
+            )
+
+        pending.add(partition)
+
+
+async def create_upcoming_partitions(session: AsyncSession) -> List[str]:
+    """Make sure this season's and next season's partitions exist everywhere"""
+    season = date.today().year
+
+    for table in PARTITIONED_TABLES:
+        await ensure_season_partitions(session, table, [season, season + 1])
+
+    return [
+        partition_name(table, s)
+        for table in PARTITIONED_TABLES
+        for s in (season, season + 1)
+    ]
+
+
+async def detach_season(session: AsyncSession, season: int) -> List[str]:
+    """
+    Detach a season from every partitioned table.
+
+    The detached partitions become ordinary tables that queries on the parents no
+    longer scan; they can then be dumped, moved to cheaper storage or dropped.
+    """
+    detached = []
+
+    for table in PARTITIONED_TABLES:
+        partition = partition_name(table, season)
+        exists = await session.scalar(
+            text("SELECT to_regclass(:name)"), {"name": partition}
+        )
+        if exists is None:
+            continue
+
+        await session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition}"))
+        _known_partitions.discard(partition)
+        detached.append(partition)
+
+    return detached
@@ -0,0 +1,123 @@
+"""
+Per-item failure isolation for extraction and validation.
+
+Code that processes many games or records reports each item it has to give up
+on with record() and carries on with the rest. Routines run inside collect(),
+which gathers those failures so they can be stored in the dead_letters table
+and redone later with --retry-failed.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Type, TypeVar
+
+T = TypeVar("T")
+
+# What a malformed record raises; ValidationError is a ValueError, while
+# before-validators reaching into missing keys raise the others unwrapped
+RECORD_ERRORS = (ValueError, TypeError, KeyError, AttributeError)
+
+
+@dataclass(frozen=True)
+class FailedItem:
+    """
+    One game or record that could not be processed.
+
+    kind names what has to be redone ("games", "plays", "schedules",
+    "player_stats", "teams", "venues", "players") and key identifies the item
+    within it; params holds whatever else is needed to fetch it again, e.g. a
+    date or season.
+    """
+
+    kind: str
+    key: str
+    stage: str
+    error: str
+    payload: Any = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+_collector: ContextVar[List[FailedItem] | None] = ContextVar(
+    "dead_letter_collector", default=None
+)
+
+
+@contextmanager
+def collect() -> Iterator[List[FailedItem]]:
+    """Gather the failures recorded in this context, including its tasks"""
+    failed: List[FailedItem] = []
+    token = _collector.set(failed)
+    try:
+        yield failed
+    finally:
+        _collector.reset(token)
+
+
+def record(
+    kind: str,
+    key: Any,
+    stage: str,
+    error: BaseException,
+    payload: Any = None,
+    **params: Any,
+) -> None:
+    """Report an item that was skipped so the rest of its batch can go on"""
+    logging.warning(f"Skipping {kind} {key} ({stage}): {type(error).__name__}: {error}")
+
+    failed = _collector.get()
+    if failed is not None:
+        failed.append(
+            FailedItem(
+                kind=kind,
+                key=str(key),
+                stage=stage,
+                error=f"{type(error).__name__}: {error}",
+                payload=payload,
+                params=params,
+            )
+        )
+
+
+def extend(items: Iterable[FailedItem]) -> None:
+    """
+    Add failures recorded somewhere collect() could not see, e.g. in a worker
+    process, to the current collection
+    """
+    failed = _collector.get()
+    if failed is not None:
+        failed.extend(items)
+
+
+def validate_each(
+    model: Type[T],
+    records: Iterable[dict[str, Any]],
+    kind: str,
+    key: Callable[[dict[str, Any]], Any],
+    params: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+) -> List[T]:
+    """
+    model_validate every record, recording the ones that fail instead of raising.
+
+    Args:
+        model: Pydantic model to validate with
+        records: Extracted records
+        kind: Dead-letter kind the failures are filed under
+        key: Item key of a record, e.g. its game id
+        params: What else is needed to fetch a record again, if anything
+    """
+    validated = []
+    for item in records:
+        try:
+            validated.append(model.model_validate(item))
+        except RECORD_ERRORS as error:
+            record(
+                kind,
+                key(item),
+                "validate",
+                error,
+                payload=item,
+                **(params(item) if params else {}),
+            )
+    return validated
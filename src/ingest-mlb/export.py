@@ -0,0 +1,165 @@
+"""
+Date-partitioned Parquet export of game information and game logs.
+
+Each table is written as one file per game date, typed from its ORM model:
+
+    {root}/{table}/date={YYYY-MM-DD}/part-0.parquet
+
+Exporting a date range rewrites only that range's partitions, so a daily run
+appends the new day and refreshes any re-ingested ones without touching the
+rest of the export. See analytics.py for querying it.
+"""
+
+import os
+from datetime import date
+from pathlib import Path
+from typing import Any, List, Type
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import (
+    REAL,
+    Boolean,
+    Date,
+    DateTime,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import BatterGameLog, GameInformation, PitcherGameLog
+
+PARQUET_TABLES = {
+    model.__tablename__: model
+    for model in (GameInformation, BatterGameLog, PitcherGameLog)
+}
+
+PARTITION_FILE = "part-0.parquet"
+
+# Rows fetched per round trip while streaming a table out of the database
+EXPORT_BATCH_ROWS = 10_000
+
+
+def arrow_type(column_type: Any) -> pa.DataType:
+    """Arrow type for a SQLAlchemy column type"""
+    # Subclasses first: SmallInteger is an Integer and REAL is a Numeric
+    if isinstance(column_type, SmallInteger):
+        return pa.int16()
+    if isinstance(column_type, Integer):
+        return pa.int32()
+    if isinstance(column_type, REAL):
+        return pa.float32()
+    if isinstance(column_type, Numeric):
+        return pa.decimal128(column_type.precision, column_type.scale)
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, String):
+        return pa.string()
+    raise TypeError(f"No Parquet type for {column_type!r}")
+
+
+def arrow_schema(model: Type) -> pa.Schema:
+    """Arrow schema with the columns, types and nullability of an ORM model"""
+    return pa.schema(
+        pa.field(column.name, arrow_type(column.type), nullable=column.nullable)
+        for column in model.__table__.columns
+    )
+
+
+class ParquetExport:
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    @classmethod
+    def from_env(cls) -> "ParquetExport | None":
+        """Export configured by MLB_PARQUET_DIR, if set"""
+        root = os.getenv("MLB_PARQUET_DIR")
+        return cls(root) if root else None
+
+    def partition(self, table: str, game_date: date) -> Path:
+        return self.root / table / f"date={game_date.isoformat()}"
+
+    def files(self, table: str) -> List[Path]:
+        return sorted((self.root / table).glob(f"date=*/{PARTITION_FILE}"))
+
+    def write_partition(
+        self, table: str, game_date: date, rows: List[dict[str, Any]]
+    ) -> None:
+        """Replace a date's partition; readers see the old file or the new one"""
+        partition = self.partition(table, game_date)
+        partition.mkdir(parents=True, exist_ok=True)
+
+        staging = partition / f".{PARTITION_FILE}.{os.getpid()}"
+        pq.write_table(
+            pa.Table.from_pylist(rows, schema=arrow_schema(PARQUET_TABLES[table])),
+            staging,
+            compression="zstd",
+        )
+        os.replace(staging, partition / PARTITION_FILE)
+
+    def drop_partition(self, table: str, game_date: date) -> None:
+        partition = self.partition(table, game_date)
+        (partition / PARTITION_FILE).unlink(missing_ok=True)
+        if partition.exists() and not any(partition.iterdir()):
+            partition.rmdir()
+
+    async def export(
+        self, session: AsyncSession, start_date: date, end_date: date
+    ) -> List[tuple[str, int]]:
+        """
+        Rewrite every table's partitions for a date range from the database.
+
+        Args:
+            session: Session to read with
+            start_date: First game date to export
+            end_date: Last game date to export
+
+        Returns:
+            Rows exported per table
+        """
+        outputs = []
+
+        for table, model in PARQUET_TABLES.items():
+            source = model.__table__
+            result = await session.stream(
+                select(source)
+                .where(
+                    # The season bounds let PostgreSQL skip other partitions
+                    source.c.season.between(start_date.year, end_date.year),
+                    source.c.game_date.between(start_date, end_date),
+                )
+                .order_by(source.c.game_date, *source.primary_key.columns)
+                .execution_options(yield_per=EXPORT_BATCH_ROWS)
+            )
+
+            # Rows arrive in date order, so only one day is held at a time
+            written: set[date] = set()
+            day: List[dict[str, Any]] = []
+            count = 0
+            async for row in result.mappings():
+                if day and row["game_date"] != day[0]["game_date"]:
+                    self.write_partition(table, day[0]["game_date"], day)
+                    written.add(day[0]["game_date"])
+                    day = []
+                day.append(dict(row))
+                count += 1
+            if day:
+                self.write_partition(table, day[0]["game_date"], day)
+                written.add(day[0]["game_date"])
+
+            # Dates that no longer have rows must not keep stale files
+            for path in self.files(table):
+                exported = date.fromisoformat(path.parent.name.removeprefix("date="))
+                if start_date <= exported <= end_date and exported not in written:
+                    self.drop_partition(table, exported)
+
+            outputs.append((f"parquet_{table}", count))
+
+        return outputs
@@ -0,0 +1,382 @@
+"""
+Beat the Streak features computed column-wise over stored game logs.
+
+FeatureEngine keeps only each batter's and starter's most recent games, so a
+new day of logs is folded in with work proportional to the players involved
+rather than to the season's history. Every feature is computed for all players
+at once with grouped pandas/NumPy operations; nothing loops per player.
+"""
+
+from datetime import date
+from typing import Callable, Iterable, List
+
+import numpy as np
+import pandas as pd
+from pandas.api.typing import DataFrameGroupBy
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.models import dump_records
+
+from database.matchups import load_matchups
+from database.models import (
+    BatterGameLog,
+    BatterPitcherMatchup,
+    GameInformation,
+    PitcherGameLog,
+)
+from models import TeamSchedules
+
+# Trailing game windows every rolling feature is computed over
+FEATURE_WINDOWS = (7, 15, 30)
+
+BATTER_COLUMNS = [
+    "player_id",
+    "game_id",
+    "game_date",
+    "team_id",
+    "venue_id",
+    "hits",
+    "plate_appearances",
+]
+PITCHER_COLUMNS = [
+    "player_id",
+    "game_id",
+    "game_date",
+    "games_started",
+    "hits",
+    "batters_faced",
+    "outs",
+]
+SCHEDULE_COLUMNS = [
+    "game_id",
+    "game_date",
+    "venue_id",
+    "home_team_id",
+    "away_team_id",
+    "home_probable_pitcher_id",
+    "away_probable_pitcher_id",
+]
+
+
+def _frame(rows: Iterable, columns: List[str]) -> pd.DataFrame:
+    frame = pd.DataFrame(list(rows), columns=columns)
+    frame["game_date"] = pd.to_datetime(frame["game_date"])
+    return frame
+
+
+def _recency(frame: pd.DataFrame) -> np.ndarray:
+    """0 for each player's latest game, 1 for the one before, and so on"""
+    return frame.groupby("player_id", sort=False).cumcount(ascending=False).to_numpy()
+
+
+def _tail(frame: pd.DataFrame, games: int) -> pd.DataFrame:
+    frame = frame.sort_values(["player_id", "game_date", "game_id"], kind="stable")
+    frame = frame.drop_duplicates(["player_id", "game_id"], keep="last")
+    return frame[_recency(frame) < games].reset_index(drop=True)
+
+
+def schedule_frame(schedules: List[TeamSchedules]) -> pd.DataFrame:
+    """Validated schedules (mlb.process_schedules) as a DataFrame"""
+    return _frame(
+        (
+            [record[column] for column in SCHEDULE_COLUMNS]
+            for record in dump_records(schedules)
+        ),
+        SCHEDULE_COLUMNS,
+    )
+
+
+async def load_game_logs(
+    session: AsyncSession, season: int, start_date: date, end_date: date
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Load the batter and pitcher log columns features are computed from.
+
+    Args:
+        session: Session to read with
+        season: Season partition to read
+        start_date: First game date to include
+        end_date: Last game date to include
+
+    Returns:
+        Batter logs with each game's venue, and pitcher logs
+    """
+    batting = BatterGameLog.__table__
+    pitching = PitcherGameLog.__table__
+    games = GameInformation.__table__
+
+    batter_rows = await session.execute(
+        select(
+            *(batting.c[column] for column in BATTER_COLUMNS if column != "venue_id"),
+            games.c.venue_id,
+        )
+        .select_from(
+            batting.outerjoin(
+                games,
+                and_(
+                    games.c.season == batting.c.season,
+                    games.c.game_id == batting.c.game_id,
+                ),
+            )
+        )
+        .where(
+            batting.c.season == season,
+            batting.c.game_date.between(start_date, end_date),
+            # Appearances without a plate appearance say nothing about hitting
+            batting.c.plate_appearances > 0,
+        )
+    )
+    pitcher_rows = await session.execute(
+        select(*(pitching.c[column] for column in PITCHER_COLUMNS)).where(
+            pitching.c.season == season,
+            pitching.c.game_date.between(start_date, end_date),
+            pitching.c.games_started > 0,
+        )
+    )
+
+    return _frame(batter_rows.all(), BATTER_COLUMNS), _frame(
+        pitcher_rows.all(), PITCHER_COLUMNS
+    )
+
+
+async def matchup_history(
+    session: AsyncSession, matchups: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Add each batter's history against the opposing starter to a slate.
+
+    Args:
+        session: Session to read the matchup index with
+        matchups: Slate rows with player_id and opposing_pitcher_id (see
+                  FeatureEngine.matchups)
+
+    Returns:
+        The slate with the matchup counters prefixed "bvp_" (zero for pairs
+        that never met) and bvp_avg (NaN without an at-bat)
+    """
+    known = matchups.dropna(subset=["opposing_pitcher_id"])
+    rows = await load_matchups(
+        session,
+        zip(
+            known["player_id"].astype(np.int64).tolist(),
+            known["opposing_pitcher_id"].astype(np.int64).tolist(),
+        ),
+    )
+    history = pd.DataFrame(
+        rows, columns=[c.name for c in BatterPitcherMatchup.__table__.columns]
+    ).set_index(["batter_id", "pitcher_id"])
+    counters = [name for name in history.columns if name != "last_faced"]
+
+    history = history.add_prefix("bvp_")
+    slate = matchups.merge(
+        history,
+        left_on=["player_id", "opposing_pitcher_id"],
+        right_index=True,
+        how="left",
+    )
+    slate[[f"bvp_{name}" for name in counters]] = (
+        slate[[f"bvp_{name}" for name in counters]].fillna(0).astype(np.int64)
+    )
+    slate["bvp_avg"] = slate["bvp_hits"] / slate["bvp_at_bats"].replace(0, np.nan)
+    return slate
+
+
+class FeatureEngine:
+    """
+    Rolling batter, starter and venue features for Beat the Streak.
+
+    update() folds in new logs; batter_features(), pitcher_features() and
+    matchups() read the current state.
+    """
+
+    def __init__(self, windows: Iterable[int] = FEATURE_WINDOWS) -> None:
+        self.windows = tuple(sorted(windows))
+        self.batter_games = _frame([], BATTER_COLUMNS)
+        self.pitcher_starts = _frame([], PITCHER_COLUMNS)
+        # Season-to-date venue totals are additive, so they never need the history
+        self.venue_totals = pd.DataFrame(
+            columns=["hits", "plate_appearances"], dtype=np.int64
+        ).rename_axis("venue_id")
+        self._applied_games: set[int] = set()
+        # Bumped whenever new logs change the state; keys cached feature frames
+        self.version = 0
+        self._feature_frames: dict[str, tuple[int, pd.DataFrame]] = {}
+
+    @classmethod
+    async def from_storage(
+        cls,
+        session: AsyncSession,
+        through_date: date,
+        windows: Iterable[int] = FEATURE_WINDOWS,
+    ) -> "FeatureEngine":
+        """Engine primed with the season's logs up to and including a date"""
+        engine = cls(windows)
+        engine.update(
+            *await load_game_logs(
+                session,
+                through_date.year,
+                date(through_date.year, 1, 1),
+                through_date,
+            )
+        )
+        return engine
+
+    @property
+    def max_window(self) -> int:
+        return self.windows[-1]
+
+    def update(self, batter_logs: pd.DataFrame, pitcher_logs: pd.DataFrame) -> None:
+        """
+        Fold new logs into the state.
+
+        Games already applied are skipped, so replaying a day is harmless. Only
+        the last max_window games per player are kept afterwards.
+        """
+        applied = list(self._applied_games)
+        batter_logs = batter_logs[~batter_logs["game_id"].isin(applied)]
+        pitcher_logs = pitcher_logs[~pitcher_logs["game_id"].isin(applied)]
+
+        venue_games = batter_logs.dropna(subset=["venue_id"])
+        self.venue_totals = (
+            pd.concat(
+                [
+                    self.venue_totals,
+                    venue_games.groupby(venue_games["venue_id"].astype(np.int64))[
+                        ["hits", "plate_appearances"]
+                    ].sum(),
+                ]
+            )
+            .groupby(level=0)
+            .sum()
+        )
+
+        self.batter_games = _tail(
+            pd.concat([self.batter_games, batter_logs], ignore_index=True),
+            self.max_window,
+        )
+        self.pitcher_starts = _tail(
+            pd.concat([self.pitcher_starts, pitcher_logs], ignore_index=True),
+            self.max_window,
+        )
+
+        self._applied_games.update(batter_logs["game_id"].tolist())
+        self._applied_games.update(pitcher_logs["game_id"].tolist())
+        if len(batter_logs) or len(pitcher_logs):
+            self.version += 1
+
+    def _memoized(self, name: str, compute: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        version, frame = self._feature_frames.get(name, (None, None))
+        if version != self.version:
+            frame = compute()
+            self._feature_frames[name] = (self.version, frame)
+        return frame
+
+    def _windowed(self, frame: pd.DataFrame) -> List[tuple[int, DataFrameGroupBy]]:
+        """Per-window groups of each player's last n games"""
+        recency = _recency(frame)
+        return [
+            (n, frame[recency < n].groupby("player_id", sort=False))
+            for n in self.windows
+        ]
+
+    def batter_features(self) -> pd.DataFrame:
+        """
+        One row per batter: hit rate (share of games with a hit), plate
+        appearances per game and games played over each window, plus the
+        batter's current team.
+        """
+        return self._memoized("batters", self._batter_features)
+
+    def _batter_features(self) -> pd.DataFrame:
+        games = self.batter_games.assign(
+            had_hit=self.batter_games["hits"].to_numpy() > 0
+        )
+        latest = games.groupby("player_id", sort=False).tail(1).set_index("player_id")
+
+        features = {"team_id": latest["team_id"], "last_game_date": latest["game_date"]}
+        for n, grouped in self._windowed(games):
+            played = grouped.size()
+            features[f"games_{n}"] = played
+            features[f"hit_rate_{n}"] = grouped["had_hit"].sum() / played
+            features[f"pa_per_game_{n}"] = grouped["plate_appearances"].sum() / played
+
+        return pd.DataFrame(features).rename_axis("player_id")
+
+    def pitcher_features(self) -> pd.DataFrame:
+        """
+        One row per starter: hits allowed per batter faced and per nine innings
+        over each window of starts.
+        """
+        return self._memoized("pitchers", self._pitcher_features)
+
+    def _pitcher_features(self) -> pd.DataFrame:
+        features = {}
+        for n, grouped in self._windowed(self.pitcher_starts):
+            totals = grouped[["hits", "batters_faced", "outs"]].sum()
+            features[f"starts_{n}"] = grouped.size()
+            features[f"hits_per_batter_{n}"] = totals["hits"] / totals[
+                "batters_faced"
+            ].replace(0, np.nan)
+            features[f"hits_per_9_{n}"] = (
+                27 * totals["hits"] / totals["outs"].replace(0, np.nan)
+            )
+
+        return pd.DataFrame(features).rename_axis("player_id")
+
+    def venue_features(self) -> pd.DataFrame:
+        """Season-to-date hits per plate appearance at each venue"""
+        return self._memoized("venues", self._venue_features)
+
+    def _venue_features(self) -> pd.DataFrame:
+        totals = self.venue_totals
+        return pd.DataFrame(
+            {
+                "venue_hits_per_pa": totals["hits"]
+                / totals["plate_appearances"].replace(0, np.nan)
+            }
+        )
+
+    def matchups(self, schedule: pd.DataFrame) -> pd.DataFrame:
+        """
+        Features for every batter whose current team plays in a schedule.
+
+        Args:
+            schedule: Scheduled games (see schedule_frame)
+
+        Returns:
+            One row per (game, batter), with the batter's features, home/away,
+            venue, and the opposing probable starter's features prefixed with
+            "opp_" (NaN while the starter is unannounced or unknown)
+        """
+        sides = pd.concat(
+            [
+                pd.DataFrame(
+                    {
+                        "game_id": schedule["game_id"],
+                        "game_date": schedule["game_date"],
+                        "venue_id": schedule["venue_id"],
+                        "team_id": schedule[f"{side}_team_id"],
+                        "is_home": side == "home",
+                        "opponent_team_id": schedule[f"{other}_team_id"],
+                        "opposing_pitcher_id": schedule[f"{other}_probable_pitcher_id"],
+                    }
+                )
+                for side, other in (("home", "away"), ("away", "home"))
+            ],
+            ignore_index=True,
+        )
+
+        batters = self.batter_features().reset_index()
+        pitchers = self.pitcher_features().add_prefix("opp_")
+
+        return (
+            sides.merge(batters, on="team_id", how="inner")
+            .merge(
+                pitchers, left_on="opposing_pitcher_id", right_index=True, how="left"
+            )
+            .merge(
+                self.venue_features(), left_on="venue_id", right_index=True, how="left"
+            )
+            .reset_index(drop=True)
+        )
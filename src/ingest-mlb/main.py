@@ -1,20 +1,471 @@
+import argparse
 import asyncio
+import logging
+from collections import defaultdict
+from contextlib import AsyncExitStack
+from datetime import date, timedelta
+from functools import partial, wraps
+from typing import AsyncIterator, Awaitable, Callable, List, TypeVar
 
-from database.ingestion import ingest_schedules
-from mlb import (
-    process_schedules,
-)
+from common.decorators import routine
+from common.imports import lazy_import
+from common.runners import run_flags
 
-# ROUTINE_MAP = {
-#     "process_schedules": process_schedules,
-# }
+# Each module is loaded when a routine first uses it, so a cold start only pays
+# for the routines it runs (see sandbox/benchmarks/import_time.py)
+aggregates = lazy_import("database.aggregates")
+api = lazy_import("api")
+boxscore = lazy_import("boxscore")
+config = lazy_import("database.config")
+deadletter = lazy_import("deadletter")
+export = lazy_import("export")
+features = lazy_import("features")
+ingestion = lazy_import("database.ingestion")
+matchups = lazy_import("database.matchups")
+mlb = lazy_import("mlb")
+push = lazy_import("push")
+scoring = lazy_import("scoring")
+season_partitions = lazy_import("database.partitions")
+
+# Long-running, repair and export routines that only run when their flag is given
+EXCLUDED_SUFFIXES = ("live", "archive", "rebuild", "export", "failed")
+
+T = TypeVar("T")
+
+
+def _run(awaitable: Awaitable[T]) -> T:
+    """asyncio.run that leaves no pooled connection behind in the closed loop"""
+
+    async def disposing() -> T:
+        try:
+            return await awaitable
+        finally:
+            await config.AsyncSessionLocal.dispose()
+
+    return asyncio.run(disposing())
+
+
+def _isolated(func: Callable) -> Callable:
+    """Store the games and records a routine skipped, for --retry-failed"""
+
+    @wraps(func)
+    def wrapper(start_date: str, end_date: str) -> List[tuple[str, int]]:
+        with deadletter.collect() as failed:
+            outputs = func(start_date, end_date)
+
+        stored = _run(ingestion.record_dead_letters(failed)) if failed else 0
+        return [*outputs, ("dead_letters", stored)]
+
+    return wrapper
+
+
+def _counting_skips(func: Callable) -> Callable:
+    """Report the scheduled games a routine did not fetch a feed for"""
+
+    @wraps(func)
+    def wrapper(start_date: str, end_date: str) -> List[tuple[str, int]]:
+        before = sum(mlb.skipped_fetches.values())
+        outputs = func(start_date, end_date)
+        return [*outputs, ("skipped_feeds", sum(mlb.skipped_fetches.values()) - before)]
+
+    return wrapper
+
+
+async def _create_partitions() -> List[str]:
+    async with config.AsyncSessionLocal() as session:
+        async with session.begin():
+            return await season_partitions.create_upcoming_partitions(session)
+
+
+@routine("ingest-mlb")
+def partitions(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    return [("season_partitions", len(_run(_create_partitions())))]
+
+
+@routine("ingest-mlb")
+@_isolated
+def reference(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    counts = defaultdict(int)
+    for season in range(int(start_date[:4]), int(end_date[:4]) + 1):
+        # Served from mlb.reference until its TTL, so reruns cost no requests
+        teams = mlb.process_teams(season)
+        venues = mlb.process_venues(season)
+        players = mlb.process_players(season)
+        _run(ingestion.ingest_reference(season, teams, venues, players))
+
+        counts["teams"] += len(teams)
+        counts["venues"] += len(venues)
+        counts["players"] += len(players)
+    return list(counts.items())
+
+
+@routine("ingest-mlb")
+@_isolated
+def schedules(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    count = _run(
+        ingestion.ingest_schedules(mlb.process_schedules(start_date, end_date))
+    )
+    return [("team_schedules", count)]
+
+
+@routine("ingest-mlb")
+@_isolated
+def game_information(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    count = _run(
+        ingestion.ingest_game_information(
+            mlb.process_game_information(start_date, end_date)
+        )
+    )
+    return [("game_information", count)]
+
+
+@routine("ingest-mlb")
+@_isolated
+@_counting_skips
+def game_logs(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    outputs = []
+    batches = mlb.process_game_log_batches(start_date, end_date)
+    for log_type, batch in batches.items():
+        count = _run(ingestion.ingest_game_logs(batch))
+        outputs.append((f"{log_type.value}_game_logs", count))
+    return outputs
+
+
+@routine("ingest-mlb")
+@_isolated
+@_counting_skips
+def plays(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    count = _run(ingestion.ingest_plays(mlb.stream_plays(start_date, end_date)))
+    return [("at_bats", count)]
+
+
+@routine("ingest-mlb")
+@_isolated
+def player_stats(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    batting, pitching = mlb.process_player_season_stats(season=int(start_date[:4]))
+    _run(ingestion.ingest_player_season_stats(batting, pitching))
+    return [
+        ("player_season_batting_stats", len(batting)),
+        ("player_season_pitching_stats", len(pitching)),
+    ]
+
+
+async def _score_slate(game_date: str, schedules: List) -> int:
+    async with config.AsyncSessionLocal() as session:
+        feature_engine = await features.FeatureEngine.from_storage(
+            session, date.fromisoformat(game_date) - timedelta(days=1)
+        )
+
+    engine = scoring.ScoringEngine(feature_engine)
+    scores = engine.score(features.schedule_frame(schedules))
+    return await ingestion.ingest_scores(
+        scoring.score_rows(scores, engine.model.version)
+    )
+
+
+@routine("ingest-mlb")
+def bts_scores(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    schedules = mlb.process_schedules(start_date, start_date)
+    return [("bts_scores", _run(_score_slate(start_date, schedules)))]
+
+
+async def _poll_live(game_date: str, interval: float = 15.0) -> None:
+    # Live requests take Stats API capacity ahead of batch and backfill traffic
+    mlb.request_priority.set(mlb.Priority.LIVE)
+    # Short statement timeouts and a small pool, if no routine opened one yet
+    config.AsyncSessionLocal.profile = "live"
+    # Served in this loop so their caches see every committed change
+    hub = push.PushHub()
+    servers = [
+        asyncio.create_task(push.serve_push(hub)),
+        asyncio.create_task(api.serve_api()),
+    ]
+
+    box_scores = boxscore.LiveBoxScores(mlb.GameLogType)
+    # Games in progress at the previous poll; one that has since gone final is
+    # streamed once more, so the at-bats up to the final out are not lost
+    live_games: set[int] = set()
+
+    try:
+        # Polls hand rows to write-behind buffers and move on; rows repeated
+        # across polls are coalesced, and whatever is pending is written on exit
+        async with AsyncExitStack() as buffers:
+            games_buffer = await buffers.enter_async_context(
+                ingestion.game_information_buffer()
+            )
+            plays_buffer = await buffers.enter_async_context(ingestion.play_buffer())
+            log_buffers = {
+                name: await buffers.enter_async_context(ingestion.game_log_buffer(name))
+                for name in ingestion.GAME_LOG_TABLES
+            }
+
+            while True:
+                # A failed request or write costs one poll, not the poller
+                try:
+                    with deadletter.collect() as failed:
+                        games, batches = await mlb.fetch_live_games(
+                            game_date, box_scores
+                        )
+                        # Committed changes reach the push hub through database.events
+                        await ingestion.ingest_game_information(games, games_buffer)
+                        # Only lines that changed since the previous poll
+                        for batch in batches.values():
+                            await ingestion.ingest_game_logs(
+                                batch, log_buffers[batch.model.__name__]
+                            )
+                        # Only games in progress have new plays between polls
+                        await ingestion.ingest_plays(
+                            mlb.stream_plays(
+                                game_date,
+                                game_date,
+                                policy=mlb.FetchPolicy.LIVE,
+                                include=live_games,
+                            ),
+                            buffer=plays_buffer,
+                        )
+                        live_games = {
+                            game.game_id for game in games if game.game_status == "Live"
+                        }
+
+                    if failed:
+                        await ingestion.record_dead_letters(failed)
+
+                    # Called off games are "Final" too. Once the whole slate is
+                    # over, move on to the next day, but never past today; a poll
+                    # that lost games to failures does not tell whether it is over
+                    next_date = min(
+                        date.fromisoformat(game_date) + timedelta(days=1), date.today()
+                    ).isoformat()
+                    if (
+                        next_date > game_date
+                        and not failed
+                        and all(game.game_status == "Final" for game in games)
+                    ):
+                        # Written first, so their commits do not publish the
+                        # finished games to the hub again after it forgot them; if
+                        # that fails, the day is polled again
+                        for buffer in (
+                            games_buffer,
+                            plays_buffer,
+                            *log_buffers.values(),
+                        ):
+                            await buffer.flush()
+                        logging.info(
+                            f"Games of {game_date} are over, polling {next_date}"
+                        )
+                        game_ids = [game.game_id for game in games]
+                        box_scores.forget(game_ids)
+                        for game_id in game_ids:
+                            hub.forget(game_id)
+                        game_date, live_games = next_date, set()
+                except Exception:
+                    logging.exception(f"Live poll of {game_date} failed")
+
+                await asyncio.sleep(interval)
+    finally:
+        for server in servers:
+            server.cancel()
+
+
+@routine("ingest-mlb")
+def live(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    _run(_poll_live(start_date))
+    return []
+
+
+async def _iterate(items: List) -> AsyncIterator:
+    for item in items:
+        yield item
+
+
+async def _reprocess_archive(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    ingest_map = {
+        mlb.ReprocessTarget.SCHEDULES: ingestion.ingest_schedules,
+        mlb.ReprocessTarget.GAME_INFORMATION: ingestion.ingest_game_information,
+        mlb.ReprocessTarget.PLAYS: lambda plays: ingestion.ingest_plays(
+            _iterate(plays)
+        ),
+    }
+
+    outputs = []
+    for target, ingest in ingest_map.items():
+        count = 0
+        for batch in mlb.reprocess(target, start_date, end_date):
+            count += await ingest(batch)
+        outputs.append((target.value, count))
+
+    return outputs
+
+
+@routine("ingest-mlb")
+@_isolated
+def reprocess_archive(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    return _run(_reprocess_archive(start_date, end_date))
+
+
+async def _rebuild_aggregates(seasons: range) -> List[tuple[str, int]]:
+    async with config.AsyncSessionLocal() as session:
+        async with session.begin():
+            return await aggregates.rebuild_aggregates(session, seasons)
+
+
+@routine("ingest-mlb")
+def aggregates_rebuild(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    seasons = range(int(start_date[:4]), int(end_date[:4]) + 1)
+    return _run(_rebuild_aggregates(seasons))
+
+
+async def _rebuild_matchups() -> List[tuple[str, int]]:
+    async with config.AsyncSessionLocal() as session:
+        async with session.begin():
+            return await matchups.rebuild_matchups(session)
+
+
+@routine("ingest-mlb")
+def matchups_rebuild(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    return _run(_rebuild_matchups())
+
+
+async def _export_parquet(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    parquet = export.ParquetExport.from_env()
+    if parquet is None:
+        raise ValueError("MLB_PARQUET_DIR environment variable is not set")
+
+    async with config.AsyncSessionLocal() as session:
+        return await parquet.export(
+            session, date.fromisoformat(start_date), date.fromisoformat(end_date)
+        )
+
+
+@routine("ingest-mlb")
+def parquet_export(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    return _run(_export_parquet(start_date, end_date))
+
+
+def _retry_games(items: List[dict]) -> None:
+    games, batches = mlb.process_games(
+        [(int(item["item_key"]), item["params"].get("game_date")) for item in items]
+    )
+    _run(ingestion.ingest_game_information(games))
+    for batch in batches:
+        _run(ingestion.ingest_game_logs(batch))
+
+
+def _retry_plays(items: List[dict]) -> None:
+    game_ids = [int(item["item_key"]) for item in items]
+    _run(ingestion.ingest_plays(mlb.stream_game_plays(game_ids)))
+
+
+def _retry_schedules(items: List[dict]) -> None:
+    # Schedules are only fetched by date, so the whole day is upserted again
+    for game_date in sorted({item["params"]["game_date"] for item in items}):
+        if schedules := mlb.process_schedules(game_date, game_date):
+            _run(ingestion.ingest_schedules(schedules))
+
+
+def _retry_player_stats(items: List[dict]) -> None:
+    seasons = defaultdict(list)
+    for item in items:
+        seasons[item["params"]["season"]].append(int(item["item_key"]))
+
+    for season, player_ids in seasons.items():
+        batting, pitching = mlb.process_player_season_stats(season, player_ids)
+        _run(ingestion.ingest_player_season_stats(batting, pitching))
+
+
+REFERENCE_KINDS = ("teams", "venues", "players")
+
+
+def _retry_reference(kind: str, items: List[dict]) -> None:
+    # Reference records are only fetched as a whole season's list, so each
+    # season is upserted again; letters stored without one are for this season
+    seasons = {item["params"].get("season", date.today().year) for item in items}
+    for season in sorted(seasons):
+        records = {name: [] for name in REFERENCE_KINDS}
+        records[kind] = getattr(mlb, f"process_{kind}")(season)
+        _run(ingestion.ingest_reference(season, **records))
+
+
+# How each kind of dead letter is fetched and ingested again
+RETRY_HANDLERS = {
+    "games": _retry_games,
+    "plays": _retry_plays,
+    "schedules": _retry_schedules,
+    "player_stats": _retry_player_stats,
+    **{kind: partial(_retry_reference, kind) for kind in REFERENCE_KINDS},
+}
+
+
+@routine("ingest-mlb")
+def retry_failed(start_date: str, end_date: str) -> List[tuple[str, int]]:
+    # Every pending item is retried, whatever dates the run was given
+    pending = defaultdict(list)
+    for item in _run(ingestion.pending_dead_letters()):
+        if item["kind"] in RETRY_HANDLERS:
+            pending[item["kind"]].append(item)
+        else:
+            logging.warning(f"No retry for {item['kind']} {item['item_key']}")
+
+    with deadletter.collect() as failed:
+        for kind, items in pending.items():
+            RETRY_HANDLERS[kind](items)
+
+    failing = {(item.kind, item.key) for item in failed}
+    resolved = _run(
+        ingestion.resolve_dead_letters(
+            (item["kind"], item["item_key"])
+            for items in pending.values()
+            for item in items
+            if (item["kind"], item["item_key"]) not in failing
+        )
+    )
+    stored = _run(ingestion.record_dead_letters(failed)) if failed else 0
+
+    return [
+        ("retried", sum(len(items) for items in pending.values())),
+        ("resolved", resolved),
+        ("dead_letters", stored),
+    ]
+
+
+ROUTINE_MAP = {
+    "partitions": partitions,
+    "reference": reference,
+    "schedules": schedules,
+    "game_information": game_information,
+    "game_logs": game_logs,
+    "plays": plays,
+    "player_stats": player_stats,
+    "bts_scores": bts_scores,
+    "live": live,
+    "reprocess_archive": reprocess_archive,
+    "aggregates_rebuild": aggregates_rebuild,
+    "matchups_rebuild": matchups_rebuild,
+    "parquet_export": parquet_export,
+    "retry_failed": retry_failed,
+}
 
 if __name__ == "__main__":
-    # parser = argparse.ArgumentParser()
-
-    # parser.add_argument("--process-schedules", action="store_true")
-    count = asyncio.run(ingest_schedules(process_schedules("2025-07-01", "2025-07-01")))
-    print(f"Inserted {count} schedules")
-    # print(process_teams(season=2025))
-    # print(process_players(season=2025))
-    # print(process_game_information("2025-05-01", "2025-05-02"))
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("--start-date", default=date.today().isoformat())
+    parser.add_argument("--end-date", default=date.today().isoformat())
+
+    for flag in ROUTINE_MAP:
+        parser.add_argument(f"--{flag.replace('_', '-')}", action="store_true")
+
+    flags = parser.parse_args()
+
+    # Ranges entirely in the past are backfills and yield to current traffic
+    if flags.end_date < date.today().isoformat():
+        mlb.request_priority.set(mlb.Priority.BACKFILL)
+
+    run_flags(
+        ROUTINE_MAP,
+        (flags.start_date, flags.end_date),
+        flags,
+        suffixes=EXCLUDED_SUFFIXES,
+    )
+
+    if (metrics := config.AsyncSessionLocal.metrics) is not None:
+        logging.info(f"Database pool: {metrics.snapshot()}")
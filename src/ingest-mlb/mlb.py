@@ -1,23 +1,131 @@
 import asyncio
+import logging
 import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
 from enum import Enum
-from typing import Any, List, Type, Union
+from itertools import repeat
+from typing import Any, AsyncIterator, Collection, Iterator, List, Type, Union
 
 import httpx
+import ijson
 from dotenv import load_dotenv
-from jsonpath_ng.ext import parse
 
 from common.decorators import retry
+from common.ratelimit import Priority, RateLimiter
+from common.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyTracker,
+    hedged,
+    percentile,
+)
 
+from archive import RawArchive, archive, read_segment
+from batches import GameLogBatch
+from boxscore import LiveBoxScores, extract_game_logs
+from deadletter import RECORD_ERRORS, FailedItem, collect, extend, record, validate_each
 from models import (
+    AtBat,
     BatterGameLog,
     GameInformation,
     PitcherGameLog,
+    PitchEvent,
     Player,
+    PlayerSeasonBattingStats,
+    PlayerSeasonPitchingStats,
     Team,
     TeamSchedules,
+    Venue,
+)
+from reconcile import flag_mismatches
+from reference import ReferenceCache
+
+PLAYS_JSON_PREFIX = "liveData.plays.allPlays.item"
+
+STAT_GROUPS = ("hitting", "pitching")
+STAT_TYPES = ("season", "sabermetrics")
+
+# Requests answered 429 are sent again once the shared limiter allows
+RATE_LIMITED_ATTEMPTS = 3
+
+# One Stats API budget for every process on this host
+limiter = RateLimiter.from_env("mlb-stats-api")
+
+# Teams, venues and players per season, shared by every routine in the process
+reference = ReferenceCache.from_env()
+
+# Set by callers, e.g. live polling, to claim capacity ahead of batch traffic
+request_priority: ContextVar[Priority] = ContextVar(
+    "request_priority", default=Priority.BATCH
 )
 
+# Latency percentile after which a duplicate request is sent; unset disables
+# hedging. Only endpoints whose single responses gate a whole batch are hedged.
+HEDGE_PERCENTILE = float(os.getenv("MLB_HEDGE_PERCENTILE") or 0) or None
+HEDGED_ENDPOINTS = ("game_information",)
+
+# Per endpoint type, so one failing endpoint does not stop the others
+breakers: dict[str, CircuitBreaker] = {}
+latencies: dict[str, LatencyTracker] = {}
+
+# Postponed and cancelled games are "Final" too, but never produce stats
+CALLED_OFF_STATES = ("D", "C")
+
+# Scheduled games whose feed was not fetched, per FetchPolicy, since startup;
+# routines report the difference in their summary
+skipped_fetches: Counter = Counter()
+
+
+class ReprocessTarget(str, Enum):
+    """Enum for archive replay targets with their source endpoints"""
+
+    SCHEDULES = "schedules"
+    GAME_INFORMATION = "game_information"
+    PLAYS = "plays"
+
+    @property
+    def endpoint_type(self) -> str:
+        """Get the archived endpoint type this target is extracted from"""
+        mapping = {
+            ReprocessTarget.SCHEDULES: "schedule",
+            ReprocessTarget.GAME_INFORMATION: "game_information",
+            # feed/live always carries liveData.plays, whatever the hydration
+            ReprocessTarget.PLAYS: "game_information",
+        }
+        return mapping[self]
+
+
+class FetchPolicy(str, Enum):
+    """Which scheduled games are worth fetching a feed for, per use case"""
+
+    GAME_INFORMATION = "game_information"
+    GAME_LOGS = "game_logs"
+    PLAYS = "plays"
+    LIVE = "live"
+
+    def admits(self, schedule: dict[str, Any]) -> bool:
+        """Whether a game's feed is fetched, given its schedule status"""
+        status = schedule.get("status")
+        if not status:
+            # Without a status nothing is known, so the game is fetched
+            return True
+
+        state = status.get("abstractGameState")
+        played = status.get("codedGameState") not in CALLED_OFF_STATES
+
+        match self:
+            case FetchPolicy.GAME_INFORMATION:
+                return True
+            case FetchPolicy.GAME_LOGS:
+                return state == "Final" and played
+            case FetchPolicy.PLAYS:
+                return state in ("Live", "Final") and played
+            case FetchPolicy.LIVE:
+                return state == "Live"
+
 
 class GameLogType(str, Enum):
     """Enum for game log types with model mappings"""
@@ -49,8 +157,8 @@ class GameLogType(str, Enum):
         return mapping[self]
 
 
-@retry(attempts=3, calls_per_second=10)
-async def _get_api_endpoints_and_params(endpoint_type: str, **kwargs) -> httpx.Response:
+def _build_request(endpoint_type: str, **kwargs) -> tuple[str, dict[str, Any]]:
+    """Resolve an endpoint type to its request URL and query parameters"""
     load_dotenv()
     api_key: str = os.getenv("MLB_API")
 
@@ -62,7 +170,7 @@ async def _get_api_endpoints_and_params(endpoint_type: str, **kwargs) -> httpx.R
                 "endDate": kwargs.get("end_date"),
                 "sportId": 1,
                 "gameType": kwargs.get("game_type", "R"),
-                "hydrate": kwargs.get("hydrate", "venue,team, probablePitcher"),
+                "hydrate": kwargs.get("hydrate", "venue,team,probablePitcher"),
             }
         case "game_information":
             game_id = kwargs.get("game_id")
@@ -76,17 +184,126 @@ async def _get_api_endpoints_and_params(endpoint_type: str, **kwargs) -> httpx.R
                     "season", 2025
                 ),  # This default probably should represent the actual year
             }
+        case "venues":
+            endpoint = "v1/venues"
+            params = {"sportIds": 1, "season": kwargs.get("season", 2025)}
         case "players":
             endpoint = "v1/sports/1/players"
             params = {
                 "season": kwargs.get("season", 2025),
                 "gameType": kwargs.get("game_type", "R"),
             }
+        case "player_stats":
+            endpoint = "v1/people"
+            season = kwargs.get("season", 2025)
+            params = {
+                "personIds": ",".join(map(str, kwargs.get("player_ids", []))),
+                "hydrate": (
+                    f"stats(group=[{','.join(STAT_GROUPS)}],"
+                    f"type=[{','.join(STAT_TYPES)}],"
+                    f"season={season},gameType={kwargs.get('game_type', 'R')})"
+                ),
+            }
+        case "plays":
+            game_id = kwargs.get("game_id")
+            endpoint = f"v1.1/game/{game_id}/feed/live"
+            params = {}
         case _:
             raise ValueError(f"Unknown endpoint type: {endpoint_type}")
 
+    return f"{api_key}/{endpoint}", params
+
+
+def _breaker(endpoint_type: str) -> CircuitBreaker:
+    if endpoint_type not in breakers:
+        breakers[endpoint_type] = CircuitBreaker(endpoint_type)
+    return breakers[endpoint_type]
+
+
+def _latency(endpoint_type: str) -> LatencyTracker:
+    if endpoint_type not in latencies:
+        latencies[endpoint_type] = LatencyTracker()
+    return latencies[endpoint_type]
+
+
+def _admit(endpoint_type: str) -> Priority:
+    """Fail fast while the endpoint's circuit is open; backfills are shed first"""
+    priority = request_priority.get()
+    _breaker(endpoint_type).check(critical=priority < Priority.BACKFILL)
+    return priority
+
+
+async def _observe(
+    endpoint_type: str, response: httpx.Response, started: float
+) -> None:
+    """Feed a response back to the limiter, latency tracker and circuit breaker"""
+    latency = time.perf_counter() - started
+    await limiter.feedback_from_headers(response.status_code, latency, response.headers)
+    _latency(endpoint_type).record(latency)
+
+    if response.status_code == 429 or response.status_code >= 500:
+        _breaker(endpoint_type).record_failure()
+    else:
+        _breaker(endpoint_type).record_success()
+
+
+def _log_batch(label: str, completions: List[float]) -> None:
+    """Report how long the slowest requests held up a concurrent batch"""
+    if completions:
+        logging.info(
+            f"{label}: {len(completions)} requests in {max(completions):.2f}s "
+            f"(p50 {percentile(completions, 50):.2f}s, "
+            f"p99 {percentile(completions, 99):.2f}s)"
+        )
+
+
+@retry(attempts=3)
+async def _get_api_endpoints_and_params(endpoint_type: str, **kwargs) -> httpx.Response:
+    url, params = _build_request(endpoint_type, **kwargs)
+    priority = _admit(endpoint_type)
+
+    delay = None
+    if HEDGE_PERCENTILE and endpoint_type in HEDGED_ENDPOINTS:
+        delay = _latency(endpoint_type).percentile(HEDGE_PERCENTILE)
+
     async with httpx.AsyncClient(timeout=30.0) as client:
-        return await client.get(f"{api_key}/{endpoint}", params=params)
+
+        async def send() -> httpx.Response:
+            started = time.perf_counter()
+            try:
+                response = await client.get(
+                    url, params=params, headers=kwargs.get("headers")
+                )
+            except httpx.TransportError:
+                _breaker(endpoint_type).record_failure()
+                raise
+            await _observe(endpoint_type, response, started)
+            return response
+
+        for _ in range(RATE_LIMITED_ATTEMPTS):
+            await limiter.acquire(priority)
+            # The duplicate takes its own token, so hedging stays within budget
+            response = await hedged(
+                send, delay, admit=lambda: limiter.acquire(priority)
+            )
+
+            if response.status_code != 429:
+                break
+
+    # Raised so @retry sends the request again; other statuses are the caller's
+    if response.status_code >= 500:
+        response.raise_for_status()
+
+    # A 304 has no body to replay
+    if archive is not None and response.status_code != 304:
+        archive.append(
+            endpoint_type,
+            response,
+            start_date=kwargs.get("game_date") or kwargs.get("start_date"),
+            end_date=kwargs.get("end_date"),
+        )
+
+    return response
 
 
 async def _fetch_data(endpoint_type: str, extract_func, **kwargs) -> Any:
@@ -104,11 +321,52 @@ def _extract_players(response: httpx.Response) -> List[dict[str, Any]]:
     return response.json().get("people", [])
 
 
+def _extract_venues(response: httpx.Response) -> List[dict[str, Any]]:
+    return response.json().get("venues", [])
+
+
+def _extract_player_season_stats(
+    response: httpx.Response,
+) -> List[dict[str, Any]]:
+    """Flatten hydrated people stats into one record per player and stat group"""
+    records: dict[tuple[int, str], dict[str, Any]] = {}
+
+    for person in response.json().get("people", []):
+        for stats in person.get("stats", []):
+            group = stats.get("group", {}).get("displayName")
+            stat_type = stats.get("type", {}).get("displayName")
+            splits = stats.get("splits", [])
+
+            if group not in STAT_GROUPS or stat_type not in STAT_TYPES or not splits:
+                continue
+
+            # Traded players get one split per team plus a combined split without
+            # a team; the combined line is the season line we want
+            split = next((s for s in splits if "team" not in s), splits[-1])
+
+            record = records.setdefault(
+                (person["id"], group),
+                {
+                    "playerId": person["id"],
+                    "season": split.get("season"),
+                    "teamId": split.get("team", {}).get("id"),
+                    "group": group,
+                    "stats": {},
+                },
+            )
+            record["stats"][stat_type] = split.get("stat", {})
+
+    return list(records.values())
+
+
 def _extract_team_schedules(response: httpx.Response) -> List[dict[str, Any]]:
     schedules = [
         {
             "game_date": date_item["date"],
             "game_id": game["gamePk"],
+            "game_type": game.get("gameType"),
+            "status": game.get("status", {}),
+            "venue": game.get("venue", {}),
             "teams": game["teams"],
         }
         for date_item in response.json().get("dates", [])
@@ -117,27 +375,58 @@ def _extract_team_schedules(response: httpx.Response) -> List[dict[str, Any]]:
     return schedules
 
 
+def _game_id_from_url(response: httpx.Response) -> int:
+    return int(str(response.url).split("/game/")[1].split("/feed")[0])
+
+
+def _extract_game(response: httpx.Response) -> dict[str, Any]:
+    feed = response.json()
+    return {
+        "game_id": _game_id_from_url(response),
+        # Moves whenever anything in the feed changes
+        "timestamp": feed.get("metaData", {}).get("timeStamp"),
+        "datetime": feed.get("gameData", {}).get("datetime", {}),
+        "status": feed.get("gameData", {}).get("status", {}),
+        "venue": feed.get("gameData", {}).get("venue", {}),
+        "teams": feed.get("gameData", {}).get("teams", {}),
+        "linescore": feed.get("liveData", {}).get("linescore", {}),
+        "weather": feed.get("gameData", {}).get("weather", {}),
+        "boxscore": feed.get("liveData", {}).get("boxscore", {}),
+    }
+
+
 def _extract_game_information(
     responses: List[httpx.Response],
 ) -> List[dict[str, Any]]:
-    game_info: List[dict[str, Any]] = [
-        {
-            "game_id": int(str(response.url).split("/game/")[1].split("/feed")[0]),
-            "datetime": response.json().get("gameData", {}).get("datetime", {}),
-            "status": response.json().get("gameData", {}).get("status", {}),
-            "venue": response.json().get("gameData", {}).get("venue", {}),
-            "teams": response.json().get("gameData", {}).get("teams", {}),
-            "linescore": response.json().get("liveData", {}).get("linescore", {}),
-            "weather": response.json().get("gameData", {}).get("weather", {}),
-            "boxscore": response.json().get("liveData", {}).get("boxscore", {}),
-        }
-        for response in responses
-    ]
+    game_info: List[dict[str, Any]] = []
+
+    for response in responses:
+        try:
+            game_info.append(_extract_game(response))
+        except RECORD_ERRORS as error:
+            record("games", _game_id_from_url(response), "extract", error)
 
     return game_info
 
 
-async def _get_games(start_date: str, end_date: str) -> List[dict[str, Any]]:
+def _select(
+    schedules: List[dict[str, Any]], policy: FetchPolicy
+) -> List[dict[str, Any]]:
+    """Scheduled games the policy fetches a feed for, counting the others"""
+    selected = [schedule for schedule in schedules if policy.admits(schedule)]
+
+    if skipped := len(schedules) - len(selected):
+        skipped_fetches[policy.value] += skipped
+        logging.info(f"{policy.value}: skipped {skipped} of {len(schedules)} feeds")
+
+    return selected
+
+
+async def _get_games(
+    start_date: str,
+    end_date: str,
+    policy: FetchPolicy = FetchPolicy.GAME_INFORMATION,
+) -> List[dict[str, Any]]:
     """Async function to get game information for a date range"""
     # Get schedules first
     schedules = await _fetch_data(
@@ -147,86 +436,231 @@ async def _get_games(start_date: str, end_date: str) -> List[dict[str, Any]]:
         end_date=end_date,
     )
 
-    # Gather all game API calls concurrently
-    game_responses = await asyncio.gather(
-        *[
-            _get_api_endpoints_and_params(
-                endpoint_type="game_information", game_id=schedule["game_id"]
-            )
-            for schedule in schedules
-        ]
+    return await _fetch_games(_select(schedules, policy))
+
+
+async def _fetch_games(schedules: List[dict[str, Any]]) -> List[dict[str, Any]]:
+    """Fetch and extract every scheduled game, skipping and recording failures"""
+    started = time.perf_counter()
+    completions: List[float] = []
+
+    async def fetch(schedule: dict[str, Any]) -> httpx.Response:
+        response = await _get_api_endpoints_and_params(
+            endpoint_type="game_information",
+            game_id=schedule["game_id"],
+            game_date=schedule.get("game_date"),
+        )
+        completions.append(time.perf_counter() - started)
+        response.raise_for_status()
+        return response
+
+    # Gather all game API calls concurrently; one failed game must not discard
+    # the others, so exceptions come back as results
+    results = await asyncio.gather(
+        *[fetch(s) for s in schedules], return_exceptions=True
     )
+    _log_batch("game_information", completions)
+
+    games = []
+    for schedule, result in zip(schedules, results):
+        if isinstance(result, Exception):
+            record(
+                "games",
+                schedule["game_id"],
+                "fetch",
+                result,
+                game_date=schedule.get("game_date"),
+            )
+            continue
+
+        try:
+            games.append(_extract_game(result))
+        except RECORD_ERRORS as error:
+            record(
+                "games",
+                schedule["game_id"],
+                "extract",
+                error,
+                payload=result.text,
+                game_date=schedule.get("game_date"),
+            )
 
-    # Extract data from all responses
-    return _extract_game_information(game_responses)
+    return games
 
 
 def _extract_game_logs_from_boxscore(
     game_data: dict[str, Any], log_type: GameLogType
 ) -> List[dict[str, Any]]:
-    game_id = game_data.get("game_id")
-    boxscore = game_data.get("boxscore", {})
-
-    logs = []
-
-    # JSONPath to get all players with the specific stats type
-    # For batting: finds all players where stats.batting exists
-    # For pitching: finds all players where stats.pitching exists
-    player_jsonpath = parse(f"$.teams[*].players.*[?stats.{log_type.stats_key}]")
-
-    # Find all matching players across both teams
-    player_matches = player_jsonpath.find(boxscore)
-
-    for match in player_matches:
-        player = match.value
-
-        # Determine which team (home/away) this player is on
-        # Navigate up the JSON tree to find team context
-        path_parts = str(match.full_path).split(".")
-        team_type = (
-            path_parts[1].replace("teams[", "").replace("]", "").strip("'")
-        )  # Extract 'home' or 'away'
-
-        team_data = boxscore["teams"][team_type]
-        team_id = team_data["team"]["id"]
-        is_home = team_type == "home"
-
-        # Get opponent
-        opponent_type = "away" if team_type == "home" else "home"
-        opponent_team_id = boxscore["teams"][opponent_type]["team"]["id"]
-
-        log = {
-            "gamePk": game_id,
-            "playerId": player["person"]["id"],
-            "teamId": team_id,
-            "opponentTeamId": opponent_team_id,
-            "isHome": is_home,
-            "position": player.get("position"),
-            "stats": player["stats"],
-        }
-        logs.append(log)
+    return extract_game_logs(game_data, log_type.stats_key)
+
+
+async def _stream_game_plays(
+    client: httpx.AsyncClient, game_id: int
+) -> AsyncIterator[dict[str, Any]]:
+    """Stream a game's plays one at a time without decoding the whole feed"""
+    url, params = _build_request(endpoint_type="plays", game_id=game_id)
+
+    # Push parser: chunks are fed in as they arrive and only the play currently
+    # being parsed is held in memory, so long games do not grow the footprint
+    plays = ijson.sendable_list()
+    parser = ijson.items_coro(plays, PLAYS_JSON_PREFIX, use_float=True)
+
+    await limiter.acquire(_admit("plays"))
+    started = time.perf_counter()
+
+    try:
+        async with client.stream("GET", url, params=params) as response:
+            await _observe("plays", response, started)
+            response.raise_for_status()
+
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+
+                for play in plays:
+                    yield play
+                del plays[:]
+    except httpx.TransportError:
+        _breaker("plays").record_failure()
+        raise
+
+    parser.close()
+    for play in plays:
+        yield play
+
+
+def _extract_play(
+    game_id: int, play: dict[str, Any]
+) -> tuple[dict[str, Any], List[dict[str, Any]]]:
+    at_bat = {"gamePk": game_id, **play}
+
+    # Only pitches are kept; pickoffs, substitutions etc. are also playEvents
+    at_bat_index = play.get("about", {}).get("atBatIndex")
+    pitches = [
+        {"gamePk": game_id, "atBatIndex": at_bat_index, **event}
+        for event in play.get("playEvents", [])
+        if event.get("isPitch")
+    ]
+
+    return at_bat, pitches
 
-    return logs
+
+REFERENCE_EXTRACTORS = {
+    "teams": _extract_teams,
+    "venues": _extract_venues,
+    "players": _extract_players,
+}
+
+
+async def fetch_reference(kind: str, season: int) -> List[dict[str, Any]]:
+    """Raw teams, venues or players of a season, refetched only once expired"""
+    return await reference.get(
+        kind,
+        season,
+        lambda headers: _get_api_endpoints_and_params(
+            kind, season=season, headers=headers
+        ),
+        REFERENCE_EXTRACTORS[kind],
+    )
 
 
 def process_teams(season: int) -> List[Team]:
     """Process teams and return validated models"""
-    extracted_data = asyncio.run(
-        _fetch_data(endpoint_type="teams", extract_func=_extract_teams, season=season)
+    extracted_data = asyncio.run(fetch_reference("teams", season))
+
+    return validate_each(
+        Team,
+        extracted_data,
+        "teams",
+        key=lambda t: t.get("id"),
+        params=lambda _: {"season": season},
     )
 
-    return [Team.model_validate(team) for team in extracted_data]
+
+def process_venues(season: int) -> List[Venue]:
+    """Process venues and return validated models"""
+    extracted_data = asyncio.run(fetch_reference("venues", season))
+
+    return validate_each(
+        Venue,
+        extracted_data,
+        "venues",
+        key=lambda v: v.get("id"),
+        params=lambda _: {"season": season},
+    )
 
 
 def process_players(season: int) -> List[Player]:
     """Process players and return validated models"""
-    extracted_data = asyncio.run(
-        _fetch_data(
-            endpoint_type="players", extract_func=_extract_players, season=season
-        )
+    extracted_data = asyncio.run(fetch_reference("players", season))
+
+    return validate_each(
+        Player,
+        extracted_data,
+        "players",
+        key=lambda p: p.get("id"),
+        params=lambda _: {"season": season},
     )
 
-    return [Player.model_validate(player) for player in extracted_data]
+
+def process_player_season_stats(
+    season: int,
+    player_ids: List[int] | None = None,
+    chunk_size: int = 100,
+    max_concurrency: int = 4,
+) -> tuple[List[PlayerSeasonBattingStats], List[PlayerSeasonPitchingStats]]:
+    """Process season and sabermetric stats for many players per request"""
+
+    async def fetch_all() -> List[dict[str, Any]]:
+        ids = player_ids
+        if ids is None:
+            players = await _fetch_data(
+                endpoint_type="players", extract_func=_extract_players, season=season
+            )
+            ids = [player["id"] for player in players]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_chunk(chunk: List[int]) -> List[dict[str, Any]]:
+            async with semaphore:
+                return await _fetch_data(
+                    endpoint_type="player_stats",
+                    extract_func=_extract_player_season_stats,
+                    player_ids=chunk,
+                    season=season,
+                )
+
+        chunk_ids = [
+            ids[start : start + chunk_size] for start in range(0, len(ids), chunk_size)
+        ]
+        chunks = await asyncio.gather(
+            *[fetch_chunk(chunk) for chunk in chunk_ids], return_exceptions=True
+        )
+
+        records = []
+        for chunk, result in zip(chunk_ids, chunks):
+            if isinstance(result, Exception):
+                # Each player is retried on its own, whatever chunk it lands in
+                for player_id in chunk:
+                    record("player_stats", player_id, "fetch", result, season=season)
+                continue
+            records.extend(result)
+        return records
+
+    extracted_data = asyncio.run(fetch_all())
+
+    def validate(model: Type, group: str) -> List:
+        return validate_each(
+            model,
+            (item for item in extracted_data if item["group"] == group),
+            "player_stats",
+            key=lambda item: item.get("playerId"),
+            params=lambda _: {"season": season},
+        )
+
+    batting = validate(PlayerSeasonBattingStats, "hitting")
+    pitching = validate(PlayerSeasonPitchingStats, "pitching")
+
+    return batting, pitching
 
 
 def process_schedules(start_date: str, end_date: str) -> List[TeamSchedules]:
@@ -240,21 +674,125 @@ def process_schedules(start_date: str, end_date: str) -> List[TeamSchedules]:
         )
     )
 
-    return [TeamSchedules.model_validate(schedule) for schedule in extracted_data]
+    return validate_each(
+        TeamSchedules,
+        extracted_data,
+        "schedules",
+        key=lambda schedule: schedule.get("game_id"),
+        params=lambda schedule: {"game_date": schedule.get("game_date")},
+    )
+
+
+async def fetch_game_information(
+    start_date: str, end_date: str
+) -> List[GameInformation]:
+    """Fetch game information and return validated models"""
+    return _validate_games(await _get_games(start_date, end_date))
+
+
+async def fetch_live_games(
+    game_date: str, box_scores: LiveBoxScores
+) -> tuple[List[GameInformation], dict[GameLogType, GameLogBatch]]:
+    """
+    Poll a day's games for their state and the game log lines that changed.
+
+    Args:
+        box_scores: Lines applied by earlier polls, updated in place
+
+    Returns:
+        Validated game information and, per GameLogType, a batch of the lines
+        that are new or changed since the previous poll
+    """
+    games_data = await _get_games(game_date, game_date)
+    return _validate_games(games_data), box_scores.update(
+        games_data, on_error=_record_log_error
+    )
+
+
+def _validate_games(games_data: List[dict[str, Any]]) -> List[GameInformation]:
+    return validate_each(
+        GameInformation, games_data, "games", key=lambda game: game.get("game_id")
+    )
 
 
 def process_game_information(start_date: str, end_date: str) -> List[GameInformation]:
     """Process game information and return validated models"""
-    extracted_data = asyncio.run(_get_games(start_date, end_date))
+    return asyncio.run(fetch_game_information(start_date, end_date))
+
+
+def process_game_log_batch(
+    start_date: str, end_date: str, log_type: GameLogType
+) -> GameLogBatch:
+    """Process game logs straight into a columnar batch without per-row models"""
+    games_data = asyncio.run(_get_games(start_date, end_date, FetchPolicy.GAME_LOGS))
+
+    return _game_log_batch(games_data, log_type)
+
+
+def process_game_log_batches(
+    start_date: str, end_date: str
+) -> dict[GameLogType, GameLogBatch]:
+    """Batting and pitching batches from a single fetch of each finished game"""
+    games_data = asyncio.run(_get_games(start_date, end_date, FetchPolicy.GAME_LOGS))
+
+    batches = {
+        log_type: _game_log_batch(games_data, log_type) for log_type in GameLogType
+    }
+    # Games whose lines disagree with their linescore are refetched later
+    flag_mismatches(games_data, batches.values())
+    return batches
+
+
+def _game_log_batch(
+    games_data: List[dict[str, Any]], log_type: GameLogType
+) -> GameLogBatch:
+    return GameLogBatch.from_logs(
+        log_type.model,
+        (
+            log
+            for game_data in games_data
+            for log in _extract_game_logs_from_boxscore(game_data, log_type)
+        ),
+        on_error=_record_log_error,
+    )
+
 
-    return [GameInformation.model_validate(game) for game in extracted_data]
+def _record_log_error(log: dict[str, Any], error: Exception) -> None:
+    # A bad log fails its game, which is refetched as a whole
+    record("games", log.get("gamePk"), "validate", error, payload=log)
+
+
+def process_games(
+    games: List[tuple[int, str | None]],
+) -> tuple[List[GameInformation], List[GameLogBatch]]:
+    """
+    Fetch specific games, e.g. ones that failed before, with their game logs.
+
+    Args:
+        games: (game_id, game_date) pairs; the date only partitions the archive
+
+    Returns:
+        Validated game information and one game log batch per GameLogType
+    """
+    games_data = asyncio.run(
+        _fetch_games(
+            [
+                {"game_id": game_id, "game_date": game_date}
+                for game_id, game_date in games
+            ]
+        )
+    )
+
+    batches = [_game_log_batch(games_data, log_type) for log_type in GameLogType]
+    flag_mismatches(games_data, batches)
+    return _validate_games(games_data), batches
 
 
 def process_game_logs(
     start_date: str, end_date: str, log_type: GameLogType
 ) -> Union[List[BatterGameLog], List[PitcherGameLog]]:
-    # Reuse _get_games to fetch all game data
-    games_data = asyncio.run(_get_games(start_date, end_date))
+    # Reuse _get_games to fetch all finished games
+    games_data = asyncio.run(_get_games(start_date, end_date, FetchPolicy.GAME_LOGS))
 
     # Extract logs from each game and flatten
     all_logs = []
@@ -263,6 +801,192 @@ def process_game_logs(
         all_logs.extend(logs)
 
     # Validate with appropriate Pydantic model
-    validated_logs = [log_type.model.model_validate(log) for log in all_logs]
+    validated_logs = validate_each(
+        log_type.model, all_logs, "games", key=lambda log: log.get("gamePk")
+    )
 
     return validated_logs
+
+
+def _validate_play(
+    game_id: int, play: dict[str, Any]
+) -> tuple[AtBat, List[PitchEvent]] | None:
+    """Validated at-bat and pitches of a play, or None if it was recorded as failed"""
+    at_bat, pitches = _extract_play(game_id, play)
+    try:
+        return (
+            AtBat.model_validate(at_bat),
+            [PitchEvent.model_validate(pitch) for pitch in pitches],
+        )
+    except RECORD_ERRORS as error:
+        # A game's plays are refetched together, so the game is what failed
+        record("plays", game_id, "validate", error, payload=play)
+        return None
+
+
+async def stream_plays(
+    start_date: str,
+    end_date: str,
+    max_concurrency: int = 4,
+    policy: FetchPolicy = FetchPolicy.PLAYS,
+    include: Collection[int] = (),
+) -> AsyncIterator[tuple[AtBat, List[PitchEvent]]]:
+    """
+    Stream validated at-bats and their pitches for a date range.
+
+    Args:
+        policy: Which scheduled games are streamed
+        include: Game ids streamed whatever the policy says, e.g. games that
+                 were live on the previous poll and have just gone final
+    """
+    schedules = await _fetch_data(
+        endpoint_type="schedule",
+        extract_func=_extract_team_schedules,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    included = [schedule for schedule in schedules if schedule["game_id"] in include]
+    selected = _select(
+        [schedule for schedule in schedules if schedule["game_id"] not in include],
+        policy,
+    )
+
+    async for item in stream_game_plays(
+        [schedule["game_id"] for schedule in (*included, *selected)],
+        max_concurrency,
+    ):
+        yield item
+
+
+async def stream_game_plays(
+    game_ids: List[int], max_concurrency: int = 4
+) -> AsyncIterator[tuple[AtBat, List[PitchEvent]]]:
+    """
+    Stream validated at-bats and their pitches for specific games.
+
+    A game whose feed fails is recorded and skipped; plays it already yielded
+    are kept, as they are upserted again when the game is retried.
+    """
+    # Bounded so that producers wait for ingestion instead of buffering plays
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 16)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    done = object()
+
+    started = time.perf_counter()
+    completions: List[float] = []
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+
+        async def produce(game_id: int) -> None:
+            async with semaphore:
+                try:
+                    async for play in _stream_game_plays(client, game_id):
+                        if (item := _validate_play(game_id, play)) is not None:
+                            await queue.put(item)
+                except (
+                    httpx.HTTPError,
+                    ijson.JSONError,
+                    CircuitOpenError,
+                    *RECORD_ERRORS,
+                ) as error:
+                    record("plays", game_id, "fetch", error)
+                    return
+            completions.append(time.perf_counter() - started)
+
+        async def produce_all() -> None:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for game_id in game_ids:
+                        group.create_task(produce(game_id))
+            finally:
+                # Nobody is left to read the sentinel once the consumer cancelled us
+                if not asyncio.current_task().cancelling():
+                    await queue.put(done)
+
+        producer = asyncio.create_task(produce_all())
+
+        try:
+            while (item := await queue.get()) is not done:
+                yield item
+        except BaseException:
+            producer.cancel()
+            raise
+
+        # Surface any producer failure once the queue has drained
+        await producer
+        _log_batch("plays", completions)
+
+
+def _reprocess_segment(
+    path: str, target: ReprocessTarget, start_date: str, end_date: str
+) -> tuple[List[Any], List[FailedItem]]:
+    """
+    Validated records of one segment, run in a worker process.
+
+    The worker has no collect() of its own caller, so the failures it recorded
+    are returned for reprocess() to add in the parent.
+    """
+    with collect() as failed:
+        return _validate_segment(path, target, start_date, end_date), failed
+
+
+def _validate_segment(
+    path: str, target: ReprocessTarget, start_date: str, end_date: str
+) -> List[Any]:
+    responses = [response for response in read_segment(path) if response.is_success]
+
+    match target:
+        case ReprocessTarget.SCHEDULES:
+            return validate_each(
+                TeamSchedules,
+                (
+                    schedule
+                    for response in responses
+                    for schedule in _extract_team_schedules(response)
+                    # A schedule fetched for a wider range than the replay
+                    if start_date <= schedule["game_date"] <= end_date
+                ),
+                "schedules",
+                key=lambda schedule: schedule.get("game_id"),
+            )
+        case ReprocessTarget.GAME_INFORMATION:
+            return _validate_games(_extract_game_information(responses))
+        case ReprocessTarget.PLAYS:
+            plays = []
+            for response in responses:
+                game_id = _game_id_from_url(response)
+                for play in ijson.items(
+                    response.content, PLAYS_JSON_PREFIX, use_float=True
+                ):
+                    if (item := _validate_play(game_id, play)) is not None:
+                        plays.append(item)
+            return plays
+
+
+def reprocess(
+    target: ReprocessTarget,
+    start_date: str,
+    end_date: str,
+    root: str | None = None,
+    processes: int | None = None,
+) -> Iterator[List[Any]]:
+    """Replay archived responses through extraction and validation, no network"""
+    source = RawArchive(root) if root else archive
+    if source is None:
+        raise ValueError("MLB_ARCHIVE_DIR environment variable is not set")
+
+    paths = source.segments(target.endpoint_type, start_date, end_date)
+
+    # One validated batch per segment, yielded in archive order so later
+    # fetches of the same record win when upserted
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for validated, failed in executor.map(
+            _reprocess_segment,
+            map(str, paths),
+            repeat(target),
+            repeat(start_date),
+            repeat(end_date),
+        ):
+            extend(failed)
+            yield validated
@@ -1,33 +1,81 @@
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Annotated, Any
 
-from pydantic import Field, model_validator
+from pydantic import BeforeValidator, Field, model_validator
 
 from common.models import CustomModel
 
+# Placeholders the Stats API renders for undefined rates, e.g. ERA with no outs
+UNDEFINED_RATES = frozenset({"", "-", "-.--", ".---", "-.---", "---", "*.**", "∞"})
+
+
+def parse_date(value: Any) -> Any:
+    """Official dates arrive as YYYY-MM-DD strings"""
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def parse_timestamp(value: Any) -> Any:
+    """ISO 8601 timestamps with a trailing Z, or empty when unknown"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value) if value else None
+    return value
+
+
+def parse_rate(value: Any) -> Any:
+    """Formatted rates such as ".300", "4.50" or "6.1" (innings), or a placeholder"""
+    if isinstance(value, str):
+        value = value.strip()
+        if value in UNDEFINED_RATES:
+            return None
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            raise ValueError(f"Not a rate: {value!r}") from None
+    return value
+
+
+IsoDate = Annotated[date, BeforeValidator(parse_date)]
+IsoTimestamp = Annotated[datetime | None, BeforeValidator(parse_timestamp)]
+Rate = Annotated[Decimal | None, BeforeValidator(parse_rate)]
+
 
 class TeamSchedules(CustomModel):
-    game_date: str = Field(..., alias="game_date")
+    season: int = Field(...)
+    game_date: IsoDate = Field(..., alias="game_date")
     game_id: int = Field(..., alias="game_id")
     home_team_id: int = Field(..., alias="home_team_id")
     home_team_name: str = Field(..., alias="home_team_name")
     away_team_id: int = Field(..., alias="away_team_id")
     away_team_name: str = Field(..., alias="away_team_name")
+    venue_id: int | None = Field(default=None)
+    home_probable_pitcher_id: int | None = Field(default=None)
+    away_probable_pitcher_id: int | None = Field(default=None)
 
     @model_validator(mode="before")
     @classmethod
     def process_team_id_names(cls, values: dict[str, Any]) -> dict[str, Any]:
+        values["season"] = int(values["game_date"][:4])
+        values["venue_id"] = values.get("venue", {}).get("id")
+
         for team in ["home", "away"]:
             values[f"{team}_team_id"] = values["teams"][team]["team"]["id"]
             values[f"{team}_team_name"] = values["teams"][team]["team"]["name"]
+            # Only hydrated once the club announces its starter
+            values[f"{team}_probable_pitcher_id"] = (
+                values["teams"][team].get("probablePitcher", {}).get("id")
+            )
 
         return values
 
 
 class GameInformation(CustomModel):
     game_id: int = Field(..., alias="game_id")
-    game_date: str = Field(...)
-    game_datetime: str | None = Field(default=None)
+    season: int = Field(...)
+    game_date: IsoDate = Field(...)
+    game_datetime: IsoTimestamp = Field(default=None)
     game_status: str | None = Field(default=None)
     detailed_state: str | None = Field(default=None)
     day_night: str | None = Field(default=None)
@@ -39,10 +87,10 @@ class GameInformation(CustomModel):
     away_team_name: str | None = Field(default=None)
     home_wins: int | None = Field(default=None)
     home_losses: int | None = Field(default=None)
-    home_win_pct: str | None = Field(default=None)
+    home_win_pct: Rate = Field(default=None)
     away_wins: int | None = Field(default=None)
     away_losses: int | None = Field(default=None)
-    away_win_pct: str | None = Field(default=None)
+    away_win_pct: Rate = Field(default=None)
     home_score: int | None = Field(default=None)
     away_score: int | None = Field(default=None)
     wind: str | None = Field(default=None)
@@ -65,6 +113,7 @@ class GameInformation(CustomModel):
 
         # Date/time from datetime dict
         values["game_date"] = datetime_info.get("officialDate")
+        values["season"] = int(values["game_date"][:4])
         values["game_datetime"] = datetime_info.get("dateTime")
         values["day_night"] = datetime_info.get("dayNight")
 
@@ -122,12 +171,18 @@ class Team(CustomModel):
         return values
 
 
+class Venue(CustomModel):
+    venue_id: int = Field(..., alias="id")
+    name: str = Field(..., alias="name")
+    active: bool = Field(default=True, alias="active")
+
+
 class Player(CustomModel):
     player_id: int = Field(..., alias="id")
     full_name: str = Field(..., alias="fullName")
     first_name: str = Field(..., alias="firstName")
     last_name: str = Field(..., alias="lastName")
-    birth_date: str | None = Field(default=None, alias="birthDate")
+    birth_date: IsoDate | None = Field(default=None, alias="birthDate")
     current_age: int | None = Field(default=None, alias="currentAge")
     birth_city: str | None = Field(default=None, alias="birthCity")
     birth_country: str | None = Field(default=None, alias="birthCountry")
@@ -190,6 +245,8 @@ class PlayerTeamHistory(CustomModel):
 class BatterGameLog(CustomModel):
     game_id: int = Field(..., alias="gamePk")
     player_id: int = Field(..., alias="playerId")
+    season: int = Field(...)
+    game_date: IsoDate = Field(..., alias="gameDate")
     team_id: int = Field(..., alias="teamId")
     opponent_team_id: int = Field(..., alias="opponentTeamId")
     is_home: bool = Field(..., alias="isHome")
@@ -225,12 +282,15 @@ class BatterGameLog(CustomModel):
     air_outs: int = Field(default=0)
     pop_outs: int = Field(default=0)
     line_outs: int = Field(default=0)
-    stolen_base_percentage: str | None = Field(default=None)
-    at_bats_per_home_run: str | None = Field(default=None)
+    stolen_base_percentage: Rate = Field(default=None)
+    at_bats_per_home_run: Rate = Field(default=None)
 
     @model_validator(mode="before")
     @classmethod
     def extract_batter_game_log(cls, values: dict[str, Any]) -> dict[str, Any]:
+        if values.get("gameDate"):
+            values["season"] = int(values["gameDate"][:4])
+
         # Extract position info
         if "position" in values and isinstance(values["position"], dict):
             values["position_code"] = values["position"].get("code")
@@ -278,6 +338,8 @@ class BatterGameLog(CustomModel):
 class PitcherGameLog(CustomModel):
     game_id: int = Field(..., alias="gamePk")
     player_id: int = Field(..., alias="playerId")
+    season: int = Field(...)
+    game_date: IsoDate = Field(..., alias="gameDate")
     team_id: int = Field(..., alias="teamId")
     opponent_team_id: int = Field(..., alias="opponentTeamId")
     is_home: bool = Field(..., alias="isHome")
@@ -296,13 +358,13 @@ class PitcherGameLog(CustomModel):
     save_opportunities: int = Field(default=0)
     holds: int = Field(default=0)
     blown_saves: int = Field(default=0)
-    innings_pitched: str | None = Field(default=None)
+    innings_pitched: Rate = Field(default=None)
     batters_faced: int = Field(default=0)
     outs: int = Field(default=0)
     pitches_thrown: int = Field(default=0)
     strikes: int = Field(default=0)
     balls: int = Field(default=0)
-    strike_percentage: str | None = Field(default=None)
+    strike_percentage: Rate = Field(default=None)
     hits: int = Field(default=0)
     runs: int = Field(default=0)
     earned_runs: int = Field(default=0)
@@ -330,13 +392,16 @@ class PitcherGameLog(CustomModel):
     catchers_interference: int = Field(default=0)
     stolen_bases: int = Field(default=0)
     caught_stealing: int = Field(default=0)
-    stolen_base_percentage: str | None = Field(default=None)
-    runs_scored_per_9: str | None = Field(default=None)
-    home_runs_per_9: str | None = Field(default=None)
+    stolen_base_percentage: Rate = Field(default=None)
+    runs_scored_per_9: Rate = Field(default=None)
+    home_runs_per_9: Rate = Field(default=None)
 
     @model_validator(mode="before")
     @classmethod
     def extract_pitcher_game_log(cls, values: dict[str, Any]) -> dict[str, Any]:
+        if values.get("gameDate"):
+            values["season"] = int(values["gameDate"][:4])
+
         # Extract position info
         if "position" in values and isinstance(values["position"], dict):
             values["position_code"] = values["position"].get("code")
@@ -399,3 +464,262 @@ class PitcherGameLog(CustomModel):
             values["home_runs_per_9"] = pitching.get("homeRunsPer9")
 
         return values
+
+
+class AtBat(CustomModel):
+    game_id: int = Field(..., alias="gamePk")
+    at_bat_index: int = Field(...)
+    inning: int | None = Field(default=None)
+    half_inning: str | None = Field(default=None)
+    batter_id: int = Field(...)
+    pitcher_id: int = Field(...)
+    bat_side_code: str | None = Field(default=None)
+    pitch_hand_code: str | None = Field(default=None)
+    event: str | None = Field(default=None)
+    event_type: str | None = Field(default=None)
+    description: str | None = Field(default=None)
+    rbi: int = Field(default=0)
+    is_out: bool | None = Field(default=None)
+    balls: int = Field(default=0)
+    strikes: int = Field(default=0)
+    outs: int = Field(default=0)
+    away_score: int | None = Field(default=None)
+    home_score: int | None = Field(default=None)
+    pitch_count: int = Field(default=0)
+    start_time: IsoTimestamp = Field(default=None)
+    end_time: IsoTimestamp = Field(default=None)
+    is_complete: bool = Field(default=False)
+
+    @model_validator(mode="before")
+    @classmethod
+    def extract_at_bat(cls, values: dict[str, Any]) -> dict[str, Any]:
+        result = values.get("result", {})
+        about = values.get("about", {})
+        count = values.get("count", {})
+        matchup = values.get("matchup", {})
+
+        # Ordering within the game
+        values["at_bat_index"] = about.get("atBatIndex")
+        values["inning"] = about.get("inning")
+        values["half_inning"] = about.get("halfInning")
+        values["start_time"] = about.get("startTime")
+        values["end_time"] = about.get("endTime")
+        values["is_complete"] = about.get("isComplete", False)
+
+        # Batter/pitcher matchup
+        values["batter_id"] = matchup.get("batter", {}).get("id")
+        values["pitcher_id"] = matchup.get("pitcher", {}).get("id")
+        values["bat_side_code"] = matchup.get("batSide", {}).get("code")
+        values["pitch_hand_code"] = matchup.get("pitchHand", {}).get("code")
+
+        # Outcome of the plate appearance
+        values["event"] = result.get("event")
+        values["event_type"] = result.get("eventType")
+        values["description"] = result.get("description")
+        values["rbi"] = result.get("rbi", 0)
+        values["is_out"] = result.get("isOut")
+        values["away_score"] = result.get("awayScore")
+        values["home_score"] = result.get("homeScore")
+
+        # Final count
+        values["balls"] = count.get("balls", 0)
+        values["strikes"] = count.get("strikes", 0)
+        values["outs"] = count.get("outs", 0)
+
+        values["pitch_count"] = sum(
+            1 for event in values.get("playEvents", []) if event.get("isPitch")
+        )
+
+        return values
+
+
+class PitchEvent(CustomModel):
+    game_id: int = Field(..., alias="gamePk")
+    at_bat_index: int = Field(..., alias="atBatIndex")
+    event_index: int = Field(..., alias="index")
+    pitch_number: int | None = Field(default=None, alias="pitchNumber")
+    play_id: str | None = Field(default=None, alias="playId")
+    call_code: str | None = Field(default=None)
+    call_description: str | None = Field(default=None)
+    pitch_type_code: str | None = Field(default=None)
+    pitch_type_description: str | None = Field(default=None)
+    is_in_play: bool | None = Field(default=None)
+    is_strike: bool | None = Field(default=None)
+    is_ball: bool | None = Field(default=None)
+    balls: int = Field(default=0)
+    strikes: int = Field(default=0)
+    outs: int = Field(default=0)
+    start_speed: float | None = Field(default=None)
+    end_speed: float | None = Field(default=None)
+    spin_rate: int | None = Field(default=None)
+    zone: int | None = Field(default=None)
+    launch_speed: float | None = Field(default=None)
+    launch_angle: float | None = Field(default=None)
+    total_distance: float | None = Field(default=None)
+
+    @model_validator(mode="before")
+    @classmethod
+    def extract_pitch_event(cls, values: dict[str, Any]) -> dict[str, Any]:
+        details = values.get("details", {})
+        count = values.get("count", {})
+        pitch_data = values.get("pitchData", {})
+        hit_data = values.get("hitData", {})
+
+        # Umpire call and pitch classification
+        values["call_code"] = details.get("call", {}).get("code")
+        values["call_description"] = details.get("call", {}).get("description")
+        values["pitch_type_code"] = details.get("type", {}).get("code")
+        values["pitch_type_description"] = details.get("type", {}).get("description")
+        values["is_in_play"] = details.get("isInPlay")
+        values["is_strike"] = details.get("isStrike")
+        values["is_ball"] = details.get("isBall")
+
+        # Count after the pitch
+        values["balls"] = count.get("balls", 0)
+        values["strikes"] = count.get("strikes", 0)
+        values["outs"] = count.get("outs", 0)
+
+        # Pitch tracking
+        values["start_speed"] = pitch_data.get("startSpeed")
+        values["end_speed"] = pitch_data.get("endSpeed")
+        values["spin_rate"] = pitch_data.get("breaks", {}).get("spinRate")
+        values["zone"] = pitch_data.get("zone")
+
+        # Batted ball tracking
+        values["launch_speed"] = hit_data.get("launchSpeed")
+        values["launch_angle"] = hit_data.get("launchAngle")
+        values["total_distance"] = hit_data.get("totalDistance")
+
+        return values
+
+
+class PlayerSeasonBattingStats(CustomModel):
+    player_id: int = Field(..., alias="playerId")
+    season: int = Field(...)
+    team_id: int | None = Field(default=None, alias="teamId")
+    games_played: int = Field(default=0)
+    plate_appearances: int = Field(default=0)
+    at_bats: int = Field(default=0)
+    runs: int = Field(default=0)
+    hits: int = Field(default=0)
+    doubles: int = Field(default=0)
+    triples: int = Field(default=0)
+    home_runs: int = Field(default=0)
+    rbi: int = Field(default=0)
+    base_on_balls: int = Field(default=0)
+    strike_outs: int = Field(default=0)
+    hit_by_pitch: int = Field(default=0)
+    stolen_bases: int = Field(default=0)
+    caught_stealing: int = Field(default=0)
+    total_bases: int = Field(default=0)
+    avg: Rate = Field(default=None)
+    obp: Rate = Field(default=None)
+    slg: Rate = Field(default=None)
+    ops: Rate = Field(default=None)
+    babip: Rate = Field(default=None)
+    woba: float | None = Field(default=None)
+    wrc_plus: float | None = Field(default=None)
+    war: float | None = Field(default=None)
+    speed_score: float | None = Field(default=None)
+
+    @model_validator(mode="before")
+    @classmethod
+    def extract_season_batting(cls, values: dict[str, Any]) -> dict[str, Any]:
+        season = values.get("stats", {}).get("season", {})
+        sabermetrics = values.get("stats", {}).get("sabermetrics", {})
+
+        # Counting and rate stats from the season split
+        values["games_played"] = season.get("gamesPlayed", 0)
+        values["plate_appearances"] = season.get("plateAppearances", 0)
+        values["at_bats"] = season.get("atBats", 0)
+        values["runs"] = season.get("runs", 0)
+        values["hits"] = season.get("hits", 0)
+        values["doubles"] = season.get("doubles", 0)
+        values["triples"] = season.get("triples", 0)
+        values["home_runs"] = season.get("homeRuns", 0)
+        values["rbi"] = season.get("rbi", 0)
+        values["base_on_balls"] = season.get("baseOnBalls", 0)
+        values["strike_outs"] = season.get("strikeOuts", 0)
+        values["hit_by_pitch"] = season.get("hitByPitch", 0)
+        values["stolen_bases"] = season.get("stolenBases", 0)
+        values["caught_stealing"] = season.get("caughtStealing", 0)
+        values["total_bases"] = season.get("totalBases", 0)
+        values["avg"] = season.get("avg")
+        values["obp"] = season.get("obp")
+        values["slg"] = season.get("slg")
+        values["ops"] = season.get("ops")
+        values["babip"] = season.get("babip")
+
+        # Advanced stats from the sabermetrics split
+        values["woba"] = sabermetrics.get("woba")
+        values["wrc_plus"] = sabermetrics.get("wRcPlus")
+        values["war"] = sabermetrics.get("war")
+        values["speed_score"] = sabermetrics.get("spd")
+
+        return values
+
+
+class PlayerSeasonPitchingStats(CustomModel):
+    player_id: int = Field(..., alias="playerId")
+    season: int = Field(...)
+    team_id: int | None = Field(default=None, alias="teamId")
+    games_played: int = Field(default=0)
+    games_started: int = Field(default=0)
+    wins: int = Field(default=0)
+    losses: int = Field(default=0)
+    saves: int = Field(default=0)
+    innings_pitched: Rate = Field(default=None)
+    outs: int = Field(default=0)
+    batters_faced: int = Field(default=0)
+    pitches_thrown: int = Field(default=0)
+    hits: int = Field(default=0)
+    earned_runs: int = Field(default=0)
+    home_runs: int = Field(default=0)
+    base_on_balls: int = Field(default=0)
+    strike_outs: int = Field(default=0)
+    era: Rate = Field(default=None)
+    whip: Rate = Field(default=None)
+    avg: Rate = Field(default=None)
+    strikeouts_per_9: Rate = Field(default=None)
+    walks_per_9: Rate = Field(default=None)
+    hits_per_9: Rate = Field(default=None)
+    fip: float | None = Field(default=None)
+    xfip: float | None = Field(default=None)
+    era_minus: float | None = Field(default=None)
+    war: float | None = Field(default=None)
+
+    @model_validator(mode="before")
+    @classmethod
+    def extract_season_pitching(cls, values: dict[str, Any]) -> dict[str, Any]:
+        season = values.get("stats", {}).get("season", {})
+        sabermetrics = values.get("stats", {}).get("sabermetrics", {})
+
+        # Counting and rate stats from the season split
+        values["games_played"] = season.get("gamesPlayed", 0)
+        values["games_started"] = season.get("gamesStarted", 0)
+        values["wins"] = season.get("wins", 0)
+        values["losses"] = season.get("losses", 0)
+        values["saves"] = season.get("saves", 0)
+        values["innings_pitched"] = season.get("inningsPitched")
+        values["outs"] = season.get("outs", 0)
+        values["batters_faced"] = season.get("battersFaced", 0)
+        values["pitches_thrown"] = season.get("numberOfPitches", 0)
+        values["hits"] = season.get("hits", 0)
+        values["earned_runs"] = season.get("earnedRuns", 0)
+        values["home_runs"] = season.get("homeRuns", 0)
+        values["base_on_balls"] = season.get("baseOnBalls", 0)
+        values["strike_outs"] = season.get("strikeOuts", 0)
+        values["era"] = season.get("era")
+        values["whip"] = season.get("whip")
+        values["avg"] = season.get("avg")
+        values["strikeouts_per_9"] = season.get("strikeoutsPer9Inn")
+        values["walks_per_9"] = season.get("walksPer9Inn")
+        values["hits_per_9"] = season.get("hitsPer9Inn")
+
+        # Advanced stats from the sabermetrics split
+        values["fip"] = sabermetrics.get("fip")
+        values["xfip"] = sabermetrics.get("xfip")
+        values["era_minus"] = sabermetrics.get("eraMinus")
+        values["war"] = sabermetrics.get("war")
+
+        return values
@@ -0,0 +1,147 @@
+"""
+Real-time delta push of ingested game changes to websocket subscribers.
+
+Clients connect to /games/{game_id}. On connect they receive the current state of
+that game, then only the fields that changed since the last published version.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, List
+
+from websockets.asyncio.server import ServerConnection, serve
+
+from database import events
+from database.models import AtBat, GameInformation
+
+# Tables whose changes are pushed, keyed by their primary key columns
+PUSHED_TABLES = {
+    model.__tablename__: [column.name for column in model.__table__.primary_key]
+    for model in (GameInformation, AtBat)
+}
+
+
+def _encode(deltas: List[dict[str, Any]]) -> str:
+    return json.dumps({"deltas": deltas}, separators=(",", ":"), default=str)
+
+
+class Subscriber:
+    """
+    A single websocket client.
+
+    Pending deltas are coalesced per row, so a client that falls behind receives
+    one merged update per row instead of every superseded version.
+    """
+
+    def __init__(self, connection: ServerConnection, max_pending: int) -> None:
+        self.connection = connection
+        self.max_pending = max_pending
+        self._pending: dict[tuple[str, tuple], dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+
+    def offer(self, table: str, key: tuple, changes: dict[str, Any]) -> bool:
+        """Queue changes for a row; False once the client is hopelessly behind"""
+        self._pending.setdefault((table, key), {}).update(changes)
+        self._ready.set()
+        return len(self._pending) <= self.max_pending
+
+    async def drain(self) -> None:
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+
+            pending, self._pending = self._pending, {}
+            await self.connection.send(
+                _encode(
+                    [
+                        {"t": table, "k": list(key), "c": changes}
+                        for (table, key), changes in pending.items()
+                    ]
+                )
+            )
+
+
+class PushHub:
+    """
+    Computes field-level deltas from committed ingestion and fans them out to
+    every subscriber of the affected game.
+    """
+
+    def __init__(self, max_pending: int = 5000) -> None:
+        self.max_pending = max_pending
+        self._published: dict[int, dict[tuple[str, tuple], dict[str, Any]]] = {}
+        self._subscribers: dict[int, set[Subscriber]] = {}
+
+    def on_change(self, table: str, rows: List[dict[str, Any]]) -> None:
+        """Change listener for database.events"""
+        key_columns = PUSHED_TABLES.get(table)
+        if key_columns is None:
+            return
+
+        for row in rows:
+            game_id = row["game_id"]
+            key = tuple(row[column] for column in key_columns)
+            state = self._published.setdefault(game_id, {})
+            previous = state.get((table, key))
+
+            if previous is None:
+                changes = dict(row)
+            else:
+                changes = {
+                    field: value
+                    for field, value in row.items()
+                    if previous.get(field) != value
+                }
+
+            if not changes:
+                continue
+
+            state[(table, key)] = dict(row)
+
+            for subscriber in list(self._subscribers.get(game_id, ())):
+                if not subscriber.offer(table, key, changes):
+                    logging.warning(f"Dropping slow subscriber for game {game_id}")
+                    self._subscribers[game_id].discard(subscriber)
+                    asyncio.ensure_future(subscriber.connection.close(1013))
+
+    def forget(self, game_id: int) -> None:
+        """Release published state for a game that is no longer live"""
+        self._published.pop(game_id, None)
+
+    async def handler(self, connection: ServerConnection) -> None:
+        path = connection.request.path.strip("/").split("/")
+        if len(path) != 2 or path[0] != "games" or not path[1].isdigit():
+            await connection.close(1008, "Expected /games/{game_id}")
+            return
+
+        game_id = int(path[1])
+        subscriber = Subscriber(connection, self.max_pending)
+
+        # Start from a snapshot of everything published so far
+        for (table, key), row in self._published.get(game_id, {}).items():
+            subscriber.offer(table, key, row)
+
+        self._subscribers.setdefault(game_id, set()).add(subscriber)
+
+        # Idle clients may disconnect while drain() waits for changes
+        tasks = [
+            asyncio.create_task(subscriber.drain()),
+            asyncio.create_task(connection.wait_closed()),
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._subscribers.get(game_id, set()).discard(subscriber)
+
+
+async def serve_push(hub: PushHub, host: str = "0.0.0.0", port: int = 8765) -> None:
+    """Serve delta pushes until cancelled"""
+    unsubscribe = events.subscribe(hub.on_change)
+    try:
+        async with serve(hub.handler, host, port) as server:
+            await server.serve_forever()
+    finally:
+        unsubscribe()
@@ -0,0 +1,158 @@
+"""
+Consistency checks between extracted game logs and their games' linescores.
+
+Checks run on whole GameLogBatch columns at once: lines are summed per game
+and side with np.bincount and compared with the linescore totals, and each
+pitcher's outs with their innings pitched, so a date range costs a few array
+operations instead of a Python loop over players. Games that fail are
+recorded as "games" dead letters, so --retry-failed fetches them again.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Iterable, List
+
+import numpy as np
+
+from batches import GameLogBatch
+from deadletter import record
+
+# Per game log model: (log column, linescore total, whether the line belongs
+# to the opponent's side); pitchers allow what the other side scores
+SIDE_CHECKS = {
+    "BatterGameLog": (("runs", "runs", False), ("hits", "hits", False)),
+    "PitcherGameLog": (("runs", "runs", True), ("hits", "hits", True)),
+}
+
+LINESCORE_TOTALS = ("runs", "hits")
+
+
+class ReconciliationError(ValueError):
+    """Game logs of a game disagree with its linescore"""
+
+
+def _side_keys(game_ids: np.ndarray, is_home: np.ndarray) -> np.ndarray:
+    return game_ids.astype(np.int64) * 2 + is_home
+
+
+def linescore_totals(
+    games_data: List[dict[str, Any]],
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Linescore totals of each side of each game.
+
+    Returns:
+        Sorted side keys (game_id * 2 + is_home) and, per total, the values
+        aligned with them; games without complete totals are left out
+    """
+    sides = []
+    for game_data in games_data:
+        teams = game_data.get("linescore", {}).get("teams", {})
+        for is_home, side in ((0, "away"), (1, "home")):
+            totals = teams.get(side, {})
+            values = [totals.get(total) for total in LINESCORE_TOTALS]
+            if None not in values:
+                sides.append((game_data["game_id"] * 2 + is_home, *values))
+
+    table = np.array(sides, dtype=np.int64).reshape(-1, 1 + len(LINESCORE_TOTALS))
+    table = table[np.argsort(table[:, 0], kind="stable")]
+    return table[:, 0], {
+        total: table[:, i + 1] for i, total in enumerate(LINESCORE_TOTALS)
+    }
+
+
+def _sum_by_side(
+    batch: GameLogBatch, column: str, keys: np.ndarray, opponent: bool
+) -> np.ndarray:
+    """Column sums aligned with the linescore side keys"""
+    is_home = batch.column("is_home").astype(np.int64)
+    sides = _side_keys(batch.column("game_id"), is_home ^ opponent)
+    if not len(keys):
+        return np.zeros(0, np.int64)
+
+    index = np.minimum(np.searchsorted(keys, sides), len(keys) - 1)
+    known = keys[index] == sides
+
+    # Sides without any line sum to zero, so missing logs are caught too
+    sums = np.bincount(
+        index[known], weights=batch.column(column)[known], minlength=len(keys)
+    )
+    return sums.astype(np.int64)
+
+
+def _innings_outs(batch: GameLogBatch) -> np.ndarray:
+    """Game ids of pitchers whose outs disagree with their innings pitched"""
+    innings = batch.column("innings_pitched")
+    # "6.1" innings is six full innings and one out
+    innings = np.where(innings == None, np.nan, innings).astype(float)  # noqa: E711
+    whole = np.floor(innings)
+    expected = whole * 3 + np.rint((innings - whole) * 10)
+
+    wrong = ~np.isnan(innings) & (expected != batch.column("outs"))
+    return batch.column("game_id")[wrong]
+
+
+def reconcile(
+    games_data: List[dict[str, Any]], batches: Iterable[GameLogBatch]
+) -> dict[int, List[str]]:
+    """
+    Check game log batches against the linescores of the games they came from.
+
+    Returns:
+        Failed checks per game_id, empty when everything agrees
+    """
+    keys, totals = linescore_totals(games_data)
+    failures: dict[int, List[str]] = defaultdict(list)
+
+    for batch in batches:
+        name = batch.model.__name__
+
+        for column, total, opponent in SIDE_CHECKS.get(name, ()):
+            sums = _sum_by_side(batch, column, keys, opponent)
+
+            for i in np.flatnonzero(sums != totals[total]):
+                side = "home" if keys[i] % 2 else "away"
+                failures[int(keys[i] // 2)].append(
+                    f"{name}.{column} sums to {sums[i]}, "
+                    f"{side} linescore {total} is {totals[total][i]}"
+                )
+
+        if name == "PitcherGameLog":
+            for game_id in np.unique(_innings_outs(batch)):
+                failures[int(game_id)].append(
+                    f"{name}.outs disagree with innings_pitched"
+                )
+
+    return dict(failures)
+
+
+def flag_mismatches(
+    games_data: List[dict[str, Any]], batches: Iterable[GameLogBatch]
+) -> int:
+    """
+    Record games whose logs disagree with their linescore for refetching.
+
+    Their rows are still ingested; the retry overwrites them.
+
+    Returns:
+        Number of games flagged
+    """
+    failures = reconcile(games_data, batches)
+    if not failures:
+        return 0
+
+    dates = {
+        game_data["game_id"]: game_data.get("datetime", {}).get("officialDate")
+        for game_data in games_data
+    }
+    for game_id, checks in failures.items():
+        record(
+            "games",
+            game_id,
+            "reconcile",
+            ReconciliationError("; ".join(checks)),
+            game_date=dates.get(game_id),
+        )
+
+    logging.warning(f"{len(failures)} of {len(dates)} games failed reconciliation")
+    return len(failures)
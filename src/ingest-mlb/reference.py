@@ -0,0 +1,183 @@
+"""
+Process-wide cache of Stats API reference data: teams, venues and players.
+
+Records are kept per (kind, season) and reused until their TTL runs out. With a
+root directory, each entry is also snapshotted to
+
+    {root}/{kind}/{season}.json
+
+so a fresh process starts from disk instead of the API. An expired entry is
+revalidated with a conditional request carrying the ETag and Last-Modified the
+API last sent; a 304, or a 200 whose body is unchanged, only extends it.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List
+
+import httpx
+
+# Seconds an entry is used without revalidating; rosters change within a day,
+# teams and venues at most between seasons
+REFERENCE_TTLS = {
+    "teams": 24 * 3600.0,
+    "venues": 24 * 3600.0,
+    "players": 6 * 3600.0,
+}
+DEFAULT_TTL = 3600.0
+
+Fetch = Callable[[dict[str, str]], Awaitable[httpx.Response]]
+Extract = Callable[[httpx.Response], List[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class ReferenceEntry:
+    records: List[dict[str, Any]]
+    digest: str
+    # Wall-clock time, so snapshots stay comparable across processes
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _digest(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class ReferenceCache:
+    """
+    Args:
+        root: Directory for on-disk snapshots; None keeps entries in memory only
+        ttls: Seconds entries of each kind stay fresh, REFERENCE_TTLS by default
+    """
+
+    def __init__(
+        self, root: str | Path | None = None, ttls: dict[str, float] | None = None
+    ) -> None:
+        self.root = Path(root) if root else None
+        self.ttls = ttls if ttls is not None else REFERENCE_TTLS
+        self.hits = 0
+        self.revalidations = 0
+        self.refreshes = 0
+        self._entries: dict[tuple[str, int], ReferenceEntry] = {}
+        self._loading: dict[tuple[str, int], asyncio.Future] = {}
+
+    @classmethod
+    def from_env(cls) -> "ReferenceCache":
+        """Cache snapshotted to MLB_REFERENCE_DIR, or memory-only if it is unset"""
+        return cls(os.getenv("MLB_REFERENCE_DIR"))
+
+    def _path(self, kind: str, season: int) -> Path:
+        return self.root / kind / f"{season}.json"
+
+    def _read_snapshot(self, kind: str, season: int) -> ReferenceEntry | None:
+        if self.root is None:
+            return None
+        try:
+            return ReferenceEntry(**json.loads(self._path(kind, season).read_text()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as error:
+            # A damaged snapshot is refetched and overwritten
+            logging.warning(f"Ignoring reference snapshot {kind}/{season}: {error}")
+            return None
+
+    def _write_snapshot(self, kind: str, season: int, entry: ReferenceEntry) -> None:
+        if self.root is None:
+            return
+        path = self._path(kind, season)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_suffix(".tmp")
+        staging.write_text(json.dumps(asdict(entry)))
+        os.replace(staging, path)
+
+    def entry(self, kind: str, season: int) -> ReferenceEntry | None:
+        """Entry in memory or on disk, fresh or not"""
+        key = (kind, season)
+        if key not in self._entries:
+            entry = self._read_snapshot(kind, season)
+            if entry is not None:
+                self._entries[key] = entry
+        return self._entries.get(key)
+
+    async def get(
+        self, kind: str, season: int, fetch: Fetch, extract: Extract
+    ) -> List[dict[str, Any]]:
+        """
+        Records of a kind for a season, fetched only when missing or expired.
+
+        Args:
+            fetch: Sends the request with the given conditional headers
+            extract: Records from a 200 response
+        """
+        key = (kind, season)
+        entry = self.entry(kind, season)
+        if entry is not None and entry.fresh(self.ttls.get(kind, DEFAULT_TTL)):
+            self.hits += 1
+            return entry.records
+
+        # Concurrent callers share one request
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._refresh(kind, season, entry, fetch, extract)
+            )
+            self._loading[key] = task
+            task.add_done_callback(lambda _: self._loading.pop(key, None))
+        return (await asyncio.shield(task)).records
+
+    async def _refresh(
+        self,
+        kind: str,
+        season: int,
+        entry: ReferenceEntry | None,
+        fetch: Fetch,
+        extract: Extract,
+    ) -> ReferenceEntry:
+        response = await fetch(entry.validators() if entry is not None else {})
+        now = time.time()
+
+        if entry is not None and response.status_code == 304:
+            self.revalidations += 1
+            entry = replace(entry, fetched_at=now)
+        else:
+            response.raise_for_status()
+            digest = _digest(response.content)
+            validators = {
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            }
+
+            if entry is not None and entry.digest == digest:
+                # Servers without validators still save the re-extraction
+                self.revalidations += 1
+                entry = replace(entry, fetched_at=now, **validators)
+            else:
+                self.refreshes += 1
+                entry = ReferenceEntry(extract(response), digest, now, **validators)
+
+        self._entries[(kind, season)] = entry
+        self._write_snapshot(kind, season, entry)
+        return entry
+
+    def clear(self) -> None:
+        """Forget entries in memory; snapshots on disk are kept"""
+        self._entries.clear()
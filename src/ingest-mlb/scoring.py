@@ -0,0 +1,184 @@
+"""
+Daily Beat the Streak scoring of every batter against the day's probable starters.
+
+All stale matchups are scored in one vectorized model call. Results are cached
+per game under the version of everything that went into them, so when a lineup
+or probable pitcher changes only that game is re-scored.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Hashable, Iterable, Protocol
+
+import numpy as np
+import pandas as pd
+
+from features import FeatureEngine
+
+# League-wide hits per plate appearance, the neutral point for opponent and park
+LEAGUE_HITS_PER_PA = 0.225
+
+# Columns of a game's schedule row that invalidate its scores when they change
+SCHEDULE_KEY_COLUMNS = [
+    "venue_id",
+    "home_team_id",
+    "away_team_id",
+    "home_probable_pitcher_id",
+    "away_probable_pitcher_id",
+]
+
+
+class ScoringModel(Protocol):
+    """
+    Anything that maps a frame of matchup features (see
+    FeatureEngine.matchups) to a hit probability per row. version must change
+    whenever the model's output can, e.g. on retraining.
+    """
+
+    version: str
+
+    def predict(self, matchups: pd.DataFrame) -> np.ndarray: ...
+
+
+class BaselineModel:
+    """
+    The batter's recent share of games with a hit, scaled by how hittable the
+    opposing starter and the park have been relative to the league.
+    """
+
+    def __init__(self, window: int = 15) -> None:
+        self.window = window
+        self.version = f"baseline-{window}"
+
+    def predict(self, matchups: pd.DataFrame) -> np.ndarray:
+        hit_rate = matchups[f"hit_rate_{self.window}"].to_numpy(dtype=float)
+        opponent = matchups[f"opp_hits_per_batter_{self.window}"].to_numpy(dtype=float)
+        venue = matchups["venue_hits_per_pa"].to_numpy(dtype=float)
+
+        # Unknown starters and parks are treated as league average
+        factors = np.nan_to_num(opponent / LEAGUE_HITS_PER_PA, nan=1.0) * (
+            np.nan_to_num(venue / LEAGUE_HITS_PER_PA, nan=1.0)
+        )
+        return np.clip(hit_rate * factors, 0.0, 1.0)
+
+
+class ScoringEngine:
+    def __init__(self, features: FeatureEngine, model: ScoringModel | None = None):
+        self.features = features
+        self.model = model or BaselineModel()
+        self._scores: dict[int, tuple[Hashable, pd.DataFrame]] = {}
+
+    def _input_versions(
+        self, schedule: pd.DataFrame, lineups: dict[int, Iterable[int]]
+    ) -> dict[int, Hashable]:
+        rows = schedule[["game_id", *SCHEDULE_KEY_COLUMNS]].astype(object)
+        rows = rows.where(rows.notna(), None)
+        return {
+            game_id: (
+                self.model.version,
+                self.features.version,
+                tuple(values),
+                tuple(sorted(lineups.get(game_id, ()))),
+            )
+            for game_id, *values in rows.itertuples(index=False)
+        }
+
+    def score(
+        self,
+        schedule: pd.DataFrame,
+        lineups: dict[int, Iterable[int]] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Hit probabilities for every batter in a slate, best first.
+
+        Args:
+            schedule: The day's games (see features.schedule_frame)
+            lineups: Announced batting orders by game id; games without one
+                     score every batter on the two rosters' recent logs
+
+        Returns:
+            One row per (game, batter) with its features and hit_probability
+        """
+        lineups = lineups or {}
+        versions = self._input_versions(schedule, lineups)
+        stale = [
+            game_id
+            for game_id, version in versions.items()
+            if self._scores.get(game_id, (None,))[0] != version
+        ]
+
+        if stale:
+            matchups = self.features.matchups(schedule[schedule["game_id"].isin(stale)])
+
+            if lineups:
+                announced = pd.DataFrame(
+                    [
+                        (game_id, player_id)
+                        for game_id, players in lineups.items()
+                        for player_id in players
+                    ],
+                    columns=["game_id", "player_id"],
+                ).assign(in_lineup=True)
+                matchups = matchups.merge(
+                    announced, on=["game_id", "player_id"], how="left"
+                )
+                keep = (
+                    matchups["in_lineup"].notna().to_numpy()
+                    | ~matchups["game_id"].isin(list(lineups)).to_numpy()
+                )
+                matchups = matchups[keep].drop(columns="in_lineup")
+
+            matchups = matchups.assign(
+                hit_probability=self.model.predict(matchups) if len(matchups) else []
+            )
+            by_game = dict(tuple(matchups.groupby("game_id", sort=False)))
+            for game_id in stale:
+                self._scores[game_id] = (
+                    versions[game_id],
+                    by_game.get(game_id, matchups.iloc[:0]),
+                )
+
+        # Only the current slate is kept
+        self._scores = {game_id: self._scores[game_id] for game_id in versions}
+
+        if not self._scores:
+            # An empty slate still has every column callers read
+            return self.features.matchups(schedule.iloc[:0]).assign(
+                hit_probability=np.zeros(0)
+            )
+
+        return (
+            pd.concat([frame for _, frame in self._scores.values()], ignore_index=True)
+            .sort_values("hit_probability", ascending=False, kind="stable")
+            .reset_index(drop=True)
+        )
+
+
+def score_rows(scores: pd.DataFrame, model_version: str) -> list[dict[str, Any]]:
+    """Scored matchups as rows for the bts_scores table"""
+    scored_at = datetime.now(timezone.utc)
+    frame = scores[
+        [
+            "game_id",
+            "player_id",
+            "game_date",
+            "team_id",
+            "opposing_pitcher_id",
+            "hit_probability",
+        ]
+    ]
+    # Unannounced starters are NaN, which would otherwise make the ids floats
+    frame = frame.assign(
+        opposing_pitcher_id=frame["opposing_pitcher_id"].astype("Int64")
+    ).astype(object)
+    frame = frame.where(frame.notna(), None)
+
+    return [
+        {
+            **row,
+            "season": row["game_date"].year,
+            "game_date": row["game_date"].date(),
+            "model_version": model_version,
+            "scored_at": scored_at,
+        }
+        for row in frame.to_dict("records")
+    ]